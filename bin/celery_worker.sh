@@ -4,11 +4,16 @@ set -e
 
 LOGLEVEL=${CELERY_LOGLEVEL:-INFO}
 CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-1}
+# prefork (processes) enforces the task time limits, the threads and gevent pools
+# don't - see docs/installation/celery.rst
+POOL=${CELERY_WORKER_POOL:-prefork}
 
-QUEUE=${1:-${CELERY_WORKER_QUEUE:=celery}}
+# by default, consume all queues - see CELERY_TASK_ROUTES and the
+# celery_worker_<queue>.sh scripts to run dedicated workers per queue
+QUEUE=${1:-${CELERY_WORKER_QUEUE:=celery,pdf,registration,appointments,email,maintenance}}
 WORKER_NAME=${2:-${CELERY_WORKER_NAME:="${QUEUE}"@%n}}
 
-echo "Starting celery worker $WORKER_NAME with queue $QUEUE"
+echo "Starting celery worker $WORKER_NAME with queue $QUEUE ($POOL pool, concurrency $CONCURRENCY)"
 exec celery worker \
     --app openforms \
     -Q $QUEUE \
@@ -16,4 +21,5 @@ exec celery worker \
     -l $LOGLEVEL \
     --workdir src \
     -O fair \
+    -P $POOL \
     -c $CONCURRENCY
@@ -0,0 +1,11 @@
+#!/bin/bash
+#
+# I/O-bound tasks (appointment backends): more processes than cores. The prefork pool
+# enforces the task time limits, the threads pool does not.
+
+set -e
+
+export CELERY_WORKER_POOL=${CELERY_WORKER_POOL:-prefork}
+export CELERY_WORKER_CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-8}
+
+exec "$(dirname "$0")/celery_worker.sh" appointments "${CELERY_WORKER_NAME:-appointments@%n}"
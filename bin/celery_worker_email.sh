@@ -0,0 +1,11 @@
+#!/bin/bash
+#
+# E-mail dispatch: only one dispatch runs at a time, a few processes suffice. The
+# prefork pool enforces the task time limits, the threads pool does not.
+
+set -e
+
+export CELERY_WORKER_POOL=${CELERY_WORKER_POOL:-prefork}
+export CELERY_WORKER_CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-2}
+
+exec "$(dirname "$0")/celery_worker.sh" email "${CELERY_WORKER_NAME:-email@%n}"
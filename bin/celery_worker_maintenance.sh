@@ -0,0 +1,11 @@
+#!/bin/bash
+#
+# Periodic cleanups and background imports: low priority, one process.
+
+set -e
+
+export CELERY_WORKER_POOL=${CELERY_WORKER_POOL:-prefork}
+export CELERY_WORKER_CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-1}
+
+# also process tasks without a route (default queue)
+exec "$(dirname "$0")/celery_worker.sh" maintenance,celery "${CELERY_WORKER_NAME:-maintenance@%n}"
@@ -0,0 +1,10 @@
+#!/bin/bash
+#
+# CPU-bound tasks (PDF generation, image resizing): one process per CPU core.
+
+set -e
+
+export CELERY_WORKER_POOL=${CELERY_WORKER_POOL:-prefork}
+export CELERY_WORKER_CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-$(nproc)}
+
+exec "$(dirname "$0")/celery_worker.sh" pdf "${CELERY_WORKER_NAME:-pdf@%n}"
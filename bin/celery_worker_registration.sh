@@ -0,0 +1,12 @@
+#!/bin/bash
+#
+# I/O-bound tasks (registration backends, ZGW/StUF calls): more processes than cores.
+# The prefork pool enforces the task time limits, which the crash detection of
+# registration attempts relies on - the threads pool does not.
+
+set -e
+
+export CELERY_WORKER_POOL=${CELERY_WORKER_POOL:-prefork}
+export CELERY_WORKER_CONCURRENCY=${CELERY_WORKER_CONCURRENCY:-8}
+
+exec "$(dirname "$0")/celery_worker.sh" registration "${CELERY_WORKER_NAME:-registration@%n}"
@@ -11,7 +11,7 @@ fixtures_dir=${FIXTURES_DIR:-/app/fixtures}
 
 uwsgi_port=${UWSGI_PORT:-8000}
 uwsgi_processes=${UWSGI_PROCESSES:-4}
-uwsgi_threads=${UWSGI_THREADS:-1}
+uwsgi_threads=${UWSGI_THREADS:-8}
 
 until pg_isready; do
   >&2 echo "Waiting for database connection..."
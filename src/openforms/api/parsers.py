@@ -0,0 +1,29 @@
+from django.conf import settings
+
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework.exceptions import ParseError
+
+from .renderers import json_loads
+
+
+class OpaqueFieldsCamelCaseJSONParser(CamelCaseJSONParser):
+    """
+    Underscoreize the request data, except for the (opaque) ``opaque_fields``.
+
+    The body is parsed with the fast JSON library if it's available.
+    """
+
+    opaque_fields = ()
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            raw = stream.read()
+            if encoding.lower() not in ("utf-8", "utf8"):
+                raw = raw.decode(encoding)
+            return underscoreize(json_loads(raw), ignore_fields=self.opaque_fields)
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
@@ -0,0 +1,128 @@
+"""
+JSON rendering with a fast path for opaque (Form.io) blobs.
+
+Fields like ``FormDefinition.configuration`` and ``SubmissionStep.data`` are opaque
+JSON documents - they are not camelized (see #449) and they can be large. The
+renderers in this module don't walk into these fields. Instead, every opaque value is
+encoded on its own (or taken from a pre-encoded cache, see :class:`PreEncodedJSON`)
+and spliced into the encoded response body.
+
+`orjson <https://github.com/ijl/orjson>`_ is used for the encoding. It's part of the
+base requirements - if it's not available, the encoding falls back to the standard
+library.
+"""
+import json
+import uuid
+from typing import Any, Dict, Optional
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from djangorestframework_camel_case.util import camelize
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class PreEncodedJSON(dict):
+    """
+    A JSON object with its (cached) encoded representation.
+
+    It behaves like a regular dict for all Python code (e.g. ``response.data`` in
+    tests), but the renderers emit the :attr:`encoded` bytes as-is.
+
+    .. warning:: Mutating the dict does not update the encoded bytes - always
+       create a new (plain) dict if you need to alter the content.
+    """
+
+    def __init__(self, value: dict, encoded: bytes):
+        super().__init__(value)
+        self.encoded = encoded
+
+
+def json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=JSONEncoder().default)
+    return json.dumps(
+        value, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_loads(value: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def encode_opaque(value: Any) -> bytes:
+    if isinstance(value, PreEncodedJSON):
+        return value.encoded
+    return json_dumps(value)
+
+
+def render_with_opaque_fields(data: Any, opaque_fields: tuple) -> bytes:
+    """
+    Camelize and encode ``data``, without walking the opaque fields.
+
+    The opaque values are replaced with unique placeholders, the resulting skeleton is
+    encoded and finally the placeholders are substituted with the encoded opaque values.
+    """
+    marker = f"\x00opaque-{uuid.uuid4().hex}-"
+    blobs: Dict[str, bytes] = {}
+
+    def replace_opaque(node: Any) -> Any:
+        if isinstance(node, dict):
+            result = {}
+            for key, value in node.items():
+                if key in opaque_fields and value is not None:
+                    placeholder = f"{marker}{len(blobs)}"
+                    blobs[placeholder] = encode_opaque(value)
+                    result[key] = placeholder
+                else:
+                    result[key] = replace_opaque(value)
+            return result
+        if isinstance(node, list):
+            return [replace_opaque(item) for item in node]
+        return node
+
+    skeleton = replace_opaque(camelize(data, ignore_fields=opaque_fields))
+    encoded = json_dumps(skeleton)
+    if not blobs:
+        return encoded
+
+    for placeholder, blob in blobs.items():
+        # placeholders are encoded as JSON strings, including the quotes
+        encoded = encoded.replace(json_dumps(placeholder), blob, 1)
+    return encoded
+
+
+class OpaqueFieldsCamelCaseJSONRenderer(CamelCaseJSONRenderer):
+    """
+    Camelize the response data, except for the (opaque) ``opaque_fields``.
+    """
+
+    opaque_fields = ()
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[dict] = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        # the response is an opaque document as a whole
+        if isinstance(data, PreEncodedJSON):
+            return data.encoded
+
+        renderer_context = renderer_context or {}
+        # pretty-printing is for humans, use the regular (slow) path
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super(CamelCaseJSONRenderer, self).render(
+                camelize(data, ignore_fields=self.opaque_fields),
+                accepted_media_type,
+                renderer_context,
+            )
+
+        return render_with_opaque_fields(data, self.opaque_fields)
@@ -0,0 +1,71 @@
+import io
+import json
+
+from django.test import SimpleTestCase
+
+from ..parsers import OpaqueFieldsCamelCaseJSONParser
+from ..renderers import OpaqueFieldsCamelCaseJSONRenderer, PreEncodedJSON
+
+
+class Renderer(OpaqueFieldsCamelCaseJSONRenderer):
+    opaque_fields = ("configuration", "data")
+
+
+class Parser(OpaqueFieldsCamelCaseJSONParser):
+    opaque_fields = ("data",)
+
+
+class OpaqueFieldsRendererTests(SimpleTestCase):
+    def test_opaque_fields_are_not_camelized(self):
+        data = {
+            "some_field": "value",
+            "configuration": {"components": [{"key": "a", "default_value": 1}]},
+            "nested": [{"data": {"first_name": "John"}, "other_field": None}],
+        }
+
+        rendered = Renderer().render(data)
+
+        self.assertEqual(
+            json.loads(rendered),
+            {
+                "someField": "value",
+                "configuration": {"components": [{"key": "a", "default_value": 1}]},
+                "nested": [{"data": {"first_name": "John"}, "otherField": None}],
+            },
+        )
+
+    def test_pre_encoded_values_are_spliced(self):
+        configuration = PreEncodedJSON(
+            {"components": []}, encoded=b'{"components":["pre-encoded"]}'
+        )
+
+        rendered = Renderer().render({"configuration": configuration, "data": None})
+
+        self.assertEqual(
+            rendered, b'{"configuration":{"components":["pre-encoded"]},"data":null}'
+        )
+
+    def test_pre_encoded_response(self):
+        configuration = PreEncodedJSON({"components": []}, encoded=b'{"components":[]}')
+
+        rendered = Renderer().render(configuration)
+
+        self.assertEqual(rendered, b'{"components":[]}')
+
+    def test_indented_output(self):
+        data = {"some_field": {"nested_field": 1}, "data": {"first_name": "John"}}
+
+        rendered = Renderer().render(data, "application/json; indent=2")
+
+        self.assertEqual(
+            json.loads(rendered),
+            {"someField": {"nestedField": 1}, "data": {"first_name": "John"}},
+        )
+        self.assertIn(b"\n  ", rendered)
+
+    def test_parse_opaque_fields(self):
+        body = b'{"someField": 1, "data": {"firstName": "John"}}'
+
+        parsed = Parser().parse(io.BytesIO(body))
+
+        self.assertEqual(parsed, {"some_field": 1, "data": {"firstName": "John"}})
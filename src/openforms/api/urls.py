@@ -13,6 +13,7 @@ from openforms.forms.api.viewsets import (
     FormDefinitionViewSet,
     FormLogicViewSet,
     FormsImportAPIView,
+    FormsImportStatusAPIView,
     FormStepViewSet,
     FormVersionViewSet,
     FormViewSet,
@@ -73,6 +74,11 @@ urlpatterns = [
                 path("submissions/", include("openforms.submissions.api.urls")),
                 path("config/", include("openforms.config.api.urls")),
                 path("forms-import", FormsImportAPIView.as_view(), name="forms-import"),
+                path(
+                    "forms-import/<uuid:task_id>/status",
+                    FormsImportStatusAPIView.as_view(),
+                    name="forms-import-status",
+                ),
                 path("prefill/", include("openforms.prefill.api.urls")),
                 path("validation/", include("openforms.validations.api.urls")),
                 path("location/", include("openforms.locations.api.urls")),
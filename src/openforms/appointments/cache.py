@@ -0,0 +1,297 @@
+"""
+Stale-while-revalidate cache for the appointment plugin interface.
+
+Product and location lists barely change and slot availability may be slightly stale
+for display purposes (the backend validates the slot again when booking), so we cache
+the read methods of the appointment plugins with a per-method timeout.
+
+Every cache entry has a "fresh until" timestamp. Fresh entries are served directly.
+Expired entries are kept around for ``settings.APPOINTMENTS_CACHE_STALE_TIMEOUT``
+seconds longer - they are still served, but a background refresh is scheduled. Keys
+that are frequently requested are refreshed proactively by the
+``refresh_hot_appointment_cache_keys`` periodic task just before they expire, so most
+visitors never hit the backend at all.
+
+With a Redis cache, the hot keys are registered in a hash, so concurrent registrations
+and removals don't overwrite each other.
+"""
+import hashlib
+import json
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from openforms.utils.redis import get_redis_connection
+
+from .base import AppointmentClient, AppointmentLocation, AppointmentProduct
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "appointments"
+HOT_KEYS_REGISTRY_KEY = f"{CACHE_KEY_PREFIX}:hot-keys"
+# period (in seconds) in which a key must have been requested to be considered "hot"
+HOT_KEY_WINDOW = 5 * 60
+# how long a scheduled refresh blocks other refreshes of the same key
+REFRESH_LOCK_TIMEOUT = 30
+
+# the cache entries are keyed by plugin method, these map to the timeouts
+PRODUCTS = "products"
+LOCATIONS = "locations"
+DATES = "dates"
+TIMES = "times"
+
+
+def get_cache():
+    return caches[settings.APPOINTMENTS_CACHE]
+
+
+def _register_hot_key(key: str, method: str, call_args: list) -> None:
+    cache = get_cache()
+    if (connection := get_redis_connection(settings.APPOINTMENTS_CACHE)) is None:
+        # note: possible race condition with concurrent registrations
+        registry = cache.get(HOT_KEYS_REGISTRY_KEY) or {}
+        if key not in registry:
+            registry[key] = (method, call_args)
+            cache.set(HOT_KEYS_REGISTRY_KEY, registry, timeout=None)
+        return
+
+    connection.hsetnx(
+        cache.make_key(HOT_KEYS_REGISTRY_KEY), key, json.dumps([method, call_args])
+    )
+
+
+def _get_hot_keys() -> Dict[str, Tuple[str, list]]:
+    cache = get_cache()
+    if (connection := get_redis_connection(settings.APPOINTMENTS_CACHE)) is None:
+        return cache.get(HOT_KEYS_REGISTRY_KEY) or {}
+
+    registry = connection.hgetall(cache.make_key(HOT_KEYS_REGISTRY_KEY))
+    return {key.decode(): tuple(json.loads(call)) for key, call in registry.items()}
+
+
+def _unregister_hot_keys(keys: List[str]) -> None:
+    if not keys:
+        return
+    cache = get_cache()
+    if (connection := get_redis_connection(settings.APPOINTMENTS_CACHE)) is None:
+        registry = cache.get(HOT_KEYS_REGISTRY_KEY) or {}
+        for key in keys:
+            registry.pop(key, None)
+        cache.set(HOT_KEYS_REGISTRY_KEY, registry, timeout=None)
+        return
+
+    connection.hdel(cache.make_key(HOT_KEYS_REGISTRY_KEY), *keys)
+
+
+def _serialize_call(method: str, *args) -> Tuple[str, list]:
+    """
+    Reduce the call arguments to JSON-serializable primitives.
+
+    The primitives are used both for the cache key and to replay the call from a
+    celery task.
+    """
+    call_args = []
+    for arg in args:
+        if arg is None:
+            call_args.append(None)
+        elif isinstance(arg, list):
+            call_args.append(sorted(item.identifier for item in arg))
+        elif isinstance(arg, AppointmentLocation):
+            call_args.append(arg.identifier)
+        elif isinstance(arg, date):
+            call_args.append(arg.isoformat())
+        else:
+            raise TypeError(f"Unexpected argument type {type(arg)!r}")
+
+    raw = "|".join(repr(arg) for arg in call_args)
+    digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{method}:{digest}", call_args
+
+
+def _deserialize_call(method: str, call_args: list) -> list:
+    if method == PRODUCTS:
+        (product_ids,) = call_args
+        products = (
+            [AppointmentProduct(identifier=pid, name="") for pid in product_ids]
+            if product_ids is not None
+            else None
+        )
+        return [products]
+
+    products = [AppointmentProduct(identifier=pid, name="") for pid in call_args[0]]
+    if method == LOCATIONS:
+        return [products]
+
+    location = AppointmentLocation(identifier=call_args[1], name="")
+    dates = [date.fromisoformat(value) if value else None for value in call_args[2:]]
+    return [products, location, *dates]
+
+
+def _call_plugin(plugin, method: str, args: list):
+    if method == PRODUCTS:
+        return plugin.get_available_products(*args)
+    elif method == LOCATIONS:
+        return plugin.get_locations(*args)
+    elif method == DATES:
+        return plugin.get_dates(*args)
+    elif method == TIMES:
+        return plugin.get_times(*args)
+    raise ValueError(f"Unknown cached method '{method}'")
+
+
+def store(key: str, method: str, call_args: list, value: Any) -> None:
+    """
+    Store a fresh value in the cache and register the key for proactive refreshes.
+    """
+    cache = get_cache()
+    timeout = settings.APPOINTMENTS_CACHE_TIMEOUTS[method]
+    entry = {"value": value, "fresh_until": time.time() + timeout}
+    cache.set(key, entry, timeout=timeout + settings.APPOINTMENTS_CACHE_STALE_TIMEOUT)
+
+    # keep track of the call so that the beat task can replay it
+    _register_hot_key(key, method, call_args)
+
+
+def refresh(plugin, key: str, method: str, call_args: list) -> Any:
+    value = _call_plugin(plugin, method, _deserialize_call(method, call_args))
+    # don't overwrite a possibly good stale entry with the result of a failed call -
+    # plugins return empty lists when the backend can't be reached
+    if value:
+        store(key, method, call_args, value)
+    return value
+
+
+def invalidate(method: str, *args) -> None:
+    key, _ = _serialize_call(method, *args)
+    get_cache().delete(key)
+
+
+class CachedPlugin:
+    """
+    Wrap an appointment plugin and cache its (read-only) availability methods.
+
+    All other attributes are looked up on the wrapped plugin.
+    """
+
+    def __init__(self, plugin):
+        self._plugin = plugin
+
+    def __getattr__(self, name):
+        return getattr(self._plugin, name)
+
+    def __repr__(self):
+        return f"<CachedPlugin: {self._plugin!r}>"
+
+    def _get(self, method: str, *args):
+        cache = get_cache()
+        key, call_args = _serialize_call(method, *args)
+        # mark the key as recently used, so that it's proactively refreshed
+        cache.add(f"{key}:hit", True, timeout=HOT_KEY_WINDOW)
+
+        entry = cache.get(key)
+        if entry is None:
+            return refresh(self._plugin, key, method, call_args)
+
+        if entry["fresh_until"] < time.time():
+            self._schedule_refresh(key, method, call_args)
+        return entry["value"]
+
+    def _schedule_refresh(self, key: str, method: str, call_args: list) -> None:
+        from .tasks import refresh_appointment_cache_key
+
+        # only one refresh for a given key at a time
+        if not get_cache().add(f"{key}:lock", True, timeout=REFRESH_LOCK_TIMEOUT):
+            return
+        logger.debug("Scheduling refresh of stale appointment cache key %s", key)
+        refresh_appointment_cache_key.delay(key, method, call_args)
+
+    def get_available_products(
+        self, current_products: Optional[List[AppointmentProduct]] = None
+    ) -> List[AppointmentProduct]:
+        return self._get(PRODUCTS, current_products or None)
+
+    def get_locations(
+        self, products: List[AppointmentProduct]
+    ) -> List[AppointmentLocation]:
+        return self._get(LOCATIONS, products)
+
+    def get_dates(
+        self,
+        products: List[AppointmentProduct],
+        location: AppointmentLocation,
+        start_at: Optional[date] = None,
+        end_at: Optional[date] = None,
+    ) -> List[date]:
+        return self._get(DATES, products, location, start_at, end_at)
+
+    def get_times(
+        self,
+        products: List[AppointmentProduct],
+        location: AppointmentLocation,
+        day: date,
+    ) -> List[datetime]:
+        return self._get(TIMES, products, location, day)
+
+    def get_calendar(
+        self,
+        products: List[AppointmentProduct],
+        location: AppointmentLocation,
+        start_at: Optional[date] = None,
+        end_at: Optional[date] = None,
+    ) -> Dict[date, List[datetime]]:
+        days = self.get_dates(products, location, start_at, end_at)
+        return {day: self.get_times(products, location, day) for day in days}
+
+    def create_appointment(
+        self,
+        products: List[AppointmentProduct],
+        location: AppointmentLocation,
+        start_at: datetime,
+        client: AppointmentClient,
+        remarks: str = None,
+    ) -> str:
+        appointment_id = self._plugin.create_appointment(
+            products, location, start_at, client, remarks
+        )
+        # the booked slot is no longer available - make sure the next visitor gets
+        # fresh data for that day
+        invalidate(TIMES, products, location, start_at.date())
+        invalidate(DATES, products, location, None, None)
+        return appointment_id
+
+
+def refresh_hot_keys(plugin) -> int:
+    """
+    Refresh the recently requested cache keys that expire before the next run.
+
+    Keys that have not been requested in the last ``HOT_KEY_WINDOW`` seconds are
+    dropped from the registry, they will be re-added on the next cache miss.
+    """
+    registry = _get_hot_keys()
+    if not registry:
+        return 0
+
+    cache = get_cache()
+    entries = cache.get_many([*registry, *(f"{key}:hit" for key in registry)])
+    refresh_before = time.time() + settings.BEAT_REFRESH_APPOINTMENTS_CACHE_INTERVAL
+    refreshed, cold = 0, []
+    for key, (method, call_args) in registry.items():
+        if f"{key}:hit" not in entries:
+            cold.append(key)
+            continue
+        # still fresh at the next run
+        if key in entries and entries[key]["fresh_until"] > refresh_before:
+            continue
+        try:
+            refresh(plugin, key, method, call_args)
+        except Exception:
+            logger.exception("Could not refresh appointment cache key %s", key)
+            continue
+        refreshed += 1
+
+    _unregister_hot_keys(cold)
+    return refreshed
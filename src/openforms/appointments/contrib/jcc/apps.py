@@ -7,4 +7,4 @@ class JccPlugin(AppConfig):
     verbose_name = _("JCC appointment plugin")
 
     def ready(self):
-        from . import plugin  # noqa
+        from . import plugin, signals  # noqa
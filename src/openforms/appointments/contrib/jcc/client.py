@@ -0,0 +1,103 @@
+"""
+Process-level registry of parsed zeep clients.
+
+Instantiating a :class:`zeep.Client` downloads and parses the WSDL and all referenced
+XSDs, which easily takes hundreds of milliseconds. The parsed clients are kept around
+for the lifetime of the process and only rebuilt when the configuration changes.
+
+Configuration changes bump a version stamp in the shared cache. The clients are keyed
+on the WSDL and the version, so every process rebuilds its clients after a change.
+
+The WSDL/XSD documents are additionally cached on disk, so that new processes (e.g.
+after a deploy or worker restart) don't need to download them again.
+"""
+import logging
+import os
+import threading
+from typing import Dict, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from requests.adapters import HTTPAdapter
+from zeep import Client
+from zeep.cache import SqliteCache
+from zeep.transports import Transport
+
+from openforms.utils.redis import bump_version as bump_cache_version
+from openforms.utils.resilience import ResilientSession
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_KEY = "jcc:zeep-clients-version"
+
+_clients: Dict[Tuple[str, int], Client] = {}
+_lock = threading.Lock()
+
+
+def get_version() -> int:
+    return caches["default"].get(VERSION_CACHE_KEY, 0)
+
+
+def bump_version() -> None:
+    """
+    Invalidate the zeep clients of all processes.
+    """
+    bump_cache_version("default", VERSION_CACHE_KEY)
+    clear_clients()
+
+
+def get_transport() -> Transport:
+    session = ResilientSession()
+    adapter = HTTPAdapter(
+        pool_connections=settings.JCC_POOL_CONNECTIONS,
+        pool_maxsize=settings.JCC_POOL_MAXSIZE,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    cache_path = settings.ZEEP_CACHE_PATH
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    cache = SqliteCache(path=cache_path, timeout=settings.ZEEP_CACHE_TIMEOUT)
+
+    return Transport(cache=cache, session=session)
+
+
+def get_client(wsdl: str) -> Client:
+    """
+    Return the (shared) zeep client for the given WSDL, building it if needed.
+    """
+    key = (wsdl, get_version())
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        # another thread may have built the client while we were waiting
+        if key not in _clients:
+            logger.debug("Building zeep client for WSDL %s", wsdl)
+            # drop the clients that were built before the configuration changed
+            for outdated in [other for other in _clients if other[0] == wsdl]:
+                del _clients[outdated]
+            _clients[key] = Client(wsdl, transport=get_transport())
+        return _clients[key]
+
+
+def clear_clients() -> None:
+    with _lock:
+        _clients.clear()
+
+
+def warm_up() -> None:
+    """
+    Build the client for the configured JCC service, if any.
+    """
+    from .models import JccConfig
+
+    try:
+        config = JccConfig.get_solo()
+        if config.service and config.service.url:
+            get_client(config.service.url)
+    except Exception:
+        # never prevent a process from starting because the JCC service is down
+        logger.warning("Could not pre-warm the JCC zeep client", exc_info=True)
@@ -3,10 +3,11 @@ from django.utils.translation import gettext_lazy as _
 
 from solo.models import SingletonModel
 
+from openforms.config.snapshot import SnapshotSingletonMixin
 from stuf.managers import ConfigManager
 
 
-class JccConfig(SingletonModel):
+class JccConfig(SnapshotSingletonMixin, SingletonModel):
     """
     Global configuration and defaults
     """
@@ -1,11 +1,12 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from requests.exceptions import RequestException
-from zeep import Client
 from zeep.exceptions import Error as ZeepError
 
 from ...base import (
@@ -15,15 +16,22 @@ from ...base import (
     AppointmentProduct,
     BasePlugin,
 )
+from ...cache import CACHE_KEY_PREFIX, get_cache
 from ...exceptions import (
     AppointmentCreateFailed,
     AppointmentDeleteFailed,
     AppointmentException,
 )
 from ...utils import create_base64_qrcode
+from .client import get_client
 
 logger = logging.getLogger(__name__)
 
+# maximum number of concurrent calls to the service for a single operation
+MAX_WORKERS = 4
+
+QRCODE_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # one week
+
 
 def squash_ids(lst):
     return ",".join([i.identifier for i in lst])
@@ -37,7 +45,7 @@ class Plugin(BasePlugin):
     """
 
     def __init__(self, wsdl):
-        self.client = Client(wsdl)
+        self.client = get_client(wsdl)
 
     def get_available_products(
         self, current_products: Optional[List[AppointmentProduct]] = None
@@ -221,36 +229,80 @@ class Plugin(BasePlugin):
         except (ZeepError, RequestException) as e:
             raise AppointmentDeleteFailed(e)
 
+    def _get_location_details(self, location_id: str) -> dict:
+        cache = get_cache()
+        cache_key = f"{CACHE_KEY_PREFIX}:jcc:location:{location_id}"
+        location = cache.get(cache_key)
+        if location is None:
+            result = self.client.service.getGovLocationDetails(locationID=location_id)
+            location = {
+                "name": result.locationDesc,
+                "address": result.address,
+                "postalcode": result.postalcode,  # Documentation says `postalCode`
+                "city": result.city,
+            }
+            cache.set(
+                cache_key, location, settings.APPOINTMENTS_CACHE_TIMEOUTS["details"]
+            )
+        return location
+
+    def _get_product_name(self, product_id: str) -> str:
+        cache = get_cache()
+        cache_key = f"{CACHE_KEY_PREFIX}:jcc:product:{product_id}"
+        name = cache.get(cache_key)
+        if name is None:
+            result = self.client.service.getGovProductDetails(productID=product_id)
+            name = result.description
+            cache.set(cache_key, name, settings.APPOINTMENTS_CACHE_TIMEOUTS["details"])
+        return name
+
+    def _get_qrcode(self, identifier: str) -> Tuple[str, str]:
+        """
+        Return the QR code text and the rendered (base64 encoded) QR code image.
+
+        The QR code of an appointment never changes, so the result is memoised per
+        appointment ID.
+        """
+        cache = get_cache()
+        cache_key = f"{CACHE_KEY_PREFIX}:jcc:qrcode:{identifier}"
+        qrcode = cache.get(cache_key)
+        if qrcode is None:
+            text = self.client.service.GetAppointmentQRCodeText(appID=identifier)
+            qrcode = (text, create_base64_qrcode(text))
+            cache.set(cache_key, qrcode, QRCODE_CACHE_TIMEOUT)
+        return qrcode
+
     def get_appointment_details(self, identifier: str) -> str:
         try:
             # NOTE: The operation `getGovAppointmentExtendedDetails` seems
             # missing. This would include the product descriptions but now we
             # need to make an additional call to get those.
-            details = self.client.service.getGovAppointmentDetails(appID=identifier)
-            location = self.client.service.getGovLocationDetails(
-                locationID=details.locationID
-            )
-            qrcode = self.client.service.GetAppointmentQRCodeText(appID=identifier)
-
-            app_products = []
-            for pid in details.productID.split(","):
-                product = self.client.service.getGovProductDetails(productID=pid)
-
-                app_products.append(
-                    AppointmentProduct(identifier=pid, name=product.description)
+            # The calls are independent of each other (except for the location and
+            # product details, which are usually cached), so they are executed
+            # concurrently.
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                qrcode_future = executor.submit(self._get_qrcode, identifier)
+                details = self.client.service.getGovAppointmentDetails(appID=identifier)
+
+                product_ids = details.productID.split(",")
+                location_future = executor.submit(
+                    self._get_location_details, details.locationID
                 )
+                product_names = executor.map(self._get_product_name, product_ids)
 
-            qrcode_base64 = create_base64_qrcode(qrcode)
+                app_products = [
+                    AppointmentProduct(identifier=pid, name=name)
+                    for pid, name in zip(product_ids, product_names)
+                ]
+                location = location_future.result()
+                qrcode, qrcode_base64 = qrcode_future.result()
 
             result = AppointmentDetails(
                 identifier=identifier,
                 products=app_products,
                 location=AppointmentLocation(
                     identifier=details.locationID,
-                    name=location.locationDesc,
-                    address=location.address,
-                    postalcode=location.postalcode,  # Documentation says `postalCode`
-                    city=location.city,
+                    **location,
                 ),
                 start_at=details.appStartTime,
                 end_at=details.appEndTime,
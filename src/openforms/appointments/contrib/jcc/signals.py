@@ -0,0 +1,28 @@
+import logging
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from celery.signals import worker_process_init
+
+from openforms.appointments.models import AppointmentsConfig
+from stuf.models import SoapService
+
+from .client import bump_version, warm_up
+from .models import JccConfig
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=AppointmentsConfig)
+@receiver(post_save, sender=JccConfig)
+@receiver(post_save, sender=SoapService)
+@receiver(post_delete, sender=SoapService)
+def invalidate_zeep_clients(sender, **kwargs) -> None:
+    logger.debug("Configuration changed, invalidating the JCC zeep clients")
+    bump_version()
+
+
+@worker_process_init.connect
+def warm_up_zeep_client(**kwargs) -> None:
+    warm_up()
@@ -0,0 +1,63 @@
+import os
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from stuf.tests.factories import SoapServiceFactory
+
+from ..client import VERSION_CACHE_KEY, _clients, clear_clients, get_client, warm_up
+from ..models import JccConfig
+from ..plugin import Plugin
+
+WSDL = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "mock/GenericGuidanceSystem2.wsdl")
+)
+
+
+class ClientRegistryTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_clients()
+        self.addCleanup(clear_clients)
+        self.addCleanup(caches["default"].delete, VERSION_CACHE_KEY)
+
+    def test_client_is_built_once(self):
+        plugin1 = Plugin(WSDL)
+        plugin2 = Plugin(WSDL)
+
+        self.assertIs(plugin1.client, plugin2.client)
+        self.assertIs(get_client(WSDL), plugin1.client)
+
+    def test_saving_config_clears_clients(self):
+        get_client(WSDL)
+        self.assertEqual(len(_clients), 1)
+
+        config = JccConfig.get_solo()
+        config.service = SoapServiceFactory.create(url=WSDL)
+        config.save()
+
+        self.assertEqual(_clients, {})
+
+    def test_config_change_in_other_process_rebuilds_client(self):
+        client = get_client(WSDL)
+
+        # another process bumps the shared version
+        caches["default"].set(VERSION_CACHE_KEY, 42, timeout=None)
+
+        self.assertIsNot(get_client(WSDL), client)
+        self.assertEqual(list(_clients), [(WSDL, 42)])
+
+    def test_warm_up_builds_configured_client(self):
+        config = JccConfig.get_solo()
+        config.service = SoapServiceFactory.create(url=WSDL)
+        config.save()
+
+        warm_up()
+
+        self.assertEqual([wsdl for wsdl, _ in _clients], [WSDL])
+
+    def test_warm_up_without_service(self):
+        warm_up()
+
+        self.assertEqual(_clients, {})
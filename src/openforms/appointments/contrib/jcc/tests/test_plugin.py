@@ -1,7 +1,8 @@
 import os
 from datetime import date, datetime
 
-from django.test import TestCase
+from django.core.cache import caches
+from django.test import TestCase, override_settings
 from django.utils.translation import ugettext_lazy as _
 
 import requests_mock
@@ -23,6 +24,30 @@ def mock_response(filename):
         return f.read()
 
 
+def mock_soap_action(m, action: str, filename: str):
+    """
+    Mock a SOAP call by its action - calls may be done concurrently, so the order of
+    requests is not predictable.
+    """
+    return m.post(
+        "http://example.com/soap11",
+        text=mock_response(filename),
+        additional_matcher=lambda request: action
+        in request.headers.get("SOAPAction", ""),
+    )
+
+
+def mock_appointment_details(m):
+    mock_soap_action(
+        m, "getGovAppointmentDetails", "getGovAppointmentDetailsResponse.xml"
+    )
+    mock_soap_action(m, "getGovLocationDetails", "getGovLocationDetailsResponse.xml")
+    mock_soap_action(
+        m, "GetAppointmentQRCodeText", "GetAppointmentQRCodeTextResponse.xml"
+    )
+    mock_soap_action(m, "getGovProductDetails", "getGovProductDetailsResponse.xml")
+
+
 class PluginTests(TestCase):
     maxDiff = 1024
 
@@ -182,15 +207,7 @@ class PluginTests(TestCase):
     def test_get_appointment_details(self, m):
         identifier = "1234567890"
 
-        m.post(
-            "http://example.com/soap11",
-            [
-                {"text": mock_response("getGovAppointmentDetailsResponse.xml")},
-                {"text": mock_response("getGovLocationDetailsResponse.xml")},
-                {"text": mock_response("GetAppointmentQRCodeTextResponse.xml")},
-                {"text": mock_response("getGovProductDetailsResponse.xml")},
-            ],
-        )
+        mock_appointment_details(m)
 
         result = self.plugin.get_appointment_details(identifier)
 
@@ -219,3 +236,20 @@ class PluginTests(TestCase):
                 ): '<img src="data:image/png;base64, iVBORw0KGgoAAAANSUhEUgAAAUoAAAFKAQAAAABTUiuoAAAB50lEQVR4nO2bzY3cMAxGHyMDe5Q72FLkDlJSkJLSgVXKdiAfA9j4cpA849nLziQYr4IlT/p5hw8gKNKibOJOy9/uJcFRRx111FFHn4laswGb2Mxs3AyWfXl6ugBHH0GTJKmAfo5BmgmyiSBJ0i36HAGOPoIulxACSG9DHZjZcI4AR++w4d3cwFCeMLGcIcDRf0FTCbLpEwU4+jEaJc37ouao6jJJ6zkCHL3D2kmYDYBQZ5behhXY7PkCHH3YW4frp/y6QnVUvL2V+nStjlJr9CSJVAAIkkrYPRXbruZP1+po9Zakdc9RUYK4HtxYzb3VD7q8yKZlQDObkQqYjUAeTxLg6D3WAodWCTYrQaQS2obHVifo5cBbOeSteU9etar3vNUJevQWcUUzYa834gpJq8dWN+ixgk+/BoDNyCMIthMEOPp3NeEhmOY6kuetvtB2ElZHlZvp1TxvdYJeYkuXXtaxtvC81SF67R1XS5JgGfx7q0v02jue44pNi1k7DhfvRvaD7hV8oba26tpMON7oet7qFK1PMn7Uj+WwF4snCnD0ETSVzchmrbWVR2htyv60fjl0z0pRUB9ixHVQ/l4gv/6263uaDrQ62tBsZmYj2LS8vH+X0aa9aP3CqPlfC4466qijjv5H6B/hFU+U471mPQAAAABJRU5ErkJggg==" alt="44b322c32c5329b135e1" />'
             },
         )
+
+    @override_settings(APPOINTMENTS_CACHE="default")
+    @requests_mock.Mocker()
+    def test_get_appointment_details_uses_cached_details(self, m):
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+        mock_appointment_details(m)
+
+        first = self.plugin.get_appointment_details("1234567890")
+        self.assertEqual(m.call_count, 4)
+
+        second = self.plugin.get_appointment_details("1234567890")
+
+        # only the appointment details themselves are retrieved again
+        self.assertEqual(m.call_count, 5)
+        self.assertIn("getGovAppointmentDetails", m.last_request.headers["SOAPAction"])
+        self.assertEqual(first, second)
@@ -1,9 +1,9 @@
-from requests import Session
+from openforms.utils.resilience import ResilientSession
 
 from .models import QmaticConfig
 
 
-class QmaticClient(Session):
+class QmaticClient(ResilientSession):
     """
     Lightweight wrapper around Session to work with the API root and auth
     headers.
@@ -4,13 +4,15 @@ from django.utils.translation import gettext_lazy as _
 from solo.models import SingletonModel
 from zgw_consumers.constants import APITypes
 
+from openforms.config.snapshot import SnapshotSingletonMixin
+
 
 class QmaticConfigManager(models.Manager):
     def get_queryset(self):
         return super().get_queryset().select_related("service")
 
 
-class QmaticConfig(SingletonModel):
+class QmaticConfig(SnapshotSingletonMixin, SingletonModel):
     """
     Global configuration and defaults
     """
@@ -3,10 +3,12 @@ from django.utils.translation import gettext_lazy as _
 
 from solo.models import SingletonModel
 
+from openforms.config.snapshot import SnapshotSingletonMixin
+
 from .constants import AppointmentDetailsStatus, AppointmentsConfigPaths
 
 
-class AppointmentsConfig(SingletonModel):
+class AppointmentsConfig(SnapshotSingletonMixin, SingletonModel):
     config_path = models.CharField(
         _("appointment plugin"),
         choices=AppointmentsConfigPaths,
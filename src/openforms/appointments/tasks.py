@@ -0,0 +1,33 @@
+import logging
+
+from ..celery import app
+from .cache import refresh, refresh_hot_keys
+from .utils import get_plugin
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(ignore_result=True)
+def refresh_appointment_cache_key(key: str, method: str, call_args: list) -> None:
+    """
+    Refresh a single (stale) entry of the appointments cache.
+    """
+    try:
+        plugin = get_plugin()
+    except ValueError:
+        logger.info("No appointment plugin configured, not refreshing %s", key)
+        return
+    refresh(plugin, key, method, call_args)
+
+
+@app.task(ignore_result=True)
+def refresh_hot_appointment_cache_keys() -> None:
+    """
+    Proactively refresh the appointment cache keys that were recently requested.
+    """
+    try:
+        plugin = get_plugin()
+    except ValueError:
+        return
+    refreshed = refresh_hot_keys(plugin)
+    logger.debug("Refreshed %d appointment cache keys", refreshed)
@@ -0,0 +1,122 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+
+from ..base import AppointmentClient, AppointmentLocation, AppointmentProduct
+from ..cache import TIMES, CachedPlugin, _serialize_call, refresh_hot_keys
+
+PRODUCT = AppointmentProduct(identifier="1", name="Paspoort aanvraag")
+LOCATION = AppointmentLocation(identifier="1", name="Maykin Media")
+
+
+@override_settings(
+    APPOINTMENTS_CACHE="default",
+    APPOINTMENTS_CACHE_TIMEOUTS={
+        "products": 60,
+        "locations": 60,
+        "dates": 60,
+        "times": 30,
+    },
+    APPOINTMENTS_CACHE_STALE_TIMEOUT=600,
+)
+class CachedPluginTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+        self.plugin = MagicMock()
+        self.plugin.get_available_products.return_value = [PRODUCT]
+        self.plugin.get_times.return_value = [
+            timezone.make_aware(datetime(2021, 8, 23, 12, 0))
+        ]
+        self.cached = CachedPlugin(self.plugin)
+
+    def test_fresh_entries_are_served_from_cache(self):
+        with freeze_time("2021-08-23T10:00:00Z"):
+            first = self.cached.get_available_products()
+        with freeze_time("2021-08-23T10:00:59Z"):
+            second = self.cached.get_available_products()
+
+        self.assertEqual(first, [PRODUCT])
+        self.assertEqual(second, [PRODUCT])
+        self.plugin.get_available_products.assert_called_once()
+
+    @patch("openforms.appointments.tasks.refresh_appointment_cache_key.delay")
+    def test_stale_entries_are_served_and_refreshed(self, mock_delay):
+        with freeze_time("2021-08-23T10:00:00Z"):
+            self.cached.get_available_products()
+
+        with freeze_time("2021-08-23T10:05:00Z"):
+            result = self.cached.get_available_products()
+            # second stale read does not schedule another refresh
+            self.cached.get_available_products()
+
+        self.assertEqual(result, [PRODUCT])
+        self.plugin.get_available_products.assert_called_once()
+        mock_delay.assert_called_once()
+
+    def test_failed_calls_are_not_cached(self):
+        self.plugin.get_locations.return_value = []
+
+        self.cached.get_locations([PRODUCT])
+        self.cached.get_locations([PRODUCT])
+
+        self.assertEqual(self.plugin.get_locations.call_count, 2)
+
+    def test_create_appointment_invalidates_slots_for_that_day(self):
+        self.plugin.create_appointment.return_value = "1234"
+        day = date(2021, 8, 23)
+        self.cached.get_times([PRODUCT], LOCATION, day)
+
+        appointment_id = self.cached.create_appointment(
+            [PRODUCT],
+            LOCATION,
+            timezone.make_aware(datetime(2021, 8, 23, 12, 0)),
+            AppointmentClient(last_name="Maykin", birthdate=date(1970, 1, 1)),
+        )
+        self.cached.get_times([PRODUCT], LOCATION, day)
+
+        self.assertEqual(appointment_id, "1234")
+        self.assertEqual(self.plugin.get_times.call_count, 2)
+
+    @override_settings(BEAT_REFRESH_APPOINTMENTS_CACHE_INTERVAL=20)
+    def test_only_hot_keys_are_refreshed(self):
+        with freeze_time("2021-08-23T10:00:00Z"):
+            self.cached.get_available_products()
+            self.cached.get_times([PRODUCT], LOCATION, date(2021, 8, 23))
+        times_key, _ = _serialize_call(TIMES, [PRODUCT], LOCATION, date(2021, 8, 23))
+        caches["default"].delete(f"{times_key}:hit")
+
+        # both entries expire before the next run
+        with freeze_time("2021-08-23T10:00:50Z"):
+            refreshed = refresh_hot_keys(self.plugin)
+
+        self.assertEqual(refreshed, 1)
+        self.assertEqual(self.plugin.get_available_products.call_count, 2)
+        self.assertEqual(self.plugin.get_times.call_count, 1)
+
+    @override_settings(BEAT_REFRESH_APPOINTMENTS_CACHE_INTERVAL=20)
+    def test_hot_keys_are_refreshed_just_before_they_expire(self):
+        with freeze_time("2021-08-23T10:00:00Z"):
+            self.cached.get_available_products()
+            self.cached.get_times([PRODUCT], LOCATION, date(2021, 8, 23))
+
+        # the products are fresh until 10:01:00, the times until 10:00:30
+        with freeze_time("2021-08-23T10:00:15Z"):
+            refreshed = refresh_hot_keys(self.plugin)
+
+        self.assertEqual(refreshed, 1)
+        self.assertEqual(self.plugin.get_available_products.call_count, 1)
+        self.assertEqual(self.plugin.get_times.call_count, 2)
+
+    def test_other_attributes_are_delegated(self):
+        self.plugin.verbose_name = "Mock"
+
+        self.assertEqual(self.cached.verbose_name, "Mock")
@@ -10,19 +10,29 @@ import qrcode
 from openforms.submissions.models import Submission
 
 from .base import AppointmentClient, AppointmentLocation, AppointmentProduct
+from .cache import CachedPlugin
 from .constants import AppointmentDetailsStatus
 from .exceptions import AppointmentCreateFailed
 from .models import AppointmentInfo, AppointmentsConfig
 from .service import AppointmentRegistrationFailed
 
 
-def get_client():
+def get_plugin():
+    """
+    Return the configured appointment plugin, without any caching layer.
+    """
     config_path = AppointmentsConfig.get_solo().config_path
     if not config_path:
         raise ValueError("No config_path is specified in AppointmentsConfig")
     config_class = import_string(config_path)
-    client = config_class.get_solo().get_client()
-    return client
+    return config_class.get_solo().get_client()
+
+
+def get_client():
+    """
+    Return the configured appointment plugin, wrapped in the availability cache.
+    """
+    return CachedPlugin(get_plugin())
 
 
 def book_appointment_for_submission(submission: Submission) -> None:
@@ -93,6 +93,22 @@ CACHES = {
             "IGNORE_EXCEPTIONS": True,
         },
     },
+    "appointments": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{config('CACHE_DEFAULT', 'localhost:6379/0')}",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
+    "integrations": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{config('CACHE_DEFAULT', 'localhost:6379/0')}",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "IGNORE_EXCEPTIONS": True,
+        },
+    },
 }
 
 
@@ -285,7 +301,9 @@ SENDFILE_URL = PRIVATE_MEDIA_URL
 #
 # Sending EMAIL
 #
-EMAIL_BACKEND = "django_yubin.smtp_queue.EmailBackend"
+# Queue the e-mails in the database (django-yubin) and dispatch them in the background,
+# see openforms.emails.dispatch
+EMAIL_BACKEND = "openforms.emails.backends.QueuedEmailBackend"
 EMAIL_HOST = config("EMAIL_HOST", default="localhost")
 EMAIL_PORT = config(
     "EMAIL_PORT", default=25
@@ -297,6 +315,21 @@ EMAIL_TIMEOUT = 10
 
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", "openforms@example.com")
 
+# Number of queued messages fetched (and sent) at once
+EMAIL_BATCH_SIZE = config("EMAIL_BATCH_SIZE", default=100)
+# Maximum number of e-mails sent per minute, over all workers. 0 means unlimited.
+EMAIL_RATE_LIMIT = config("EMAIL_RATE_LIMIT", default=0)
+# Seconds an unused SMTP connection is kept open by a worker
+EMAIL_CONNECTION_MAX_IDLE = config("EMAIL_CONNECTION_MAX_IDLE", default=60)
+# Seconds to wait after an e-mail is queued before dispatching, so that e-mails queued
+# in quick succession are sent in one batch
+EMAIL_DISPATCH_DEBOUNCE = config("EMAIL_DISPATCH_DEBOUNCE", default=1)
+# Attachments larger than this (in bytes, in total) are not sent by e-mail, download
+# links are sent instead. The attachments are encoded in memory.
+EMAIL_ATTACHMENTS_MAX_SIZE = config(
+    "EMAIL_ATTACHMENTS_MAX_SIZE", default=10 * 1024 * 1024
+)
+
 #
 # LOGGING
 #
@@ -408,6 +441,12 @@ AUTHENTICATION_BACKENDS = [
 
 SESSION_COOKIE_NAME = "openforms_sessionid"
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+# Redis cache holding the submissions and uploads of a session, see
+# openforms.submissions.ownership
+SESSION_OWNERSHIP_CACHE = "default"  # refers to CACHES setting
+# Fraction of the session timeout after which activity postpones the expiry, see
+# openforms.middleware.SessionTimeoutMiddleware
+SESSION_REFRESH_FRACTION = config("SESSION_REFRESH_FRACTION", default=0.1)
 
 LOGIN_URL = reverse_lazy("admin:login")
 LOGIN_REDIRECT_URL = reverse_lazy("admin:index")
@@ -462,9 +501,51 @@ SDK_BASE_URL = config("SDK_BASE_URL", "https://open-forms.test.maykin.opengem.nl
 SUBMISSION_REPORT_URL_TOKEN_TIMEOUT_DAYS = config(
     "SUBMISSION_REPORT_URL_TOKEN_TIMEOUT_DAYS", default=1
 )
+# How long the download links of attachments that are too large for e-mail are valid
+SUBMISSION_ATTACHMENT_URL_TOKEN_TIMEOUT_DAYS = config(
+    "SUBMISSION_ATTACHMENT_URL_TOKEN_TIMEOUT_DAYS", default=7
+)
 TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS = config(
     "TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS", default=2
 )
+# Maximum size (in bytes) of a temporary file upload, larger uploads are aborted
+TEMPORARY_UPLOADS_MAX_SIZE = config(
+    "TEMPORARY_UPLOADS_MAX_SIZE", default=50 * 1024 * 1024
+)
+# Format of the generated public references of submissions, with the placeholders
+# "{reference}" and "{year}", see openforms.submissions.public_references
+SUBMISSION_REFERENCE_FORMAT = config(
+    "SUBMISSION_REFERENCE_FORMAT", default="OF-{reference}"
+)
+
+# Appointment plugins: cache (in seconds) for the availability information. Entries
+# are fresh for the configured timeout and may be served stale (while being refreshed
+# in the background) for APPOINTMENTS_CACHE_STALE_TIMEOUT seconds longer.
+APPOINTMENTS_CACHE = "appointments"  # refers to CACHES setting
+APPOINTMENTS_CACHE_TIMEOUTS = {
+    "products": config("APPOINTMENTS_CACHE_PRODUCTS_TIMEOUT", default=60 * 60),
+    "locations": config("APPOINTMENTS_CACHE_LOCATIONS_TIMEOUT", default=60 * 60),
+    "dates": config("APPOINTMENTS_CACHE_DATES_TIMEOUT", default=60),
+    "times": config("APPOINTMENTS_CACHE_TIMES_TIMEOUT", default=30),
+    # location and product details, used to display appointment details
+    "details": config("APPOINTMENTS_CACHE_DETAILS_TIMEOUT", default=60 * 60),
+}
+APPOINTMENTS_CACHE_STALE_TIMEOUT = config(
+    "APPOINTMENTS_CACHE_STALE_TIMEOUT", default=10 * 60
+)
+# the frequently requested entries that expire before the next run are refreshed
+BEAT_REFRESH_APPOINTMENTS_CACHE_INTERVAL = config(
+    "BEAT_REFRESH_APPOINTMENTS_CACHE_INTERVAL", default=20  # every 20 seconds
+)
+
+# JCC appointments: parsed WSDL/XSD documents are cached on disk and the HTTP
+# connections to the service are pooled.
+ZEEP_CACHE_PATH = config(
+    "ZEEP_CACHE_PATH", default=os.path.join(BASE_DIR, "cache", "zeep.db")
+)
+ZEEP_CACHE_TIMEOUT = config("ZEEP_CACHE_TIMEOUT", default=60 * 60 * 24)  # one day
+JCC_POOL_CONNECTIONS = config("JCC_POOL_CONNECTIONS", default=10)
+JCC_POOL_MAXSIZE = config("JCC_POOL_MAXSIZE", default=10)
 
 ##############################
 #                            #
@@ -530,9 +611,48 @@ TWO_FACTOR_PATCH_ADMIN = config("TWO_FACTOR_PATCH_ADMIN", default=True)
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
 
-# Add a 30 minutes timeout to all Celery tasks.
+# Add a 30 minutes timeout to all Celery tasks. Only the prefork pool enforces it, see
+# docs/installation/celery.rst
 CELERY_TASK_SOFT_TIME_LIMIT = 30 * 60
 
+# Route the tasks to a queue per workload class, so that the CPU-bound tasks (PDF
+# generation, image resizing) and the I/O-bound tasks (calls to external services,
+# e-mail) can be processed by workers with a suitable execution pool. Tasks without a
+# route go to the default "celery" queue. See bin/celery_worker_*.sh and
+# docs/installation/celery.rst
+_task_queues_by_workload = {
+    "pdf": (
+        "openforms.submissions.tasks.pdf.*",
+        "openforms.submissions.tasks.user_uploads.resize_submission_attachment",
+    ),
+    "registration": (
+        "openforms.registrations.tasks.*",
+        "openforms.payments.tasks.*",
+        "openforms.submissions.tasks.registration.*",
+        "openforms.submissions.tasks.finalize_completion",
+    ),
+    "appointments": (
+        "openforms.appointments.tasks.*",
+        "openforms.submissions.tasks.appointments.*",
+    ),
+    "email": (
+        "openforms.emails.tasks.*",
+        "openforms.submissions.tasks.emails.*",
+    ),
+    "maintenance": (
+        "openforms.data_removal.tasks.*",
+        "openforms.forms.tasks.*",
+        "openforms.submissions.tasks.cleanup.*",
+        "openforms.submissions.tasks.user_uploads.cleanup_*",
+        "openforms.utils.tasks.*",
+    ),
+}
+CELERY_TASK_ROUTES = {
+    pattern: {"queue": queue}
+    for queue, patterns in _task_queues_by_workload.items()
+    for pattern in patterns
+}
+
 
 CELERY_BEAT_SCHEDULE = {
     "clear-session-store": {
@@ -541,8 +661,11 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": crontab(minute=0, hour=0),
     },
     "send-emails": {
-        "task": "openforms.utils.tasks.send_emails",
-        "schedule": config("BEAT_SEND_EMAIL_INTERVAL", default=20),  # every 20 seconds
+        # e-mails are dispatched when they're queued, this only catches stragglers
+        "task": "openforms.emails.tasks.send_email_queue",
+        "schedule": config(
+            "BEAT_SEND_EMAIL_INTERVAL", default=5 * 60  # every 5 minutes
+        ),
     },
     "resend-submissions": {
         "task": "openforms.registrations.tasks.resend_submissions",
@@ -550,6 +673,13 @@ CELERY_BEAT_SCHEDULE = {
             "BEAT_RESEND_SUBMISSIONS_INTERVAL", default=60  # every minute
         ),
     },
+    "register-payments": {
+        # payments are registered when they're completed, this only catches the retries
+        "task": "openforms.payments.tasks.register_payments",
+        "schedule": config(
+            "BEAT_REGISTER_PAYMENTS_INTERVAL", default=60  # every minute
+        ),
+    },
     "delete-submissions": {
         "task": "openforms.data_removal.tasks.delete_submissions",
         "schedule": crontab(minute=0, hour=1),
@@ -566,12 +696,40 @@ CELERY_BEAT_SCHEDULE = {
         "task": "openforms.submissions.tasks.cleanup_on_completion_results",
         "schedule": crontab(minute=45, hour=4),
     },
+    "cleanup-unused-form-version-chunks": {
+        "task": "openforms.forms.tasks.cleanup_unused_form_version_chunks",
+        "schedule": crontab(minute=15, hour=5),
+    },
+    "refresh-appointment-cache": {
+        "task": "openforms.appointments.tasks.refresh_hot_appointment_cache_keys",
+        "schedule": BEAT_REFRESH_APPOINTMENTS_CACHE_INTERVAL,
+    },
 }
 
 CELERY_BEAT_RESEND_SUBMISSIONS_TIME_LIMIT = config(
     "CELERY_BEAT_RESEND_SUBMISSIONS_TIME_LIMIT", default=48  # hours
 )
 
+# Failed registrations are retried with an exponential backoff (with jitter), starting
+# at the base delay and capped at the maximum delay (in seconds), until the time limit
+# above is reached.
+SUBMISSION_REGISTRATION_RETRY_BACKOFF = config(
+    "SUBMISSION_REGISTRATION_RETRY_BACKOFF", default=60
+)
+SUBMISSION_REGISTRATION_RETRY_BACKOFF_MAX = config(
+    "SUBMISSION_REGISTRATION_RETRY_BACKOFF_MAX", default=4 * 60 * 60
+)
+# The maximum number of retries scheduled per run of the periodic task
+SUBMISSION_REGISTRATION_RETRY_BATCH_SIZE = config(
+    "SUBMISSION_REGISTRATION_RETRY_BATCH_SIZE", default=100
+)
+
+# Number of due payments registered in the registration backend per batch
+PAYMENT_REGISTRATION_BATCH_SIZE = config("PAYMENT_REGISTRATION_BATCH_SIZE", default=100)
+# Seconds to wait after a payment is completed before registering it, so that the
+# payments completed in quick succession are registered in one batch
+PAYMENT_REGISTRATION_DEBOUNCE = config("PAYMENT_REGISTRATION_DEBOUNCE", default=1)
+
 # Only ACK when the task has been executed. This prevents tasks from getting lost, with
 # the drawback that tasks should be idempotent (if they execute partially, the mutations
 # executed will be executed again!)
@@ -663,6 +821,59 @@ throttle_rate_user = (
     config("THROTTLE_RATE_USER", default="10000/hour") if ENABLE_THROTTLING else None
 )
 
+# How long (in seconds) shared caches (e.g. a reverse proxy) may serve public form
+# (definition) API responses without revalidating them using the ETag.
+API_SHARED_CACHE_MAX_AGE = config("API_SHARED_CACHE_MAX_AGE", default=0)
+# Serve pre-compressed (gzip/brotli) form definition configurations to clients that
+# support it. Disable this if compression is handled by the reverse proxy.
+API_PRECOMPRESSED_RESPONSES = config("API_PRECOMPRESSED_RESPONSES", default=True)
+# Form imports larger than this size (in bytes, uncompressed) are processed in the
+# background.
+FORMS_IMPORT_BACKGROUND_THRESHOLD = config(
+    "FORMS_IMPORT_BACKGROUND_THRESHOLD", default=1024 * 1024
+)
+# Maximum number of compiled admin-managed templates (confirmation pages, e-mails...)
+# kept in memory per process, see openforms.utils.templates
+COMPILED_TEMPLATE_CACHE_SIZE = config("COMPILED_TEMPLATE_CACHE_SIZE", default=256)
+
+# Operational metrics, see openforms.utils.metrics
+METRICS_CACHE = "default"  # refers to CACHES setting
+# Interval (in seconds) in which each process writes its recorded metrics to the cache
+METRICS_FLUSH_INTERVAL = config("METRICS_FLUSH_INTERVAL", default=10)
+
+# Calls to external services, see openforms.utils.resilience
+INTEGRATIONS_CACHE = "integrations"  # refers to CACHES setting
+# Timeout (in seconds) of the requests to external services, and per service
+# overrides as a comma separated list of "<host>=<seconds>"
+INTEGRATION_TIMEOUT = config("INTEGRATION_TIMEOUT", default=10.0)
+INTEGRATION_TIMEOUTS = {
+    host: float(timeout)
+    for host, timeout in (
+        item.split("=", 1)
+        for item in config("INTEGRATION_TIMEOUTS", split=True, default=[])
+    )
+}
+# Number of consecutive failures after which the calls to a service fail fast, and
+# the time (in seconds) after which a call is let through again
+INTEGRATION_BREAKER_THRESHOLD = config("INTEGRATION_BREAKER_THRESHOLD", default=5)
+INTEGRATION_BREAKER_RESET_TIMEOUT = config(
+    "INTEGRATION_BREAKER_RESET_TIMEOUT", default=30
+)
+# Maximum number of requests per second to a service (0 is unlimited), and per
+# service overrides as a comma separated list of "<host>=<requests per second>"
+INTEGRATION_RATE_LIMIT = config("INTEGRATION_RATE_LIMIT", default=0.0)
+INTEGRATION_RATE_LIMITS = {
+    host: float(rate)
+    for host, rate in (
+        item.split("=", 1)
+        for item in config("INTEGRATION_RATE_LIMITS", split=True, default=[])
+    )
+}
+# How long (in seconds) a request may wait for the rate limit before failing
+INTEGRATION_RATE_LIMIT_MAX_WAIT = config("INTEGRATION_RATE_LIMIT_MAX_WAIT", default=1.0)
+# Number of kept-alive connections per service, shared by the threads of a process
+INTEGRATION_POOL_MAXSIZE = config("INTEGRATION_POOL_MAXSIZE", default=16)
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.TokenAuthentication",
@@ -747,7 +958,7 @@ SPECTACULAR_SETTINGS = {
 #
 # ZGW Consumers
 #
-ZGW_CONSUMERS_CLIENT_CLASS = "zgw_consumers.client.ZGWClient"
+ZGW_CONSUMERS_CLIENT_CLASS = "openforms.utils.resilience.ResilientZGWClient"
 ZGW_CONSUMERS_TEST_SCHEMA_DIRS = [
     os.path.join(BASE_DIR, "src/openforms/registrations/contrib/zgw_apis/tests/files"),
     os.path.join(
@@ -764,6 +975,13 @@ ZGW_CONSUMERS_TEST_SCHEMA_DIRS = [
 SOLO_CACHE = "default"
 SOLO_CACHE_TIMEOUT = 60 * 5  # 5 minutes
 
+# Keep a per-process snapshot of the singleton configuration models, see
+# openforms.config.snapshot
+CONFIG_SNAPSHOT_ENABLED = config("CONFIG_SNAPSHOT_ENABLED", default=True)
+CONFIG_SNAPSHOT_CACHE = "default"  # refers to CACHES setting
+# how often (in seconds) the version is checked when the pub/sub listener is connected
+CONFIG_SNAPSHOT_MAX_AGE = config("CONFIG_SNAPSHOT_MAX_AGE", default=60)
+
 #
 # Django Cookie-Consent
 #
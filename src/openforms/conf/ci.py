@@ -16,10 +16,15 @@ CACHES = {
     # See: https://github.com/jazzband/django-axes/blob/master/docs/configuration.rst#cache-problems
     "axes": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
     "oidc": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "appointments": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    "integrations": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
 }
 
 LOGGING = None  # shut up logging
 
+# the snapshot outlives the test transactions - tests enable it explicitly
+CONFIG_SNAPSHOT_ENABLED = False
+
 ENVIRONMENT = "CI"
 
 #
@@ -70,6 +70,8 @@ CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "axes": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
     "oidc": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "appointments": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "integrations": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
 }
 
 #
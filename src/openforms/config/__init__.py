@@ -0,0 +1 @@
+default_app_config = "openforms.config.apps.OpenFormsConfigConfig"
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class OpenFormsConfigConfig(AppConfig):
     name = "openforms.config"
     verbose_name = "Configuration"
+
+    def ready(self):
+        # load the signal receivers
+        from . import signals  # noqa
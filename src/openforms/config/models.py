@@ -1,7 +1,6 @@
 from django.contrib.postgres.fields import JSONField
 from django.core.validators import MinValueValidator
 from django.db import models
-from django.template import Context, Template
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
@@ -11,10 +10,13 @@ from tinymce.models import HTMLField
 
 from openforms.data_removal.constants import RemovalMethods
 from openforms.utils.fields import SVGOrImageField
+from openforms.utils.templates import render_from_string
 from openforms.utils.translations import runtime_gettext
 
+from .snapshot import SnapshotSingletonMixin
 
-class GlobalConfiguration(SingletonModel):
+
+class GlobalConfiguration(SnapshotSingletonMixin, SingletonModel):
     email_template_netloc_allowlist = ArrayField(
         models.CharField(max_length=1000),
         verbose_name=_("allowed email domain names"),
@@ -389,6 +391,6 @@ class GlobalConfiguration(SingletonModel):
 
     def render_privacy_policy_label(self):
         template = self.privacy_policy_label
-        rendered_content = Template(template).render(Context({}))
+        rendered_content = render_from_string(template, {})
 
         return rendered_content
@@ -0,0 +1,19 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from zgw_consumers.models import Service
+
+from stuf.models import SoapService
+
+from .snapshot import bump_version
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+@receiver(post_save, sender=SoapService)
+@receiver(post_delete, sender=SoapService)
+def invalidate_snapshot(sender, **kwargs) -> None:
+    # the snapshot holds the configuration together with its related services (and
+    # their certificates)
+    transaction.on_commit(bump_version)
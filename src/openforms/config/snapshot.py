@@ -0,0 +1,180 @@
+"""
+In-process snapshot of the singleton configuration models.
+
+The singleton configuration (:class:`GlobalConfiguration`, the registration, prefill
+and appointment plugin configurations...) is read on (almost) every request, but it
+rarely changes. Instead of fetching it from the solo cache (or the database) on every
+use, every process keeps a snapshot of the configuration instances, with their related
+services loaded.
+
+Saving a configuration model bumps a version counter in the cache and broadcasts the
+new version on a Redis pub/sub channel. Every process listens on that channel in a
+background thread and drops its snapshot when a message arrives, so reading the
+configuration does not perform any I/O. When no listener is connected (e.g. Redis is
+not available), the version counter is checked on every read instead.
+"""
+import copy
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Type
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+
+from openforms.utils.redis import (
+    bump_version as bump_cache_version,
+    get_redis_connection,
+)
+
+logger = logging.getLogger(__name__)
+
+VERSION_CACHE_KEY = "config-snapshot:version"
+CHANNEL = "config-snapshot"
+# seconds to wait before reconnecting a lost pub/sub connection
+RECONNECT_DELAY = 5
+
+
+def _get_cache():
+    return caches[settings.CONFIG_SNAPSHOT_CACHE]
+
+
+class ConfigSnapshot:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._instances: Dict[str, models.Model] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._listener_pid: Optional[int] = None
+        self._listening = False
+
+    def get(self, model: Type[models.Model], loader: Callable[[], models.Model]):
+        """
+        Return a copy of the snapshotted instance, loading it if needed.
+        """
+        self._ensure_listener()
+        self._check_version()
+
+        label = model._meta.label
+        if (instance := self._instances.get(label)) is None:
+            with self._lock:
+                if (instance := self._instances.get(label)) is None:
+                    instance = loader()
+                    self._instances[label] = instance
+        # callers are allowed to modify (and save) the instance they get
+        return copy.deepcopy(instance)
+
+    def peek(self, model: Type[models.Model]) -> Optional[models.Model]:
+        """
+        Return the snapshotted instance if it's loaded, without loading it.
+
+        The instance is shared - it must not be modified.
+        """
+        self._check_version()
+        return self._instances.get(model._meta.label)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._instances = {}
+
+    def _check_version(self) -> None:
+        now = time.monotonic()
+        # with a connected listener, the version check is only a safety net
+        if (
+            self._listening
+            and now - self._checked_at < settings.CONFIG_SNAPSHOT_MAX_AGE
+        ):
+            return
+
+        version = _get_cache().get(VERSION_CACHE_KEY, 0)
+        self._checked_at = now
+        if version != self._version:
+            with self._lock:
+                self._instances = {}
+                self._version = version
+
+    def _ensure_listener(self) -> None:
+        # (re)start the listener in forked worker processes
+        if self._listener_pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            self._listening = False
+            self._instances = {}
+
+            if (
+                connection := get_redis_connection(settings.CONFIG_SNAPSHOT_CACHE)
+            ) is None:
+                return
+            thread = threading.Thread(
+                target=self._listen,
+                args=(connection,),
+                name="config-snapshot-listener",
+                daemon=True,
+            )
+            thread.start()
+
+    def _listen(self, connection) -> None:
+        while True:
+            try:
+                pubsub = connection.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(CHANNEL)
+                self._listening = True
+                # changes made while we were not subscribed are picked up by the
+                # version check
+                self._checked_at = 0.0
+                for _message in pubsub.listen():
+                    self.invalidate()
+            except Exception:
+                logger.warning(
+                    "Lost the configuration snapshot pub/sub connection",
+                    exc_info=True,
+                )
+            finally:
+                self._listening = False
+            time.sleep(RECONNECT_DELAY)
+
+
+snapshot = ConfigSnapshot()
+
+
+def bump_version() -> None:
+    """
+    Invalidate the configuration snapshots of all processes.
+    """
+    bump_cache_version(settings.CONFIG_SNAPSHOT_CACHE, VERSION_CACHE_KEY, CHANNEL)
+    snapshot.invalidate()
+
+
+class SnapshotSingletonMixin:
+    """
+    Serve :meth:`get_solo` from the in-process configuration snapshot.
+
+    Use this mixin before :class:`solo.models.SingletonModel`. The instance is loaded
+    through the default manager, so select the related services there.
+    """
+
+    @classmethod
+    def get_solo(cls):
+        if not settings.CONFIG_SNAPSHOT_ENABLED:
+            return super().get_solo()
+        return snapshot.get(cls, cls._load_snapshot_instance)
+
+    @classmethod
+    def _load_snapshot_instance(cls):
+        instance, _ = cls.objects.get_or_create(pk=cls.singleton_instance_id)
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        transaction.on_commit(bump_version)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(bump_version)
+        return result
@@ -0,0 +1,100 @@
+from django.core.cache import caches
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from zgw_consumers.constants import APITypes
+
+from openforms.appointments.contrib.jcc.models import JccConfig
+from openforms.contrib.kvk.models import KVKConfig
+from openforms.registrations.contrib.zgw_apis.tests.factories import ServiceFactory
+from openforms.submissions.models import get_default_bsn
+from stuf.tests.factories import SoapServiceFactory
+
+from ..models import GlobalConfiguration
+from ..snapshot import VERSION_CACHE_KEY, snapshot
+
+
+@override_settings(CONFIG_SNAPSHOT_ENABLED=True)
+class ConfigSnapshotTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+        snapshot.invalidate()
+        self.addCleanup(snapshot.invalidate)
+        self.addCleanup(caches["default"].clear)
+
+    def test_configuration_is_read_from_memory(self):
+        GlobalConfiguration.get_solo()
+
+        with self.assertNumQueries(0):
+            config = GlobalConfiguration.get_solo()
+            default_bsn = get_default_bsn()
+
+        self.assertIsInstance(config, GlobalConfiguration)
+        self.assertEqual(default_bsn, config.default_test_bsn)
+
+    def test_modifying_the_instance_does_not_alter_the_snapshot(self):
+        config = GlobalConfiguration.get_solo()
+        config.default_test_bsn = "111222333"
+
+        self.assertNotEqual(
+            GlobalConfiguration.get_solo().default_test_bsn, "111222333"
+        )
+
+    def test_version_bump_from_other_process_invalidates(self):
+        GlobalConfiguration.get_solo()
+        GlobalConfiguration.objects.update(default_test_bsn="111222333")
+
+        cache = caches["default"]
+        cache.add(VERSION_CACHE_KEY, 0, timeout=None)
+        cache.incr(VERSION_CACHE_KEY)
+
+        self.assertEqual(GlobalConfiguration.get_solo().default_test_bsn, "111222333")
+
+
+@override_settings(CONFIG_SNAPSHOT_ENABLED=True)
+class ConfigSnapshotSaveTests(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+        snapshot.invalidate()
+        self.addCleanup(snapshot.invalidate)
+        self.addCleanup(caches["default"].clear)
+
+    def test_save_invalidates_snapshot(self):
+        config = GlobalConfiguration.get_solo()
+        config.default_test_bsn = "111222333"
+        config.save()
+
+        self.assertEqual(GlobalConfiguration.get_solo().default_test_bsn, "111222333")
+
+    def test_service_change_invalidates_snapshot(self):
+        service = ServiceFactory.create(
+            api_root="https://kvk.example.com/api/", api_type=APITypes.orc
+        )
+        config = KVKConfig.get_solo()
+        config.service = service
+        config.save()
+        self.assertEqual(KVKConfig.get_solo().service.api_root, service.api_root)
+
+        service.api_root = "https://kvk.example.nl/api/"
+        service.save()
+
+        self.assertEqual(
+            KVKConfig.get_solo().service.api_root, "https://kvk.example.nl/api/"
+        )
+
+    def test_soap_service_change_invalidates_snapshot(self):
+        service = SoapServiceFactory.create(url="https://jcc.example.com/wsdl")
+        config = JccConfig.get_solo()
+        config.service = service
+        config.save()
+        self.assertEqual(JccConfig.get_solo().service.url, service.url)
+
+        service.url = "https://jcc.example.nl/wsdl"
+        service.save()
+
+        self.assertEqual(
+            JccConfig.get_solo().service.url, "https://jcc.example.nl/wsdl"
+        )
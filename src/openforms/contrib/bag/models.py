@@ -4,13 +4,15 @@ from django.utils.translation import gettext_lazy as _
 from solo.models import SingletonModel
 from zgw_consumers.constants import APITypes
 
+from openforms.config.snapshot import SnapshotSingletonMixin
+
 
 class BAGConfigManager(models.Manager):
     def get_queryset(self):
         return super().get_queryset().select_related("bag_service")
 
 
-class BAGConfig(SingletonModel):
+class BAGConfig(SnapshotSingletonMixin, SingletonModel):
     bag_service = models.ForeignKey(
         "zgw_consumers.Service",
         on_delete=models.SET_NULL,
@@ -1,8 +1,9 @@
 from zds_client.schema import get_operation_url
-from zgw_consumers.client import ZGWClient
 
+from openforms.utils.resilience import ResilientZGWClient
 
-class HalClient(ZGWClient):
+
+class HalClient(ResilientZGWClient):
     def pre_request(self, method, url, **kwargs):
         """
         Add authorization header to requests for APIs without jwt.
@@ -0,0 +1,18 @@
+from django_yubin.smtp_queue import EmailBackend
+
+from .dispatch import schedule_dispatch_on_commit
+
+
+class QueuedEmailBackend(EmailBackend):
+    """
+    Queue the e-mails in the database and schedule their dispatch.
+
+    The dispatch is scheduled when the current transaction is committed, so the
+    messages are sent in the background shortly after queueing them.
+    """
+
+    def send_messages(self, email_messages):
+        num_queued = super().send_messages(email_messages)
+        if num_queued:
+            schedule_dispatch_on_commit()
+        return num_queued
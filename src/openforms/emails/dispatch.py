@@ -0,0 +1,263 @@
+"""
+Dispatch of the e-mail queue.
+
+E-mails are queued in the database by django-yubin (see
+:class:`openforms.emails.backends.QueuedEmailBackend`). Queueing an e-mail schedules
+the ``send_email_queue`` task once the transaction is committed, which sends the queued
+messages in batches. The periodic task is only a safety net.
+
+Every worker process keeps its SMTP connection open between dispatches, so a burst of
+e-mails (e.g. the confirmation e-mails after a campaign form closes) does not open a
+new connection per message. The number of messages sent per minute is limited over
+all workers with ``settings.EMAIL_RATE_LIMIT`` - when the limit is reached, the
+dispatch is rescheduled at the start of the next minute.
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.mail import get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from django_yubin import constants, models, settings as yubin_settings
+from django_yubin.engine import send_queued_message
+
+from openforms.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "emails"
+DISPATCH_LOCK_KEY = f"{CACHE_KEY_PREFIX}:dispatch-lock"
+DISPATCH_SCHEDULED_KEY = f"{CACHE_KEY_PREFIX}:dispatch-scheduled"
+# seconds after which a lock of a crashed dispatch expires, it's extended after every
+# batch
+DISPATCH_LOCK_TIMEOUT = 10 * 60
+# a dispatch doesn't fetch new batches after this many seconds, the remaining messages
+# are sent by a new dispatch
+DISPATCH_MAX_DURATION = 2 * 60
+# idle connections are checked with a NOOP before they're reused
+CONNECTION_CHECK_AFTER = 10
+
+RESULT_METRICS = {
+    constants.RESULT_SENT: "emails.sent",
+    constants.RESULT_FAILED: "emails.deferred",
+    constants.RESULT_SKIPPED: "emails.skipped",
+}
+
+
+def _get_cache():
+    return caches["default"]
+
+
+class PersistentConnection:
+    """
+    Keep a (per process) connection of the actual e-mail backend open between uses.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._connection = None
+        self._last_used = 0.0
+
+    def get(self):
+        with self._lock:
+            # don't share the socket of the parent process in forked workers
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._connection = None
+
+            now = time.monotonic()
+            if (
+                self._connection is not None
+                and now - self._last_used > settings.EMAIL_CONNECTION_MAX_IDLE
+            ):
+                self._close()
+            elif self._connection is not None and not self._is_alive(now):
+                self._close()
+
+            if self._connection is None:
+                self._connection = get_connection(backend=yubin_settings.USE_BACKEND)
+                self._connection.open()
+                metrics.incr("emails.connections_opened")
+            self._last_used = now
+            return self._connection
+
+    def _is_alive(self, now: float) -> bool:
+        if now - self._last_used < CONNECTION_CHECK_AFTER:
+            return True
+        # only SMTP connections can (and need to) be checked
+        if (smtp := getattr(self._connection, "connection", None)) is None:
+            return True
+        try:
+            status, _ = smtp.noop()
+        except Exception:
+            return False
+        return status == 250
+
+    def _close(self) -> None:
+        try:
+            self._connection.close()
+        except Exception:
+            logger.debug("Could not close the e-mail connection", exc_info=True)
+        self._connection = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._close()
+
+
+connection = PersistentConnection()
+
+
+def _reserve_send_slot() -> Optional[float]:
+    """
+    Count a message against the rate limit.
+
+    :return: ``None`` if the message may be sent, otherwise the number of seconds
+      until the next rate limit window.
+    """
+    if not (limit := settings.EMAIL_RATE_LIMIT):
+        return None
+
+    cache = _get_cache()
+    now = time.time()
+    key = f"{CACHE_KEY_PREFIX}:rate:{int(now // 60)}"
+    cache.add(key, 0, timeout=2 * 60)
+    try:
+        sent = cache.incr(key)
+    except ValueError:  # the key expired in the meantime
+        cache.set(key, 1, timeout=2 * 60)
+        sent = 1
+    if sent > limit:
+        return 60 - now % 60
+    return None
+
+
+def _send_batch(batch: List[models.QueuedMessage], blacklist: Set[str]):
+    results = Counter()
+    send_times, latencies = [], []
+    retry_after = None
+
+    batch_start = time.monotonic()
+    smtp_connection = connection.get()
+    for queued_message in batch:
+        if (retry_after := _reserve_send_slot()) is not None:
+            break
+        send_start = time.monotonic()
+        result = send_queued_message(
+            queued_message, smtp_connection=smtp_connection, blacklist=blacklist
+        )
+        results[result] += 1
+        if result == constants.RESULT_SENT:
+            send_times.append(time.monotonic() - send_start)
+            latency = timezone.now() - queued_message.message.date_created
+            latencies.append(latency.total_seconds())
+        elif result == constants.RESULT_FAILED:
+            # the connection may be broken, which would defer all following messages
+            connection.close()
+            smtp_connection = connection.get()
+
+    # record the metrics per batch rather than per message
+    for result, count in results.items():
+        metrics.incr(RESULT_METRICS[result], count)
+    metrics.timing("emails.send_time", *send_times)
+    metrics.timing("emails.queue_latency", *latencies)
+    metrics.timing("emails.batch_time", time.monotonic() - batch_start)
+    return retry_after
+
+
+def _extend_lock(cache, token: str) -> bool:
+    """
+    Extend the dispatch lock, if it's still held by this dispatch.
+    """
+    # note: not atomic, but the lock only expires if a batch takes minutes
+    if cache.get(DISPATCH_LOCK_KEY) != token:
+        return False
+    cache.set(DISPATCH_LOCK_KEY, token, timeout=DISPATCH_LOCK_TIMEOUT)
+    return True
+
+
+def _release_lock(cache, token: str) -> None:
+    # don't release the lock of another dispatch, if ours expired
+    if cache.get(DISPATCH_LOCK_KEY) == token:
+        cache.delete(DISPATCH_LOCK_KEY)
+
+
+def send_queued_messages() -> Optional[float]:
+    """
+    Send the queued (non-deferred) messages.
+
+    Only one dispatch runs at a time over all workers. A dispatch stops fetching new
+    batches after ``DISPATCH_MAX_DURATION`` seconds and schedules a new dispatch for
+    the remaining messages.
+
+    :return: ``None`` when done, otherwise the number of seconds after which the
+      dispatch should be retried because the rate limit has been reached.
+    """
+    cache = _get_cache()
+    token = uuid.uuid4().hex
+    if not cache.add(DISPATCH_LOCK_KEY, token, timeout=DISPATCH_LOCK_TIMEOUT):
+        logger.debug("E-mail dispatch already in progress, skipping")
+        return None
+
+    retry_after = None
+    start = time.monotonic()
+    try:
+        blacklist = set(models.Blacklist.objects.values_list("email", flat=True))
+        while batch := list(
+            models.QueuedMessage.objects.non_deferred().select_related("message")[
+                : settings.EMAIL_BATCH_SIZE
+            ]
+        ):
+            retry_after = _send_batch(batch, blacklist)
+            if retry_after is not None:
+                logger.info(
+                    "E-mail rate limit reached, retrying in %d seconds", retry_after
+                )
+                break
+            if not _extend_lock(cache, token):
+                logger.warning("E-mail dispatch lock expired, stopping the dispatch")
+                break
+            if time.monotonic() - start > DISPATCH_MAX_DURATION:
+                break
+    finally:
+        _release_lock(cache, token)
+        logger.debug("E-mail dispatch took %.2f seconds", time.monotonic() - start)
+
+    # messages queued while the lock was held and after the last batch was fetched
+    # were not picked up by the dispatch they scheduled, and a dispatch that ran out
+    # of time leaves the remaining messages
+    if retry_after is None and models.QueuedMessage.objects.non_deferred().exists():
+        schedule_dispatch()
+    return retry_after
+
+
+def schedule_dispatch(countdown: float = 0) -> None:
+    """
+    Schedule the dispatch of the e-mail queue, unless it is already scheduled.
+    """
+    from .tasks import send_email_queue
+
+    cache = _get_cache()
+    if not cache.add(
+        DISPATCH_SCHEDULED_KEY,
+        True,
+        timeout=max(int(countdown), settings.EMAIL_DISPATCH_DEBOUNCE),
+    ):
+        return
+    send_email_queue.apply_async(
+        countdown=max(countdown, settings.EMAIL_DISPATCH_DEBOUNCE)
+    )
+
+
+def schedule_dispatch_on_commit() -> None:
+    transaction.on_commit(schedule_dispatch)
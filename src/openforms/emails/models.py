@@ -2,13 +2,14 @@ from typing import Any, Dict
 
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.template import Context, Template, TemplateSyntaxError
+from django.template import TemplateSyntaxError
 from django.template.loader import get_template
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
 from openforms.appointments.models import AppointmentInfo
 from openforms.submissions.models import Submission
+from openforms.utils.templates import get_template_from_string, render_from_string
 
 from .utils import sanitize_content
 
@@ -64,7 +65,7 @@ class ConfirmationEmailTemplate(models.Model):
         context = self.get_context_data(submission)
 
         # render the e-mail body - the template from this model.
-        rendered_content = Template(self.content).render(Context(context))
+        rendered_content = render_from_string(self.content, context)
 
         sanitized = sanitize_content(rendered_content)
 
@@ -74,7 +75,7 @@ class ConfirmationEmailTemplate(models.Model):
 
     def clean(self):
         try:
-            Template(self.content)
+            get_template_from_string(self.content)
         except TemplateSyntaxError as e:
             raise ValidationError(e)
         return super().clean()
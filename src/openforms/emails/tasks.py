@@ -0,0 +1,14 @@
+import logging
+
+from openforms.celery import app
+
+from .dispatch import schedule_dispatch, send_queued_messages
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(ignore_result=True)
+def send_email_queue() -> None:
+    logger.debug("Processing e-mail queue")
+    if (retry_after := send_queued_messages()) is not None:
+        schedule_dispatch(countdown=retry_after)
@@ -2,8 +2,6 @@ from typing import Any
 
 from django import template
 
-from openforms.forms.models import FormDefinition
-
 register = template.Library()
 
 
@@ -20,14 +18,9 @@ def filter_data_to_show_in_email(context: dict) -> dict:
     """
     form = context["_form"]
 
-    # From the form definition, see which fields should be shown in the confirmation email
-    data_to_show_in_email = []
-    for form_definition in FormDefinition.objects.filter(formstep__form=form):
-        data_to_show_in_email += form_definition.get_keys_for_email_summary()
-
     # Return a dict with only the data that should be shown in the email
     filtered_data = {}
-    for property_key, property_label in data_to_show_in_email:
+    for property_key, property_label in form.email_summary_keys:
         if property_key in context:
             filtered_data[property_label] = context[property_key]
     return {"data": filtered_data}
@@ -17,6 +17,7 @@ from openforms.submissions.tests.factories import (
 from openforms.tests.utils import NOOP_CACHES
 
 from ..models import ConfirmationEmailTemplate
+from ..templatetags.form_summary import filter_data_to_show_in_email
 
 NESTED_COMPONENT_CONF = {
     "display": "form",
@@ -140,6 +141,37 @@ class ConfirmationEmailTests(TestCase):
         self.assertIn("<th>Last name</th>", rendered_content)
         self.assertIn("<th>Doe</th>", rendered_content)
 
+    def test_summary_keys_are_computed_once(self):
+        form_step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {"key": "first", "label": "First", "showInEmail": True},
+                    {"key": "hidden", "label": "Hidden", "showInEmail": False},
+                ]
+            }
+        )
+        FormStepFactory.create(
+            form=form_step.form,
+            form_definition__configuration={
+                "components": [
+                    {"key": "second", "label": "Second", "showInEmail": True},
+                ]
+            },
+        )
+        submission_step = SubmissionStepFactory.create(
+            data={"first": "1", "second": "2", "hidden": "x"},
+            form_step=form_step,
+            submission__form=form_step.form,
+        )
+        submission = submission_step.submission
+
+        context = ConfirmationEmailTemplate.get_context_data(submission)
+        with self.assertNumQueries(1):
+            result = filter_data_to_show_in_email(context)
+            filter_data_to_show_in_email(context)
+
+        self.assertEqual(result["data"], {"First": "1", "Second": "2"})
+
     def test_attachment(self):
         conf = deepcopy(NESTED_COMPONENT_CONF)
         conf["components"].append(
@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.core.mail import EmailMessage, send_mail
+from django.test import TestCase, override_settings
+
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
+from django_yubin import (
+    constants,
+    models,
+    queue_email_message,
+    settings as yubin_settings,
+)
+
+from ..dispatch import DISPATCH_LOCK_KEY, connection, send_queued_messages
+
+
+def fake_send(queued_message, smtp_connection=None, blacklist=None):
+    queued_message.delete()
+    return constants.RESULT_SENT
+
+
+@override_settings(EMAIL_BATCH_SIZE=2, EMAIL_RATE_LIMIT=0)
+@patch.object(
+    yubin_settings, "USE_BACKEND", "django.core.mail.backends.locmem.EmailBackend"
+)
+class DispatchTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+        self.addCleanup(connection.close)
+
+        for index in range(3):
+            queue_email_message(
+                EmailMessage(
+                    f"Message {index}",
+                    "Body",
+                    "openforms@example.com",
+                    [f"user{index}@example.com"],
+                )
+            )
+
+    @patch("openforms.emails.dispatch.send_queued_message", side_effect=fake_send)
+    def test_queue_is_sent_in_batches_over_one_connection(self, mock_send):
+        retry_after = send_queued_messages()
+
+        self.assertIsNone(retry_after)
+        self.assertEqual(mock_send.call_count, 3)
+        connections = {
+            call.kwargs["smtp_connection"] for call in mock_send.call_args_list
+        }
+        self.assertEqual(len(connections), 1)
+        self.assertFalse(models.QueuedMessage.objects.exists())
+
+    @override_settings(EMAIL_RATE_LIMIT=2)
+    @patch("openforms.emails.dispatch.send_queued_message", side_effect=fake_send)
+    def test_rate_limit(self, mock_send):
+        retry_after = send_queued_messages()
+
+        self.assertIsNotNone(retry_after)
+        self.assertLessEqual(retry_after, 60)
+        self.assertEqual(mock_send.call_count, 2)
+        self.assertEqual(models.QueuedMessage.objects.count(), 1)
+
+    @patch("openforms.emails.dispatch.send_queued_message", side_effect=fake_send)
+    def test_only_one_dispatch_at_a_time(self, mock_send):
+        caches["default"].add(DISPATCH_LOCK_KEY, True)
+
+        send_queued_messages()
+
+        mock_send.assert_not_called()
+
+    @patch("openforms.emails.dispatch.DISPATCH_MAX_DURATION", -1)
+    @patch("openforms.emails.dispatch.schedule_dispatch")
+    @patch("openforms.emails.dispatch.send_queued_message", side_effect=fake_send)
+    def test_dispatch_is_limited_in_time(self, mock_send, mock_schedule):
+        retry_after = send_queued_messages()
+
+        self.assertIsNone(retry_after)
+        # one batch is sent, the remaining message by the next dispatch
+        self.assertEqual(mock_send.call_count, 2)
+        mock_schedule.assert_called_once_with()
+        self.assertIsNone(caches["default"].get(DISPATCH_LOCK_KEY))
+
+    @patch("openforms.emails.dispatch.schedule_dispatch")
+    @patch("openforms.emails.dispatch.send_queued_message")
+    def test_expired_lock_of_other_dispatch_is_kept(self, mock_send, mock_schedule):
+        def lose_lock(queued_message, smtp_connection=None, blacklist=None):
+            # the lock expired and another dispatch took over
+            caches["default"].set(DISPATCH_LOCK_KEY, "other")
+            return fake_send(queued_message)
+
+        mock_send.side_effect = lose_lock
+
+        send_queued_messages()
+
+        # the dispatch stops after the batch, and doesn't release the other lock
+        self.assertEqual(mock_send.call_count, 2)
+        self.assertEqual(caches["default"].get(DISPATCH_LOCK_KEY), "other")
+
+    @override_settings(EMAIL_BACKEND="openforms.emails.backends.QueuedEmailBackend")
+    @patch("openforms.emails.tasks.send_email_queue.apply_async")
+    def test_queueing_schedules_one_dispatch(self, mock_apply_async):
+        with capture_on_commit_callbacks(execute=True):
+            send_mail("Subject", "Body", "openforms@example.com", ["a@example.com"])
+            send_mail("Subject", "Body", "openforms@example.com", ["b@example.com"])
+
+        self.assertEqual(models.QueuedMessage.objects.count(), 5)
+        mock_apply_async.assert_called_once()
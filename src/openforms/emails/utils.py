@@ -1,6 +1,5 @@
-import re
-from functools import partial
-from typing import List
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterable
 from urllib.parse import urlparse
 
 from openforms.config.models import GlobalConfiguration
@@ -8,13 +7,31 @@ from openforms.config.models import GlobalConfiguration
 from .constants import URL_REGEX
 
 
-def sanitize_urls(allowlist: List[str], match) -> str:
+def sanitize_urls(allowlist: Iterable[str], match) -> str:
     parsed = urlparse(match.group())
     if parsed.netloc in allowlist:
         return match.group()
     return ""
 
 
+@lru_cache(maxsize=16)
+def get_url_sanitizer(allowlist: FrozenSet[str]) -> Callable[[str], str]:
+    """
+    Return a function stripping the URLs that are not in ``allowlist`` from a text.
+
+    The sanitizers are cached per allowlist, which only changes when the global
+    configuration is updated.
+    """
+
+    def replace_url(match) -> str:
+        return sanitize_urls(allowlist, match)
+
+    def sanitize(content: str) -> str:
+        return URL_REGEX.sub(replace_url, content)
+
+    return sanitize
+
+
 def sanitize_content(content: str) -> str:
     """
     Sanitize the content by stripping untrusted content.
@@ -27,7 +44,5 @@ def sanitize_content(content: str) -> str:
     config = GlobalConfiguration.get_solo()
 
     # strip out any hyperlinks that are not in the configured allowlist
-    replace_urls = partial(sanitize_urls, config.email_template_netloc_allowlist)
-    stripped = re.sub(URL_REGEX, replace_urls, content)
-
-    return stripped
+    sanitize = get_url_sanitizer(frozenset(config.email_template_netloc_allowlist))
+    return sanitize(content)
@@ -1,3 +1,4 @@
 from .form import FormAdmin
 from .form_definition import FormDefinitionAdmin
+from .form_import import FormImportJobAdmin
 from .form_version import FormVersionAdmin
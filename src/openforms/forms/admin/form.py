@@ -4,6 +4,8 @@ from django.core.exceptions import PermissionDenied
 from django.http.response import HttpResponse, HttpResponseRedirect
 from django.template.response import TemplateResponse
 from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html
 from django.utils.translation import ngettext, ugettext_lazy as _
 
 from ordered_model.admin import OrderedInlineModelAdminMixin, OrderedTabularInline
@@ -16,8 +18,14 @@ from ...payments.admin import PaymentBackendChoiceFieldMixin
 from ...utils.expressions import FirstNotBlank
 from ..backends import registry
 from ..forms.form import FormImportForm
-from ..models import Form, FormStep
-from ..utils import export_form, import_form
+from ..models import Form, FormImportJob, FormStep
+from ..tasks import import_form_task
+from ..utils import (
+    export_form,
+    import_form_data,
+    read_import_file,
+    should_import_in_background,
+)
 
 
 class FormStepInline(OrderedTabularInline):
@@ -167,9 +175,30 @@ class FormAdmin(
         if "_import" in request.POST:
             form = FormImportForm(request.POST, request.FILES)
             if form.is_valid():
+                import_file = form.cleaned_data["file"]
+                import_data = read_import_file(import_file)
+                if should_import_in_background(import_data):
+                    job = FormImportJob.objects.create(
+                        file=import_file, created_by=request.user
+                    )
+                    import_form_task.delay(job.id)
+                    self.message_user(
+                        request,
+                        format_html(
+                            _(
+                                "The form is large and is imported in the background. "
+                                "It will show up in the list of forms once the import "
+                                'is done, the <a href="{url}">form imports</a> show '
+                                "whether it succeeded."
+                            ),
+                            url=reverse("admin:forms_formimportjob_changelist"),
+                        ),
+                        level=messages.INFO,
+                    )
+                    return HttpResponseRedirect(reverse("admin:forms_form_changelist"))
+
                 try:
-                    import_file = form.cleaned_data["file"]
-                    created_fds = import_form(import_file)
+                    created_fds = import_form_data(import_data)
                     if created_fds:
                         self.message_user(
                             request,
@@ -231,7 +260,10 @@ class FormAdmin(
     make_copies.short_description = _("Copy selected %(verbose_name_plural)s")
 
     def set_to_maintenance_mode(self, request, queryset):
-        count = queryset.filter(maintenance_mode=False).update(maintenance_mode=True)
+        # ``update`` skips ``auto_now``, which the ETag of the form depends on
+        count = queryset.filter(maintenance_mode=False).update(
+            maintenance_mode=True, changed_on=timezone.now()
+        )
         messages.success(
             request,
             ngettext(
@@ -250,7 +282,9 @@ class FormAdmin(
     )
 
     def remove_from_maintenance_mode(self, request, queryset):
-        count = queryset.filter(maintenance_mode=True).update(maintenance_mode=False)
+        count = queryset.filter(maintenance_mode=True).update(
+            maintenance_mode=False, changed_on=timezone.now()
+        )
         messages.success(
             request,
             ngettext(
@@ -0,0 +1,29 @@
+from django.contrib import admin
+
+from ..models import FormImportJob
+
+
+@admin.register(FormImportJob)
+class FormImportJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "created_on",
+        "created_by",
+        "status",
+        "error_message",
+    )
+    list_filter = ("status", "created_on")
+    list_select_related = ("created_by",)
+    readonly_fields = (
+        "uuid",
+        "file",
+        "created_by",
+        "created_on",
+        "status",
+        "error_message",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
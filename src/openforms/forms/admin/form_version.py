@@ -11,6 +11,8 @@ class FormVersionAdmin(admin.ModelAdmin):
     )
     list_filter = ("form", "created")
     search_fields = ("form", "created")
+    list_select_related = ("form",)
+    exclude = ("chunks",)
 
     def has_add_permission(self, request):
         return False
@@ -1,7 +1,7 @@
-from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from openforms.api.parsers import OpaqueFieldsCamelCaseJSONParser
 
 
-class IgnoreConfigurationFieldCamelCaseJSONParser(CamelCaseJSONParser):
+class IgnoreConfigurationFieldCamelCaseJSONParser(OpaqueFieldsCamelCaseJSONParser):
     # This is SUPER important - when using the API to manage forms, form steps and form
     # definitions, the `configuration` field we post back is a JSONField holding the
     # formio.js definitions, which are camelCase because it's raw JSON.
@@ -10,4 +10,4 @@ class IgnoreConfigurationFieldCamelCaseJSONParser(CamelCaseJSONParser):
     # variant can sometimes overwrite the camelCase variant, which breaks the pre-fill
     # functionality. This can happen because JSON objects DO NOT HAVE inherent ordering
     # and the spec is non-deterministic.
-    json_underscoreize = {"ignore_fields": ("configuration",)}
+    opaque_fields = ("configuration",)
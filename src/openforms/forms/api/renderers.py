@@ -0,0 +1,75 @@
+import gzip
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from openforms.api.renderers import (
+    OpaqueFieldsCamelCaseJSONRenderer,
+    PreEncodedJSON,
+    json_dumps,
+)
+
+from ..models import FormDefinition
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+ENCODED_CONFIGURATION_CACHE_TIMEOUT = 60 * 60 * 24  # one day
+
+
+class IgnoreConfigurationFieldCamelCaseJSONRenderer(OpaqueFieldsCamelCaseJSONRenderer):
+    # see IgnoreConfigurationFieldCamelCaseJSONParser
+    opaque_fields = ("configuration",)
+
+
+def _get_cache_key(definition: FormDefinition, content_encoding: str) -> str:
+    version = definition.changed_on.timestamp()
+    return f"forms:definition:{definition.uuid}:{version}:{content_encoding}"
+
+
+def get_pre_encoded_configuration(definition: FormDefinition) -> PreEncodedJSON:
+    """
+    Return the configuration of the definition with its cached JSON encoding.
+
+    The cache is keyed by the definition version, so no explicit invalidation is
+    required.
+    """
+    cache_key = _get_cache_key(definition, "identity")
+    encoded = cache.get(cache_key)
+    if encoded is None:
+        encoded = json_dumps(definition.configuration)
+        cache.set(cache_key, encoded, ENCODED_CONFIGURATION_CACHE_TIMEOUT)
+    return PreEncodedJSON(definition.configuration, encoded)
+
+
+def get_accepted_encoding(request) -> Optional[str]:
+    """
+    Determine the (supported) content encoding for pre-compressed responses.
+    """
+    if not settings.API_PRECOMPRESSED_RESPONSES:
+        return None
+    accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+    accepted = {value.split(";")[0].strip() for value in accept_encoding.split(",")}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def get_compressed_configuration(
+    definition: FormDefinition, content_encoding: str
+) -> bytes:
+    cache_key = _get_cache_key(definition, content_encoding)
+    compressed = cache.get(cache_key)
+    if compressed is None:
+        encoded = get_pre_encoded_configuration(definition).encoded
+        if content_encoding == "br":
+            compressed = brotli.compress(encoded)
+        else:
+            compressed = gzip.compress(encoded)
+        cache.set(cache_key, compressed, ENCODED_CONFIGURATION_CACHE_TIMEOUT)
+    return compressed
@@ -1,3 +1,5 @@
+from typing import Set
+
 from django.utils.translation import ugettext_lazy as _
 
 from drf_polymorphic.serializers import PolymorphicSerializer
@@ -13,10 +15,11 @@ from ...authentication.registry import register as auth_register
 from ...payments.api.fields import PaymentOptionsReadOnlyField
 from ...payments.registry import register as payment_register
 from ...submissions.api.fields import URLRelatedField
-from ..constants import LogicActionTypes, PropertyTypes
+from ..constants import ImportStatuses, LogicActionTypes, PropertyTypes
 from ..custom_field_types import handle_custom_types
 from ..models import Form, FormDefinition, FormStep, FormVersion
 from ..models.form import FormLogic
+from .renderers import get_pre_encoded_configuration
 from .validators import JsonLogicValidator
 
 
@@ -199,7 +202,10 @@ class FormDefinitionSerializer(serializers.HyperlinkedModelSerializer):
         representation = super().to_representation(instance=instance)
 
         _handle_custom_types = self.context.get("handle_custom_types", True)
-        if _handle_custom_types:
+        if not _handle_custom_types:
+            # the configuration is emitted as-is, use the cached encoded version
+            representation["configuration"] = get_pre_encoded_configuration(instance)
+        else:
             representation["configuration"] = handle_custom_types(
                 representation["configuration"],
                 request=self.context["request"],
@@ -222,12 +228,20 @@ class FormDefinitionSerializer(serializers.HyperlinkedModelSerializer):
             "configuration",
             "login_required",
             "is_reusable",
+            "configuration_hash",
         )
         extra_kwargs = {
             "url": {
                 "view_name": "api:formdefinition-detail",
                 "lookup_field": "uuid",
-            }
+            },
+            "configuration_hash": {
+                "help_text": _(
+                    "Hash of the Form.io configuration. It changes whenever the "
+                    "configuration changes and can be used as a cheap version "
+                    "identifier or to find identical form definitions."
+                ),
+            },
         }
 
 
@@ -263,11 +277,23 @@ class FormDefinitionDetailSerializer(FormDefinitionSerializer):
         fields = FormDefinitionSerializer.Meta.fields + ("used_in",)
 
 
+class PreEncodedConfigurationField(serializers.JSONField):
+    """
+    Output the configuration of the form definition with its cached JSON encoding.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("source", "form_definition")
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value: FormDefinition):
+        return get_pre_encoded_configuration(value)
+
+
 class FormStepSerializer(serializers.HyperlinkedModelSerializer):
     index = serializers.IntegerField(source="order")
-    configuration = serializers.JSONField(
-        source="form_definition.configuration", read_only=True
-    )
+    configuration = PreEncodedConfigurationField()
     login_required = serializers.BooleanField(
         source="form_definition.login_required", read_only=True
     )
@@ -329,6 +355,45 @@ class FormImportSerializer(serializers.Serializer):
     )
 
 
+class FormImportJobSerializer(serializers.Serializer):
+    status_url = serializers.URLField(
+        label=_("status check endpoint"),
+        help_text=_(
+            "Large imports are processed in the background. Poll this endpoint to "
+            "check the progress of the import."
+        ),
+    )
+
+
+class FormImportStatusSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(
+        label=_("import status"),
+        choices=ImportStatuses,
+        help_text=_("The status of the background import."),
+    )
+    done = serializers.IntegerField(
+        label=_("processed entries"),
+        help_text=_("Number of imported resources (form definitions, steps...)."),
+    )
+    total = serializers.IntegerField(
+        label=_("total entries"),
+        help_text=_("Total number of resources in the import file."),
+    )
+    created_form_definitions = serializers.ListField(
+        child=serializers.SlugField(),
+        label=_("created form definitions"),
+        help_text=_(
+            "Slugs of the form definitions that were created because a different "
+            "form definition with the same slug already existed."
+        ),
+    )
+    error_message = serializers.CharField(
+        label=_("error information"),
+        allow_blank=True,
+        help_text=_("Error feedback in case the import failed."),
+    )
+
+
 class FormVersionSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = FormVersion
@@ -520,11 +585,7 @@ class FormLogicSerializer(serializers.HyperlinkedModelSerializer):
                 needle = first_operand.values[0].values[0]
             else:
                 needle = first_operand.values[0]
-            for component in form.iter_components(recursive=True):
-                if (key := component.get("key")) and key == needle:
-                    break
-            # executes if the break was not hit
-            else:
+            if needle not in self._get_component_keys(form):
                 raise serializers.ValidationError(
                     {
                         "json_logic_trigger": serializers.ValidationError(
@@ -537,3 +598,15 @@ class FormLogicSerializer(serializers.HyperlinkedModelSerializer):
                 )
 
         return data
+
+    def _get_component_keys(self, form: Form) -> Set[str]:
+        # cached on the (shared) serializer context - validating a batch of rules
+        # (many=True) would otherwise iterate over all the form components per rule
+        cache = self.context.setdefault("_form_component_keys", {})
+        if form.pk not in cache:
+            cache[form.pk] = {
+                key
+                for component in form.iter_components(recursive=True)
+                if (key := component.get("key"))
+            }
+        return cache[form.pk]
@@ -4,6 +4,8 @@ from django.db import transaction
 from django.db.models import Prefetch
 from django.http.response import HttpResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import patch_vary_headers
 from django.utils.translation import gettext_lazy as _
 
 from django_filters import rest_framework as filters
@@ -17,17 +19,42 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from openforms.api.pagination import PageNumberPagination
+from openforms.config.models import GlobalConfiguration
+from openforms.utils.api.views import ConditionalGetMixin, make_etag
 from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSetMixin
 
-from ..models import Form, FormDefinition, FormLogic, FormStep, FormVersion
-from ..utils import export_form, form_to_json, import_form
+from ..models import (
+    Form,
+    FormDefinition,
+    FormImportJob,
+    FormLogic,
+    FormStep,
+    FormVersion,
+)
+from ..tasks import import_form_task
+from ..utils import (
+    export_form,
+    form_to_json,
+    get_import_status,
+    import_form_data,
+    read_import_file,
+    should_import_in_background,
+)
 from .filters import FormLogicFilter
 from .parsers import IgnoreConfigurationFieldCamelCaseJSONParser
 from .permissions import IsStaffOrReadOnly
+from .renderers import (
+    IgnoreConfigurationFieldCamelCaseJSONRenderer,
+    get_accepted_encoding,
+    get_compressed_configuration,
+    get_pre_encoded_configuration,
+)
 from .serializers import (
     FormDefinitionDetailSerializer,
     FormDefinitionSerializer,
+    FormImportJobSerializer,
     FormImportSerializer,
+    FormImportStatusSerializer,
     FormLogicSerializer,
     FormSerializer,
     FormStepSerializer,
@@ -35,6 +62,22 @@ from .serializers import (
 )
 
 
+def get_literals_stamp() -> tuple:
+    """
+    Return the global configuration values that end up in the form (step) resources.
+    """
+    config = GlobalConfiguration.get_solo()
+    return (
+        config.form_begin_text,
+        config.form_previous_text,
+        config.form_change_text,
+        config.form_confirm_text,
+        config.form_step_previous_text,
+        config.form_step_save_text,
+        config.form_step_next_text,
+    )
+
+
 @extend_schema(
     parameters=[
         OpenApiParameter(
@@ -54,11 +97,13 @@ from .serializers import (
     destroy=extend_schema(summary=_("Delete a form step")),
 )
 class FormStepViewSet(
+    ConditionalGetMixin,
     NestedViewSetMixin,
     viewsets.ModelViewSet,
 ):
     serializer_class = FormStepSerializer
-    queryset = FormStep.objects.all().order_by("order")
+    queryset = FormStep.objects.select_related("form_definition").order_by("order")
+    renderer_classes = (IgnoreConfigurationFieldCamelCaseJSONRenderer,)
     permission_classes = [IsStaffOrReadOnly]
     lookup_field = "uuid"
 
@@ -67,6 +112,22 @@ class FormStepViewSet(
         context["form"] = get_object_or_404(Form, uuid=self.kwargs["form_uuid_or_slug"])
         return context
 
+    def get_etag(self, request):
+        stamps = (
+            self.filter_queryset(self.get_queryset())
+            .filter(uuid=self.kwargs[self.lookup_field])
+            .values_list("uuid", "order", "changed_on", "form_definition__changed_on")
+            .first()
+        )
+        if stamps is None:
+            return None
+        return make_etag(*stamps, *get_literals_stamp())
+
+    def retrieve(self, request, *args, **kwargs):
+        if (response := self.get_not_modified_response(request)) is not None:
+            return response
+        return super().retrieve(request, *args, **kwargs)
+
 
 @extend_schema_view(
     list=extend_schema(summary=_("List logic rules")),
@@ -113,8 +174,9 @@ class FormLogicViewSet(
         tags=["forms", "form-definitions"],
     ),
 )
-class FormDefinitionViewSet(viewsets.ModelViewSet):
+class FormDefinitionViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     parser_classes = (IgnoreConfigurationFieldCamelCaseJSONParser,)
+    renderer_classes = (IgnoreConfigurationFieldCamelCaseJSONRenderer,)
     queryset = FormDefinition.objects.order_by("slug")
     serializer_class = FormDefinitionSerializer
     pagination_class = PageNumberPagination
@@ -123,6 +185,19 @@ class FormDefinitionViewSet(viewsets.ModelViewSet):
     # The DRF settings apply some default throttling to mitigate abuse
     permission_classes = [IsStaffOrReadOnly]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "retrieve":
+            # used by FormDefinition.used_in
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "formstep_set",
+                    queryset=FormStep.objects.select_related("form"),
+                    to_attr="used_in_steps",
+                )
+            )
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "retrieve":
             return FormDefinitionDetailSerializer
@@ -132,6 +207,20 @@ class FormDefinitionViewSet(viewsets.ModelViewSet):
         context = super().get_serializer_context()
         return {**context, "handle_custom_types": False}
 
+    def get_etag(self, request):
+        stamps = (
+            self.get_queryset()
+            .prefetch_related(None)
+            .filter(uuid=self.kwargs[self.lookup_field])
+            .values_list("uuid", "changed_on")
+            .first()
+        )
+        if stamps is None:
+            return None
+        # the configuration is served compressed (gzip, brotli) or as is - the
+        # representations differ per content encoding, so the ETag is weak
+        return make_etag(*stamps, weak=self.action == "configuration")
+
     @extend_schema(
         summary=_("Retrieve form definition JSON schema"),
         tags=["forms"],
@@ -146,8 +235,25 @@ class FormDefinitionViewSet(viewsets.ModelViewSet):
         theory, this can be fed directly to a FormIO.js renderer, but note that there
         may be custom field types in play.
         """
+        if (response := self.get_not_modified_response(request)) is not None:
+            return response
         definition = self.get_object()
-        return Response(data=definition.configuration, status=status.HTTP_200_OK)
+
+        content_encoding = get_accepted_encoding(request)
+        if content_encoding is not None:
+            response = HttpResponse(
+                get_compressed_configuration(definition, content_encoding),
+                content_type="application/json",
+            )
+            response["Content-Encoding"] = content_encoding
+            patch_vary_headers(response, ("Accept-Encoding",))
+            return response
+
+        response = Response(
+            data=get_pre_encoded_configuration(definition), status=status.HTTP_200_OK
+        )
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
 
 
 UUID_OR_SLUG_PARAMETER = OpenApiParameter(
@@ -188,7 +294,7 @@ UUID_OR_SLUG_PARAMETER = OpenApiParameter(
         parameters=[UUID_OR_SLUG_PARAMETER],
     ),
 )
-class FormViewSet(viewsets.ModelViewSet):
+class FormViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     Manage forms.
 
@@ -198,7 +304,7 @@ class FormViewSet(viewsets.ModelViewSet):
     re-used among different forms.
     """
 
-    queryset = Form.objects.all().prefetch_related(
+    queryset = Form.objects.select_related("product").prefetch_related(
         Prefetch(
             "formstep_set",
             queryset=FormStep.objects.select_related("form_definition").order_by(
@@ -236,6 +342,29 @@ class FormViewSet(viewsets.ModelViewSet):
 
         return request
 
+    def get_etag(self, request):
+        # don't trigger the prefetches - only the version stamps are needed
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        if self.action == "retrieve":
+            lookup = {self.lookup_field: self.kwargs[self.lookup_url_kwarg]}
+            queryset = queryset.filter(**lookup)
+        stamps = list(
+            queryset.order_by("pk").values_list("uuid", "changed_on", "product__price")
+        )
+        if self.action == "retrieve" and not stamps:
+            return None
+        return make_etag(*stamps, *get_literals_stamp())
+
+    def list(self, request, *args, **kwargs):
+        if (response := self.get_not_modified_response(request)) is not None:
+            return response
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        if (response := self.get_not_modified_response(request)) is not None:
+            return response
+        return super().retrieve(request, *args, **kwargs)
+
     @extend_schema(
         summary=_("Copy form"),
         tags=["forms"],
@@ -358,7 +487,8 @@ class FormViewSet(viewsets.ModelViewSet):
 )
 class FormVersionViewSet(NestedViewSetMixin, ListModelMixin, viewsets.GenericViewSet):
     serializer_class = FormVersionSerializer
-    queryset = FormVersion.objects.all()
+    # the manifest is only needed to restore a version
+    queryset = FormVersion.objects.defer("manifest")
     permission_classes = [IsStaffOrReadOnly]
     lookup_field = "uuid"
     parent_lookup_kwargs = {"form_uuid_or_slug": "form__uuid"}
@@ -394,16 +524,52 @@ class FormsImportAPIView(views.APIView):
     @extend_schema(
         summary=_("Import form"),
         tags=["forms"],
-        responses={"204": {"description": _("No response body")}},
+        responses={
+            "204": {"description": _("No response body")},
+            "202": FormImportJobSerializer,
+        },
     )
     def post(self, request, *args, **kwargs):
         """
         Import a Form by uploading a .zip file containing a Form, FormDefinitions
         and FormSteps
+
+        Large imports are processed in the background - the response then contains
+        the URL to check the progress of the import.
         """
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        import_form(serializer.validated_data["file"])
+        import_file = serializer.validated_data["file"]
+        import_data = read_import_file(import_file)
+        if not should_import_in_background(import_data):
+            import_form_data(import_data)
+            return response.Response(status=status.HTTP_204_NO_CONTENT)
+
+        # only the reference to the stored export is passed to the background task
+        job = FormImportJob.objects.create(file=import_file, created_by=request.user)
+        async_result = import_form_task.delay(job.id)
+        status_url = request.build_absolute_uri(
+            reverse("api:forms-import-status", kwargs={"task_id": async_result.id})
+        )
+        job_serializer = FormImportJobSerializer(instance={"status_url": status_url})
+        return response.Response(job_serializer.data, status=status.HTTP_202_ACCEPTED)
 
-        return response.Response(status=status.HTTP_204_NO_CONTENT)
+
+class FormsImportStatusAPIView(views.APIView):
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [permissions.IsAdminUser]
+
+    @extend_schema(
+        summary=_("Get the form import status"),
+        tags=["forms"],
+        responses={"200": FormImportStatusSerializer},
+    )
+    def get(self, request, task_id, *args, **kwargs):
+        """
+        Obtain the progress of a form import that is processed in the background.
+        """
+        serializer = FormImportStatusSerializer(
+            instance=get_import_status(str(task_id))
+        )
+        return response.Response(serializer.data)
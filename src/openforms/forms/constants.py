@@ -24,3 +24,14 @@ class LogicActionTypes(DjangoChoices):
 class PropertyTypes(DjangoChoices):
     bool = ChoiceItem("bool", _("Boolean"))
     json = ChoiceItem("json", _("JSON"))
+
+
+# custom celery task state to report the progress of background form imports
+IMPORT_PROGRESS_STATE = "PROGRESS"
+
+
+class ImportStatuses(DjangoChoices):
+    pending = ChoiceItem("pending", _("Pending"))
+    in_progress = ChoiceItem("in_progress", _("In progress"))
+    done = ChoiceItem("done", _("Done"))
+    failed = ChoiceItem("failed", _("Failed"))
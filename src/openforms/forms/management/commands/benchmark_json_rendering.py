@@ -0,0 +1,94 @@
+import time
+from typing import Callable
+
+from django.core.management import BaseCommand
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+
+from openforms.api.renderers import PreEncodedJSON, json_dumps, orjson
+
+from ...api.renderers import IgnoreConfigurationFieldCamelCaseJSONRenderer
+
+
+def generate_configuration(num_components: int) -> dict:
+    return {
+        "display": "form",
+        "components": [
+            {
+                "type": "textfield",
+                "key": f"field{index}",
+                "label": f"Field {index}",
+                "input": True,
+                "validate": {"required": bool(index % 2), "maxLength": 1000},
+                "conditional": {"show": None, "when": None, "eq": ""},
+                "prefill": {"plugin": "", "attribute": ""},
+                "defaultValue": "",
+                "properties": {},
+                "data": {"values": [{"label": "Option", "value": "option"}]},
+            }
+            for index in range(num_components)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the throughput of rendering form step responses with large "
+        "form definitions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--components",
+            type=int,
+            default=500,
+            help="Number of components in the generated form definition.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Number of renders per strategy.",
+        )
+
+    def handle(self, **options):
+        configuration = generate_configuration(options["components"])
+        iterations = options["iterations"]
+        response_data = {
+            "uuid": "f8b0c3a8-bc2b-4cd6-a1c7-2f1c5b8e2c5f",
+            "index": 0,
+            "slug": "large-step",
+            "internal_name": "",
+            "literals": {"previous_text": {"resolved": "Previous", "value": ""}},
+            "configuration": configuration,
+        }
+        pre_encoded = {
+            **response_data,
+            "configuration": PreEncodedJSON(configuration, json_dumps(configuration)),
+        }
+
+        self.stdout.write(
+            f"JSON library: {'orjson' if orjson is not None else 'json (stdlib)'}, "
+            f"{options['components']} components, {iterations} iterations"
+        )
+        camel_case = CamelCaseJSONRenderer()
+        opaque = IgnoreConfigurationFieldCamelCaseJSONRenderer()
+        strategies = [
+            ("camelCase renderer", lambda: camel_case.render(response_data)),
+            ("opaque fields renderer", lambda: opaque.render(response_data)),
+            ("pre-encoded configuration", lambda: opaque.render(pre_encoded)),
+        ]
+        for label, render in strategies:
+            self._run(label, render, iterations)
+
+    def _run(self, label: str, render: Callable[[], bytes], iterations: int):
+        size = len(render())
+        start = time.perf_counter()
+        for _ in range(iterations):
+            render()
+        duration = time.perf_counter() - start
+
+        self.stdout.write(
+            f"{label:<28} {iterations / duration:>10.1f} renders/s "
+            f"{size * iterations / duration / 1024 / 1024:>8.1f} MiB/s"
+        )
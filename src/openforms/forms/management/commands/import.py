@@ -21,7 +21,11 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         import_file = options["import_file"]
 
+        def report_progress(done: int, total: int) -> None:
+            if options["verbosity"] >= 2:
+                self.stdout.write(f"Imported {done}/{total} entries")
+
         try:
-            import_form(import_file)
+            import_form(import_file, progress_callback=report_progress)
         except ValidationError as e:
             raise CommandError(e) from e
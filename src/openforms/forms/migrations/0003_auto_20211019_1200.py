@@ -0,0 +1,47 @@
+# Generated by Django 2.2.24 on 2021-10-19 12:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0002_auto_20210917_1114"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="form",
+            name="changed_on",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                help_text="Timestamp of the last change to the form or any of its steps. Used as version stamp for (HTTP) caching.",
+                verbose_name="changed on",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="formdefinition",
+            name="changed_on",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                help_text="Used as version stamp for (HTTP) caching.",
+                verbose_name="changed on",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="formstep",
+            name="changed_on",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                help_text="Used as version stamp for (HTTP) caching.",
+                verbose_name="changed on",
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 2.2.24 on 2021-10-20 09:00
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0003_auto_20211019_1200"),
+    ]
+
+    operations = [
+        # a default allows to reverse the removal of the field
+        migrations.AlterField(
+            model_name="formversion",
+            name="export_blob",
+            field=django.contrib.postgres.fields.jsonb.JSONField(
+                default=dict,
+                help_text="The form, form definitions and form steps that make up this version, saved as JSON data.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="FormVersionChunk",
+            fields=[
+                (
+                    "digest",
+                    models.CharField(
+                        help_text="SHA-256 hex digest of the (uncompressed) content.",
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="digest",
+                    ),
+                ),
+                (
+                    "content",
+                    models.BinaryField(
+                        help_text="zlib-compressed JSON.", verbose_name="content"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "form version chunk",
+                "verbose_name_plural": "form version chunks",
+            },
+        ),
+        migrations.AddField(
+            model_name="formversion",
+            name="manifest",
+            field=django.contrib.postgres.fields.jsonb.JSONField(
+                default=dict,
+                help_text="The form, form definitions and form steps that make up this version, with references to the (shared) chunks holding the large values.",
+                verbose_name="manifest",
+            ),
+        ),
+        migrations.AddField(
+            model_name="formversion",
+            name="chunks",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="form_versions",
+                to="forms.FormVersionChunk",
+                verbose_name="chunks",
+            ),
+        ),
+    ]
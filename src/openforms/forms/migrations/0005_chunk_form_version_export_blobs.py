@@ -0,0 +1,53 @@
+# Generated by Django 2.2.24 on 2021-10-20 09:01
+
+from django.db import migrations
+
+from openforms.forms.versioning import get_chunk_digests, join_export, split_export
+
+
+def split_export_blobs(apps, _):
+    FormVersion = apps.get_model("forms", "FormVersion")
+    FormVersionChunk = apps.get_model("forms", "FormVersionChunk")
+
+    for version in FormVersion.objects.iterator():
+        manifest, chunks = split_export(version.export_blob)
+        existing = set(
+            FormVersionChunk.objects.filter(digest__in=chunks).values_list(
+                "digest", flat=True
+            )
+        )
+        FormVersionChunk.objects.bulk_create(
+            [
+                FormVersionChunk(digest=digest, content=content)
+                for digest, content in chunks.items()
+                if digest not in existing
+            ]
+        )
+        version.manifest = manifest
+        version.save(update_fields=["manifest"])
+        version.chunks.set(chunks.keys())
+
+
+def join_export_blobs(apps, _):
+    FormVersion = apps.get_model("forms", "FormVersion")
+    FormVersionChunk = apps.get_model("forms", "FormVersionChunk")
+
+    for version in FormVersion.objects.iterator():
+        chunks = dict(
+            FormVersionChunk.objects.filter(
+                digest__in=get_chunk_digests(version.manifest)
+            ).values_list("digest", "content")
+        )
+        version.export_blob = join_export(version.manifest, chunks)
+        version.save(update_fields=["export_blob"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0004_auto_20211020_0900"),
+    ]
+
+    operations = [
+        migrations.RunPython(split_export_blobs, join_export_blobs),
+    ]
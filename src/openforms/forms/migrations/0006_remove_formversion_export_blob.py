@@ -0,0 +1,17 @@
+# Generated by Django 2.2.24 on 2021-10-20 09:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0005_chunk_form_version_export_blobs"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="formversion",
+            name="export_blob",
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 2.2.24 on 2021-10-21 10:00
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+
+def set_configuration_hash(apps, _):
+    FormDefinition = apps.get_model("forms", "FormDefinition")
+    for form_definition in FormDefinition.objects.iterator():
+        form_definition.configuration_hash = hashlib.md5(
+            json.dumps(form_definition.configuration, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        form_definition.save(update_fields=["configuration_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0006_remove_formversion_export_blob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formdefinition",
+            name="configuration_hash",
+            field=models.CharField(
+                db_index=True,
+                default="",
+                editable=False,
+                help_text="MD5 hash of the (canonical) Form.io configuration, maintained on save.",
+                max_length=32,
+                verbose_name="configuration hash",
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(set_configuration_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 2.2.24 on 2021-10-28 09:12
+
+import uuid
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+import privates.fields
+import privates.storages
+
+import openforms.utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("forms", "0007_formdefinition_configuration_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FormImportJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    openforms.utils.fields.StringUUIDField(
+                        default=uuid.uuid4, unique=True, verbose_name="UUID"
+                    ),
+                ),
+                (
+                    "file",
+                    privates.fields.PrivateMediaFileField(
+                        blank=True,
+                        help_text="The uploaded form export, removed once it's processed.",
+                        storage=privates.storages.PrivateMediaFileSystemStorage(),
+                        upload_to="form-imports/",
+                        verbose_name="file",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created on"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("in_progress", "In progress"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=50,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "error_message",
+                    models.TextField(blank=True, verbose_name="error message"),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="created by",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "form import",
+                "verbose_name_plural": "form imports",
+                "ordering": ("-created_on",),
+            },
+        ),
+    ]
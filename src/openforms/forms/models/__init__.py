@@ -1,6 +1,15 @@
 from .form import Form, FormLogic
 from .form_definition import FormDefinition
+from .form_import import FormImportJob
 from .form_step import FormStep
-from .form_version import FormVersion
+from .form_version import FormVersion, FormVersionChunk
 
-__all__ = ["Form", "FormDefinition", "FormStep", "FormVersion", "FormLogic"]
+__all__ = [
+    "Form",
+    "FormDefinition",
+    "FormImportJob",
+    "FormStep",
+    "FormVersion",
+    "FormVersionChunk",
+    "FormLogic",
+]
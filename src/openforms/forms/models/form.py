@@ -1,10 +1,11 @@
 import uuid as _uuid
 from copy import deepcopy
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
 from django.contrib.postgres.fields import JSONField
 from django.core.validators import MinValueValidator
 from django.db import models, transaction
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from autoslug import AutoSlugField
@@ -22,6 +23,9 @@ from openforms.utils.fields import StringUUIDField
 
 from .utils import literal_getter
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .form_step import FormStep
+
 
 class FormQuerySet(models.QuerySet):
     def live(self):
@@ -139,6 +143,14 @@ class Form(models.Model):
         ),
     )
     _is_deleted = models.BooleanField(default=False)
+    changed_on = models.DateTimeField(
+        _("changed on"),
+        auto_now=True,
+        help_text=_(
+            "Timestamp of the last change to the form or any of its steps. Used as "
+            "version stamp for (HTTP) caching."
+        ),
+    )
 
     # Data removal
     successful_submissions_removal_limit = models.PositiveIntegerField(
@@ -270,14 +282,28 @@ class Form(models.Model):
         "authentication backend(s)"
     )
 
+    def _get_prefetched_steps(self) -> Optional[List["FormStep"]]:
+        """
+        Return the form steps if they were prefetched, ``None`` otherwise.
+
+        Prefetch the steps with their form definitions (``select_related``) to avoid
+        queries per step.
+        """
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "formstep_set" not in prefetched:
+            return None
+        return list(prefetched["formstep_set"])
+
+    def _get_steps_with_definitions(self) -> Iterable["FormStep"]:
+        if (steps := self._get_prefetched_steps()) is not None:
+            return steps
+        return self.formstep_set.select_related("form_definition")
+
     @property
     def login_required(self) -> bool:
-        return any(
-            [
-                form_step.form_definition.login_required
-                for form_step in self.formstep_set.all()
-            ]
-        )
+        if (steps := self._get_prefetched_steps()) is not None:
+            return any(step.form_definition.login_required for step in steps)
+        return self.formstep_set.filter(form_definition__login_required=True).exists()
 
     @property
     def payment_required(self) -> bool:
@@ -286,6 +312,8 @@ class Form(models.Model):
 
     @property
     def first_step(self):
+        if (steps := self._get_prefetched_steps()) is not None:
+            return min(step.order for step in steps)
         return self.formstep_set.first().order
 
     @transaction.atomic
@@ -315,14 +343,26 @@ class Form(models.Model):
 
     def get_keys_for_email_confirmation(self) -> List[str]:
         return_keys = set()
-        for form_step in self.formstep_set.select_related("form_definition"):
+        for form_step in self._get_steps_with_definitions():
             for key in form_step.form_definition.get_keys_for_email_confirmation():
                 if key:
                     return_keys.add(key)
         return list(return_keys)
 
+    @cached_property
+    def email_summary_keys(self) -> List[Tuple[str, str]]:
+        """
+        The key and label of the fields to include in the e-mail summary.
+        """
+        from .form_definition import FormDefinition
+
+        keys = []
+        for form_definition in FormDefinition.objects.filter(formstep__form=self):
+            keys += form_definition.get_keys_for_email_summary()
+        return keys
+
     def iter_components(self, recursive=True):
-        for form_step in self.formstep_set.select_related("form_definition"):
+        for form_step in self._get_steps_with_definitions():
             yield from form_step.iter_components(recursive=recursive)
 
     @transaction.atomic
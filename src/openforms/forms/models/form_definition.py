@@ -3,7 +3,7 @@ import json
 import uuid
 from copy import deepcopy
 from functools import partial
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from django.conf import settings
 from django.contrib.postgres.fields import JSONField
@@ -52,13 +52,35 @@ class FormDefinition(models.Model):
         default=False,
         help_text="Allow this definition to be re-used in multiple forms",
     )
+    changed_on = models.DateTimeField(
+        _("changed on"),
+        auto_now=True,
+        help_text=_("Used as version stamp for (HTTP) caching."),
+    )
+    configuration_hash = models.CharField(
+        _("configuration hash"),
+        max_length=32,
+        editable=False,
+        db_index=True,
+        help_text=_(
+            "MD5 hash of the (canonical) Form.io configuration, maintained on save."
+        ),
+    )
 
     def __str__(self):
         return self.admin_name
 
     def save(self, *args, **kwargs):
+        self.configuration_hash = self.get_hash()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "configuration" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "configuration_hash"}
         super().save(*args, **kwargs)
 
+        # the forms using this definition display its name, slug...
+        Form.objects.filter(formstep__form_definition=self).update(
+            changed_on=self.changed_on
+        )
         self._check_configuration_integrity()
 
     def get_absolute_url(self):
@@ -89,14 +111,22 @@ class FormDefinition(models.Model):
         return copy
 
     @property
-    def used_in(self) -> models.QuerySet:
+    def used_in(self) -> Union[models.QuerySet, List[Form]]:
         """
         Query the forms that make use of this definition.
 
-        (Soft) deleted forms are excluded from this. This property is not intended
-        to be used in bulk Form Definition querysets, you should use prefetch queries
-        for that.
+        (Soft) deleted forms are excluded from this. To use this in bulk Form
+        Definition querysets, prefetch the steps with their forms with
+        ``Prefetch("formstep_set", queryset=..., to_attr="used_in_steps")`` - the
+        prefetched steps are used instead of running a query per definition.
         """
+        if (steps := getattr(self, "used_in_steps", None)) is not None:
+            forms = {step.form.pk: step.form for step in steps}
+            return sorted(
+                (form for form in forms.values() if not form._is_deleted),
+                key=lambda form: form.name,
+            )
+
         return (
             Form.objects.filter(
                 _is_deleted=False,
@@ -106,7 +136,12 @@ class FormDefinition(models.Model):
             .order_by("name")
         )
 
-    def get_hash(self):
+    def get_hash(self) -> str:
+        """
+        Calculate the hash of the configuration.
+
+        Use the stored :attr:`configuration_hash` to look up identical definitions.
+        """
         return hashlib.md5(
             json.dumps(self.configuration, sort_keys=True).encode("utf-8")
         ).hexdigest()
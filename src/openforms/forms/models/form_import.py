@@ -0,0 +1,52 @@
+import uuid as _uuid
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from privates.fields import PrivateMediaFileField
+
+from openforms.utils.fields import StringUUIDField
+
+from ..constants import ImportStatuses
+
+
+class FormImportJob(models.Model):
+    """
+    A form export that is imported in the background.
+
+    The uploaded file is stored until the import is done, so that only the ID of the
+    job is sent to the background task.
+    """
+
+    uuid = StringUUIDField(_("UUID"), unique=True, default=_uuid.uuid4)
+    file = PrivateMediaFileField(
+        _("file"),
+        upload_to="form-imports/",
+        blank=True,
+        help_text=_("The uploaded form export, removed once it's processed."),
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("created by"),
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    created_on = models.DateTimeField(_("created on"), auto_now_add=True)
+    status = models.CharField(
+        _("status"),
+        max_length=50,
+        choices=ImportStatuses.choices,
+        default=ImportStatuses.pending,
+    )
+    error_message = models.TextField(_("error message"), blank=True)
+
+    class Meta:
+        verbose_name = _("form import")
+        verbose_name_plural = _("form imports")
+        ordering = ("-created_on",)
+
+    def __str__(self):
+        return _("Form import of {created_on}").format(created_on=self.created_on)
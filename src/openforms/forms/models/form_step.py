@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from ordered_model.models import OrderedModel
@@ -61,6 +62,12 @@ class FormStep(OrderedModel):
         ),
     )
 
+    changed_on = models.DateTimeField(
+        _("changed on"),
+        auto_now=True,
+        help_text=_("Used as version stamp for (HTTP) caching."),
+    )
+
     order_with_respect_to = "form"
 
     get_previous_text = literal_getter("previous_text", "form_step_previous_text")
@@ -74,5 +81,20 @@ class FormStep(OrderedModel):
     def __str__(self):
         return _("Form step {order}").format(order=self.order)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._touch_form()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._touch_form()
+        return result
+
+    def _touch_form(self):
+        # adding, removing or changing steps changes the form as a whole
+        from .form import Form
+
+        Form.objects.filter(pk=self.form_id).update(changed_on=timezone.now())
+
     def iter_components(self, recursive=True):
         yield from self.form_definition.iter_components(recursive=recursive)
@@ -1,11 +1,35 @@
 import uuid as _uuid
+from typing import Dict, Optional
 
 from django.contrib.postgres.fields.jsonb import JSONField
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 from openforms.utils.fields import StringUUIDField
 
+from ..versioning import get_chunk_digests, join_export, split_export
+
+
+class FormVersionChunk(models.Model):
+    """
+    Compressed JSON content shared by form versions, keyed by its SHA-256 digest.
+    """
+
+    digest = models.CharField(
+        _("digest"),
+        max_length=64,
+        primary_key=True,
+        help_text=_("SHA-256 hex digest of the (uncompressed) content."),
+    )
+    content = models.BinaryField(_("content"), help_text=_("zlib-compressed JSON."))
+
+    class Meta:
+        verbose_name = _("form version chunk")
+        verbose_name_plural = _("form version chunks")
+
+    def __str__(self):
+        return self.digest
+
 
 class FormVersion(models.Model):
     uuid = StringUUIDField(_("UUID"), unique=True, default=_uuid.uuid4)
@@ -20,11 +44,23 @@ class FormVersion(models.Model):
         to="forms.Form",
         on_delete=models.CASCADE,
     )
-    export_blob = JSONField(
+    manifest = JSONField(
+        _("manifest"),
+        default=dict,
         help_text=_(
-            "The form, form definitions and form steps that make up this version, saved as JSON data."
+            "The form, form definitions and form steps that make up this version, "
+            "with references to the (shared) chunks holding the large values."
         ),
     )
+    chunks = models.ManyToManyField(
+        FormVersionChunk,
+        verbose_name=_("chunks"),
+        related_name="form_versions",
+        blank=True,
+    )
+
+    _export_blob: Optional[Dict[str, str]] = None
+    _export_blob_changed = False
 
     class Meta:
         verbose_name = _("form version")
@@ -32,3 +68,50 @@ class FormVersion(models.Model):
 
     def __str__(self):
         return f"{self.form.admin_name} ({self.created})"
+
+    @property
+    def export_blob(self) -> Dict[str, str]:
+        """
+        The form export of this version, with all chunk references resolved.
+        """
+        if self._export_blob is None:
+            digests = get_chunk_digests(self.manifest)
+            chunks = dict(
+                FormVersionChunk.objects.filter(digest__in=digests).values_list(
+                    "digest", "content"
+                )
+            )
+            self._export_blob = join_export(self.manifest, chunks)
+        return self._export_blob
+
+    @export_blob.setter
+    def export_blob(self, value: Dict[str, str]) -> None:
+        self._export_blob = value
+        self._export_blob_changed = True
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        if not self._export_blob_changed:
+            return super().save(*args, **kwargs)
+
+        self.manifest, chunks = split_export(self._export_blob)
+        # most chunks are shared with earlier versions - don't send them again. The
+        # existing chunks are locked until they're referenced by this version, so that
+        # the cleanup of unused chunks doesn't remove them in the meantime.
+        existing = set(
+            FormVersionChunk.objects.select_for_update()
+            .filter(digest__in=chunks)
+            .order_by("digest")
+            .values_list("digest", flat=True)
+        )
+        FormVersionChunk.objects.bulk_create(
+            [
+                FormVersionChunk(digest=digest, content=content)
+                for digest, content in chunks.items()
+                if digest not in existing
+            ],
+            ignore_conflicts=True,
+        )
+        super().save(*args, **kwargs)
+        self.chunks.set(chunks.keys())
+        self._export_blob_changed = False
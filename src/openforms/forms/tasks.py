@@ -1,9 +1,13 @@
 import copy
 import logging
+from typing import List
+
+from django.db import transaction
 
 from djangorestframework_camel_case.util import camelize
 
 from ..celery import app
+from .constants import IMPORT_PROGRESS_STATE
 
 logger = logging.getLogger(__name__)
 
@@ -43,3 +47,65 @@ def detect_formiojs_configuration_snake_case(
         logger.error(error_msg, *error_msg_args)
         if raise_exception:
             raise Exception(error_msg % error_msg_args)
+
+
+@app.task(bind=True)
+def import_form_task(self, job_id: int) -> List[str]:
+    """
+    Import a (large) form export in the background.
+
+    The export is stored on a :class:`openforms.forms.models.FormImportJob`, which
+    records the outcome of the import so that failures show up in the admin. The
+    progress is reported as custom task state, see
+    :class:`openforms.forms.api.serializers.FormImportStatusSerializer`.
+    """
+    from .constants import ImportStatuses
+    from .models import FormImportJob
+    from .utils import import_form_data, read_import_file
+
+    job = FormImportJob.objects.get(id=job_id)
+    job.status = ImportStatuses.in_progress
+    job.save(update_fields=["status"])
+
+    def report_progress(done: int, total: int) -> None:
+        self.update_state(
+            state=IMPORT_PROGRESS_STATE, meta={"done": done, "total": total}
+        )
+
+    try:
+        with job.file.open("rb") as import_file:
+            import_data = read_import_file(import_file)
+        created_fds = import_form_data(import_data, progress_callback=report_progress)
+    except Exception as exc:
+        logger.exception("Background import %s of a form failed", job.uuid)
+        job.status = ImportStatuses.failed
+        job.error_message = str(exc)
+        raise
+    else:
+        job.status = ImportStatuses.done
+    finally:
+        # the export is only needed for the import itself
+        job.file.delete(save=False)
+        job.save()
+
+    return created_fds
+
+
+@app.task(ignore_result=True)
+def cleanup_unused_form_version_chunks() -> None:
+    """
+    Delete the form version chunks that are no longer referenced by any version.
+
+    The chunks that are locked by a :meth:`FormVersion.save` in progress are about to
+    be referenced again, these are skipped.
+    """
+    from .models import FormVersionChunk
+
+    with transaction.atomic():
+        unused = (
+            FormVersionChunk.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(form_versions__isnull=True)
+            .values_list("digest", flat=True)
+        )
+        deleted, _ = FormVersionChunk.objects.filter(digest__in=list(unused)).delete()
+    logger.info("Deleted %d unused form version chunks", deleted)
@@ -377,3 +377,23 @@ class FormAdminActionsTests(WebTest):
 
         self.form.refresh_from_db()
         self.assertFalse(self.form.maintenance_mode)
+
+    def test_maintenance_mode_actions_change_the_etag(self):
+        api_url = reverse("api:form-detail", kwargs={"uuid_or_slug": self.form.uuid})
+        etag = self.client.get(api_url)["ETag"]
+
+        for action in ("set_to_maintenance_mode", "remove_from_maintenance_mode"):
+            with self.subTest(action=action):
+                response = self.app.get(
+                    reverse("admin:forms_form_changelist"), user=self.user
+                )
+                html_form = response.forms["changelist-form"]
+                html_form["action"] = action
+                html_form["_selected_action"] = [self.form.pk]
+                html_form.submit()
+
+                response = self.client.get(api_url, HTTP_IF_NONE_MATCH=etag)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response["ETag"], etag)
+                etag = response["ETag"]
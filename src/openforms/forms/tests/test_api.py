@@ -20,7 +20,9 @@ from openforms.config.models import GlobalConfiguration
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.tests.utils import NOOP_CACHES
 
-from ..models import Form, FormDefinition, FormStep
+from ..constants import ImportStatuses
+from ..models import Form, FormDefinition, FormImportJob, FormStep
+from ..tasks import import_form_task
 from .factories import FormDefinitionFactory, FormFactory, FormStepFactory
 
 
@@ -1615,6 +1617,109 @@ class ImportExportAPITests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    @override_settings(FORMS_IMPORT_BACKGROUND_THRESHOLD=0)
+    @patch("openforms.forms.api.viewsets.import_form_task.delay")
+    def test_large_form_import_is_processed_in_background(self, mock_delay):
+        self.user.is_staff = True
+        self.user.save()
+        task_id = "7f6d3b3e-4ddd-4a9e-86d9-1b0e6bd2e7b5"
+        mock_delay.return_value.id = task_id
+        form = FormFactory.create()
+        FormStepFactory.create(form=form)
+        export = self.client.post(
+            reverse("api:form-export", args=(form.uuid,)),
+            format="json",
+            HTTP_AUTHORIZATION=f"Token {self.token.key}",
+        )
+
+        response = self.client.post(
+            reverse("api:forms-import"),
+            {"file": SimpleUploadedFile("file.zip", export.content)},
+            format="multipart",
+            HTTP_AUTHORIZATION=f"Token {self.token.key}",
+            HTTP_CONTENT_DISPOSITION="attachment;filename=file.zip",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(
+            response.json()["statusUrl"],
+            f"http://testserver/api/v1/forms-import/{task_id}/status",
+        )
+        job = FormImportJob.objects.get()
+        self.assertEqual(job.created_by, self.user)
+        self.assertEqual(job.status, ImportStatuses.pending)
+        mock_delay.assert_called_once_with(job.id)
+        self.assertEqual(Form.objects.count(), 1)
+
+        form.delete()
+
+        with patch.object(import_form_task, "update_state"):
+            import_form_task(job.id)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportStatuses.done)
+        self.assertFalse(job.file)
+        self.assertEqual(Form.objects.get().slug, form.slug)
+
+    @override_settings(FORMS_IMPORT_BACKGROUND_THRESHOLD=0)
+    @patch("openforms.forms.api.viewsets.import_form_task.delay")
+    def test_failed_background_import_is_recorded(self, mock_delay):
+        self.user.is_staff = True
+        self.user.save()
+        mock_delay.return_value.id = "7f6d3b3e-4ddd-4a9e-86d9-1b0e6bd2e7b5"
+        form = FormFactory.create(slug="existing")
+        FormStepFactory.create(form=form)
+        export = self.client.post(
+            reverse("api:form-export", args=(form.uuid,)),
+            format="json",
+            HTTP_AUTHORIZATION=f"Token {self.token.key}",
+        )
+        self.client.post(
+            reverse("api:forms-import"),
+            {"file": SimpleUploadedFile("file.zip", export.content)},
+            format="multipart",
+            HTTP_AUTHORIZATION=f"Token {self.token.key}",
+            HTTP_CONTENT_DISPOSITION="attachment;filename=file.zip",
+        )
+        job = FormImportJob.objects.get()
+
+        with patch(
+            "openforms.forms.utils.import_form_data",
+            side_effect=ValueError("Broken export"),
+        ):
+            with self.assertRaises(ValueError):
+                import_form_task(job.id)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportStatuses.failed)
+        self.assertEqual(job.error_message, "Broken export")
+        self.assertFalse(job.file)
+
+    @patch("openforms.forms.utils.AsyncResult")
+    def test_form_import_status(self, mock_AsyncResult):
+        self.user.is_staff = True
+        self.user.save()
+        mock_AsyncResult.return_value.state = "PROGRESS"
+        mock_AsyncResult.return_value.info = {"done": 12, "total": 340}
+        url = reverse(
+            "api:forms-import-status",
+            kwargs={"task_id": "7f6d3b3e-4ddd-4a9e-86d9-1b0e6bd2e7b5"},
+        )
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "status": "in_progress",
+                "done": 12,
+                "total": 340,
+                "createdFormDefinitions": [],
+                "errorMessage": "",
+            },
+        )
+
 
 class CopyFormAPITests(APITestCase):
     def setUp(self):
@@ -0,0 +1,131 @@
+from django.test import override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openforms.accounts.tests.factories import StaffUserFactory
+
+from .factories import FormDefinitionFactory, FormFactory, FormStepFactory
+
+
+class ConditionalRequestsTests(APITestCase):
+    def test_form_detail_not_modified(self):
+        form = FormFactory.create()
+        FormStepFactory.create(form=form)
+        url = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+
+        response = self.client.get(url)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("public", response["Cache-Control"])
+
+    def test_form_detail_modified_by_step_change(self):
+        form = FormFactory.create()
+        step = FormStepFactory.create(form=form)
+        url = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+        etag = self.client.get(url)["ETag"]
+
+        step.next_text = "Volgende"
+        step.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_form_detail_modified_by_definition_change(self):
+        form = FormFactory.create()
+        step = FormStepFactory.create(form=form)
+        url = reverse("api:form-detail", kwargs={"uuid_or_slug": form.slug})
+        etag = self.client.get(url)["ETag"]
+
+        step.form_definition.name = "Changed"
+        step.form_definition.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_form_list_modified_by_new_form(self):
+        FormFactory.create()
+        url = reverse("api:form-list")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        FormFactory.create()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_form_step_detail_not_modified(self):
+        step = FormStepFactory.create()
+        url = reverse(
+            "api:form-steps-detail",
+            kwargs={"form_uuid_or_slug": step.form.uuid, "uuid": step.uuid},
+        )
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        step.form_definition.configuration = {"components": []}
+        step.form_definition.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_form_definition_configuration_not_modified(self):
+        definition = FormDefinitionFactory.create()
+        url = reverse(
+            "api:formdefinition-configuration", kwargs={"uuid": definition.uuid}
+        )
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @override_settings(API_PRECOMPRESSED_RESPONSES=True)
+    def test_form_definition_configuration_etag_is_weak(self):
+        definition = FormDefinitionFactory.create()
+        url = reverse(
+            "api:formdefinition-configuration", kwargs={"uuid": definition.uuid}
+        )
+
+        compressed = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        identity = self.client.get(url)
+
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Encoding", identity)
+        # the representations are not byte-identical
+        self.assertTrue(compressed["ETag"].startswith("W/"))
+        self.assertEqual(compressed["ETag"], identity["ETag"])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=compressed["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unknown_form_is_not_found(self):
+        url = reverse(
+            "api:form-detail",
+            kwargs={"uuid_or_slug": "f6b9e2b1-0000-4000-8000-000000000000"},
+        )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"foo"')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_staff_responses_are_private(self):
+        form = FormFactory.create(active=False)
+        self.client.force_authenticate(user=StaffUserFactory.create())
+        url = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("private", response["Cache-Control"])
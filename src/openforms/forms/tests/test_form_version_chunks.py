@@ -0,0 +1,93 @@
+import json
+import threading
+
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+from ..models import FormVersion, FormVersionChunk
+from ..tasks import cleanup_unused_form_version_chunks
+from ..versioning import CHUNK_REFERENCE, join_export, split_export
+from .factories import FormFactory
+from .utils import EXPORT_BLOB
+
+
+class ExportChunkingTests(SimpleTestCase):
+    def test_split_and_join_export(self):
+        manifest, chunks = split_export(EXPORT_BLOB)
+
+        form_definition = manifest["formDefinitions"][0]
+        self.assertEqual(list(form_definition["configuration"]), [CHUNK_REFERENCE])
+        self.assertIn(form_definition["configuration"][CHUNK_REFERENCE], chunks)
+
+        export = join_export(manifest, chunks)
+        for resource, data in EXPORT_BLOB.items():
+            with self.subTest(resource=resource):
+                self.assertEqual(json.loads(export[resource]), json.loads(data))
+
+
+class FormVersionStorageTests(TestCase):
+    def test_identical_content_is_stored_once(self):
+        form1, form2 = FormFactory.create_batch(2)
+
+        version1 = FormVersion.objects.create(form=form1, export_blob=EXPORT_BLOB)
+        FormVersion.objects.create(form=form1, export_blob=EXPORT_BLOB)
+        FormVersion.objects.create(form=form2, export_blob=EXPORT_BLOB)
+
+        _, chunks = split_export(EXPORT_BLOB)
+        self.assertEqual(FormVersionChunk.objects.count(), len(chunks))
+        self.assertEqual(version1.chunks.count(), len(chunks))
+
+    def test_export_blob_resolves_chunks(self):
+        form = FormFactory.create()
+        version = FormVersion.objects.create(form=form, export_blob=EXPORT_BLOB)
+
+        version = FormVersion.objects.get(pk=version.pk)
+
+        export_blob = version.export_blob
+        self.assertEqual(
+            json.loads(export_blob["formDefinitions"]),
+            json.loads(EXPORT_BLOB["formDefinitions"]),
+        )
+
+    def test_cleanup_unused_chunks(self):
+        form1, form2 = FormFactory.create_batch(2)
+        FormVersion.objects.create(form=form1, export_blob=EXPORT_BLOB)
+        version = FormVersion.objects.create(form=form2, export_blob=EXPORT_BLOB)
+        count = FormVersionChunk.objects.count()
+
+        form1.delete()
+        cleanup_unused_form_version_chunks()
+
+        self.assertEqual(FormVersionChunk.objects.count(), count)
+
+        version.delete()
+        cleanup_unused_form_version_chunks()
+
+        self.assertFalse(FormVersionChunk.objects.exists())
+
+
+class FormVersionChunkCleanupTests(TransactionTestCase):
+    def test_chunks_locked_by_a_save_in_progress_are_kept(self):
+        form = FormFactory.create()
+        FormVersion.objects.create(form=form, export_blob=EXPORT_BLOB).delete()
+        locked, release = threading.Event(), threading.Event()
+
+        def save_version():
+            # hold the locks of FormVersion.save, which references the chunks again
+            try:
+                with transaction.atomic():
+                    list(FormVersionChunk.objects.select_for_update())
+                    locked.set()
+                    release.wait(timeout=5)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=save_version)
+        thread.start()
+        self.assertTrue(locked.wait(timeout=5))
+
+        cleanup_unused_form_version_chunks()
+        release.set()
+        thread.join()
+
+        self.assertTrue(FormVersionChunk.objects.exists())
@@ -3,12 +3,13 @@ import os
 import zipfile
 
 from django.core.management import CommandError, call_command
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 
 from openforms.products.tests.factories import ProductFactory
 
 from ...submissions.tests.form_logic.factories import FormLogicFactory
 from ..models import Form, FormDefinition, FormLogic, FormStep
+from ..utils import import_form, remap_uuids
 from .factories import FormDefinitionFactory, FormFactory, FormStepFactory
 
 PATH = os.path.abspath(os.path.dirname(__file__))
@@ -367,3 +368,63 @@ class ImportExportTests(TestCase):
         self.assertEqual(form_logics.count(), 2)
         self.assertNotEqual(form_logic_2.pk, form_logic_pk)
         self.assertEqual(forms.last().pk, form_logic_2.form.pk)
+
+    def test_import_reuses_identical_reusable_form_definition(self):
+        form = FormFactory.create()
+        form_definition = FormDefinitionFactory.create(is_reusable=True)
+        FormStepFactory.create(form=form, form_definition=form_definition)
+        call_command("export", form.pk, self.filepath)
+        form.slug = "modified"
+        form.save()
+        form_definition.slug = "modified"
+        form_definition.save()
+
+        call_command("import", import_file=self.filepath)
+
+        self.assertEqual(FormDefinition.objects.count(), 1)
+        imported_step = FormStep.objects.exclude(form=form).get()
+        self.assertEqual(imported_step.form_definition, form_definition)
+
+    def test_import_reports_progress(self):
+        form = FormFactory.create()
+        FormStepFactory.create_batch(3, form=form)
+        call_command("export", form.pk, self.filepath)
+        form.slug = "modified"
+        form.save()
+        progress = []
+
+        import_form(
+            self.filepath, progress_callback=lambda *args: progress.append(args)
+        )
+
+        imported_form = Form.objects.last()
+        self.assertEqual(imported_form.formstep_set.count(), 3)
+        # 3 form definitions, 1 form, 3 steps (single batch), 0 logic rules
+        self.assertEqual(progress, [(1, 7), (2, 7), (3, 7), (4, 7), (7, 7), (7, 7)])
+
+
+class RemapUUIDsTests(SimpleTestCase):
+    def test_uuids_are_replaced_in_keys_and_values(self):
+        old = "c2d9b3e4-5f3a-4b8e-9c1d-2e3f4a5b6c7d"
+        new = "0b1c2d3e-4f5a-4b6c-8d9e-0f1a2b3c4d5e"
+        other = "11111111-2222-4333-8444-555555555555"
+        data = [
+            {
+                "uuid": old,
+                "url": f"http://testserver/api/v1/forms/{old}",
+                old: [other, 1, None],
+            }
+        ]
+
+        result = remap_uuids(data, {old: new})
+
+        self.assertEqual(
+            result,
+            [
+                {
+                    "uuid": new,
+                    "url": f"http://testserver/api/v1/forms/{new}",
+                    new: [other, 1, None],
+                }
+            ],
+        )
@@ -212,6 +212,26 @@ class FormDefinitionTestCase(TestCase):
             _("{name} (copy)").format(name="A internal"),
         )
 
+    def test_configuration_hash_is_maintained_on_save(self):
+        form_definition = FormDefinitionFactory.create(configuration={"a": 1, "b": 2})
+        same_configuration = FormDefinitionFactory.create(
+            configuration={"b": 2, "a": 1}
+        )
+
+        self.assertEqual(len(form_definition.configuration_hash), 32)
+        self.assertEqual(
+            form_definition.configuration_hash, same_configuration.configuration_hash
+        )
+
+        form_definition.configuration = {"a": 2}
+        form_definition.save(update_fields=["configuration"])
+        form_definition.refresh_from_db()
+
+        self.assertEqual(form_definition.configuration_hash, form_definition.get_hash())
+        self.assertNotEqual(
+            form_definition.configuration_hash, same_configuration.configuration_hash
+        )
+
     def test_get_keys_for_email_summary(self):
         form_definition = FormDefinitionFactory.create(
             configuration={
@@ -0,0 +1,103 @@
+"""
+Guard the number of queries of the staff forms API and admin.
+
+The query counts of list pages must not depend on the number of objects shown.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from django_webtest import WebTest
+from rest_framework.test import APITestCase
+
+from openforms.accounts.tests.factories import StaffUserFactory, SuperUserFactory
+from openforms.products.tests.factories import ProductFactory
+from openforms.tests.utils import disable_2fa
+
+from .factories import FormDefinitionFactory, FormFactory, FormStepFactory
+
+
+def create_form_with_steps(num_steps=3):
+    form = FormFactory.create(product=ProductFactory.create())
+    FormStepFactory.create_batch(num_steps, form=form)
+    return form
+
+
+class FormsAPIQueryCountTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(user=StaffUserFactory.create())
+
+    def assertConstantQueries(self, url: str, create_more) -> None:
+        # warm up - e.g. the singleton configuration is cached after the first request
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        create_more()
+
+        with self.assertNumQueries(len(context.captured_queries)):
+            self.client.get(url)
+
+    def test_form_list(self):
+        create_form_with_steps()
+
+        self.assertConstantQueries(
+            reverse("api:form-list"),
+            lambda: [create_form_with_steps() for _ in range(5)],
+        )
+
+    def test_form_definition_list(self):
+        FormStepFactory.create_batch(2)
+
+        self.assertConstantQueries(
+            reverse("api:formdefinition-list"),
+            lambda: FormStepFactory.create_batch(5),
+        )
+
+    def test_form_definition_detail_used_in(self):
+        form_definition = FormDefinitionFactory.create(is_reusable=True)
+        FormStepFactory.create(form_definition=form_definition)
+        url = reverse(
+            "api:formdefinition-detail", kwargs={"uuid": form_definition.uuid}
+        )
+
+        self.assertConstantQueries(
+            url,
+            lambda: FormStepFactory.create_batch(5, form_definition=form_definition),
+        )
+        self.assertEqual(len(self.client.get(url).json()["usedIn"]), 6)
+
+
+@disable_2fa
+class FormAdminQueryCountTests(WebTest):
+    def setUp(self):
+        super().setUp()
+        self.user = SuperUserFactory.create()
+
+    def assertConstantQueries(self, url: str, create_more) -> None:
+        self.app.get(url, user=self.user)
+        with CaptureQueriesContext(connection) as context:
+            self.app.get(url, user=self.user)
+
+        create_more()
+
+        with self.assertNumQueries(len(context.captured_queries)):
+            self.app.get(url, user=self.user)
+
+    def test_form_changelist(self):
+        create_form_with_steps()
+
+        self.assertConstantQueries(
+            reverse("admin:forms_form_changelist"),
+            lambda: [create_form_with_steps() for _ in range(5)],
+        )
+
+    def test_form_definition_changelist(self):
+        FormStepFactory.create_batch(2)
+
+        self.assertConstantQueries(
+            reverse("admin:forms_formdefinition_changelist"),
+            lambda: FormStepFactory.create_batch(5),
+        )
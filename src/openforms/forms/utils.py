@@ -1,21 +1,26 @@
 import json
+import re
 import zipfile
-from typing import List
-from uuid import uuid4
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
 
 from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
+from celery import states
+from celery.result import AsyncResult
 from rest_framework.exceptions import ValidationError
 from rest_framework.test import APIRequestFactory
 
-from .api import serializers as api_serializers
 from .api.serializers import (
     FormDefinitionSerializer,
     FormExportSerializer,
     FormLogicSerializer,
+    FormSerializer,
     FormStepSerializer,
 )
+from .constants import IMPORT_PROGRESS_STATE, ImportStatuses
 from .models import Form, FormDefinition, FormLogic, FormStep
 
 IMPORT_ORDER = {
@@ -25,6 +30,8 @@ IMPORT_ORDER = {
     "formLogic": FormLogic,
 }
 
+UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
 
 def _get_mock_request():
     factory = APIRequestFactory()
@@ -86,110 +93,254 @@ def export_form(form_id, archive_name=None, response=None):
             zip_file.writestr(f"{name}.json", data)
 
 
-@transaction.atomic
-def import_form(import_file, existing_form_instance=None):
+def read_import_file(import_file) -> Dict[str, str]:
     import_data = {}
     with zipfile.ZipFile(import_file, "r") as zip_file:
         for resource, model in IMPORT_ORDER.items():
             if f"{resource}.json" in zip_file.namelist():
                 import_data[resource] = zip_file.read(f"{resource}.json").decode()
+    return import_data
 
-    return import_form_data(import_data, existing_form_instance)
 
+def should_import_in_background(import_data: Dict[str, str]) -> bool:
+    size = sum(len(data) for data in import_data.values())
+    return size > settings.FORMS_IMPORT_BACKGROUND_THRESHOLD
 
-def import_form_data(
-    import_data: dict, existing_form_instance: Form = None
-) -> List[FormDefinition]:
-    uuid_mapping = {}
 
-    request = _get_mock_request()
-    created_form_definitions = []
-
-    created_form = None
-
-    for resource, model in IMPORT_ORDER.items():
-        data = import_data[resource]
-        for old, new in uuid_mapping.items():
-            data = data.replace(old, new)
-
-        if resource == "formDefinitions":
-            serializer = api_serializers.FormDefinitionSerializer
-        elif resource == "forms":
-            serializer = api_serializers.FormSerializer
-        elif resource == "formSteps":
-            serializer = api_serializers.FormStepSerializer
-        elif resource == "formLogic":
-            serializer = api_serializers.FormLogicSerializer
-        else:
-            raise ValidationError("Unknown resource")
-
-        for entry in json.loads(data):
-            if "uuid" in entry:
-                old_uuid = entry["uuid"]
-                entry["uuid"] = str(uuid4())
-
-            if resource == "forms" and not existing_form_instance:
-                entry["active"] = False
-
-            if resource == "formSteps" and existing_form_instance:
-                FormStep.objects.filter(form=existing_form_instance).delete()
+@transaction.atomic
+def import_form(import_file, existing_form_instance=None, progress_callback=None):
+    import_data = read_import_file(import_file)
+    return import_form_data(
+        import_data, existing_form_instance, progress_callback=progress_callback
+    )
 
-            if resource == "formLogic" and existing_form_instance:
-                FormLogic.objects.filter(form=existing_form_instance).delete()
 
-            if resource == "forms" and existing_form_instance:
-                deserialized = serializer(
-                    data=entry,
-                    context={"request": request, "form": created_form},
-                    instance=existing_form_instance,
-                )
-            else:
-                deserialized = serializer(
-                    data=entry,
-                    context={"request": request, "form": created_form},
+def remap_uuids(node: Any, uuid_mapping: Dict[str, str]) -> Any:
+    """
+    Replace the old UUIDs with the new ones in a single pass over the (parsed) data.
+
+    UUIDs are looked up in every string (both keys and values) - they occur on their
+    own but also as part of (API resource) URLs.
+    """
+    if not uuid_mapping:
+        return node
+
+    def replace(match) -> str:
+        return uuid_mapping.get(match.group(0), match.group(0))
+
+    def _remap(value: Any) -> Any:
+        if isinstance(value, str):
+            return UUID_RE.sub(replace, value)
+        if isinstance(value, dict):
+            return {_remap(key): _remap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [_remap(item) for item in value]
+        return value
+
+    return _remap(node)
+
+
+@dataclass
+class FormImport:
+    """
+    Import the (parsed) resources of a form export.
+
+    Form definitions and the form itself are created one by one, form steps and
+    logic rules are validated as a batch and inserted with a single query each.
+    """
+
+    existing_form_instance: Optional[Form] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None
+
+    def __post_init__(self):
+        self.uuid_mapping: Dict[str, str] = {}
+        self.created_form_definitions: List[str] = []
+        self.form: Optional[Form] = None
+        self.request = _get_mock_request()
+        self.done = self.total = 0
+
+    def get_serializer_context(self) -> dict:
+        return {"request": self.request, "form": self.form}
+
+    def report_progress(self, count: int) -> None:
+        self.done += count
+        if self.progress_callback is not None:
+            self.progress_callback(self.done, self.total)
+
+    def run(self, resources: Dict[str, list]) -> List[str]:
+        self.total = sum(len(entries) for entries in resources.values())
+        self.import_form_definitions(resources["formDefinitions"])
+        self.import_forms(remap_uuids(resources["forms"], self.uuid_mapping))
+        self.import_form_steps(remap_uuids(resources["formSteps"], self.uuid_mapping))
+        self.import_form_logic(remap_uuids(resources["formLogic"], self.uuid_mapping))
+        return self.created_form_definitions
+
+    def import_form_definitions(self, entries: List[dict]) -> None:
+        for entry in entries:
+            old_uuid = entry.pop("uuid", None)
+            configuration_hash = FormDefinition(
+                configuration=entry["configuration"]
+            ).get_hash()
+            form_definition = self._get_identical_reusable_form_definition(
+                entry, configuration_hash
+            )
+            if form_definition is None:
+                serializer = FormDefinitionSerializer(
+                    data=entry, context=self.get_serializer_context()
                 )
+                try:
+                    serializer.is_valid(raise_exception=True)
+                    form_definition = serializer.save()
+                except ValidationError as e:
+                    if not (
+                        "slug" in e.detail and e.detail["slug"][0].code == "unique"
+                    ):
+                        raise e
+                    form_definition = self._resolve_form_definition_conflict(
+                        entry, configuration_hash
+                    )
+
+            if old_uuid:
+                self.uuid_mapping[old_uuid] = str(form_definition.uuid)
+            self.report_progress(1)
+
+    def _get_identical_reusable_form_definition(
+        self, entry: dict, configuration_hash: str
+    ) -> Optional[FormDefinition]:
+        """
+        Look up an existing reusable definition that is identical, regardless of slug.
+        """
+        if not entry.get("is_reusable"):
+            return None
+        return (
+            FormDefinition.objects.filter(
+                configuration_hash=configuration_hash,
+                is_reusable=True,
+                name=entry["name"],
+                login_required=entry.get("login_required", False),
+            )
+            .order_by("pk")
+            .first()
+        )
+
+    def _resolve_form_definition_conflict(
+        self, entry: dict, configuration_hash: str
+    ) -> FormDefinition:
+        existing_fd = FormDefinition.objects.get(slug=entry["slug"])
+        if existing_fd.configuration_hash == configuration_hash:
+            # The form definition that is being imported is identical to the existing
+            # form definition with the same slug, use existing instead of creating new
+            # definition
+            return existing_fd
+
+        # The imported form definition configuration is different, create a new form
+        # definition
+        entry.pop("url", None)
+        new_fd = FormDefinition(**entry)
+        new_fd.save()
+        self.created_form_definitions.append(new_fd.slug)
+        return new_fd
+
+    def import_forms(self, entries: List[dict]) -> None:
+        for entry in entries:
+            old_uuid = entry.pop("uuid", None)
+            if not self.existing_form_instance:
+                entry["active"] = False
+            serializer = FormSerializer(
+                data=entry,
+                instance=self.existing_form_instance,
+                context=self.get_serializer_context(),
+            )
+            serializer.is_valid(raise_exception=True)
+            self.form = serializer.save()
+
+            # The uuid is a read only field, so the mapping between the old uuid and
+            # the new one can only be done after the instance is saved.
+            if old_uuid:
+                self.uuid_mapping[old_uuid] = str(self.form.uuid)
+            self.report_progress(1)
+
+    def import_form_steps(self, entries: List[dict]) -> None:
+        if self.existing_form_instance:
+            FormStep.objects.filter(form=self.existing_form_instance).delete()
+
+        old_uuids = [entry.pop("uuid", None) for entry in entries]
+        serializer = FormStepSerializer(
+            data=entries, many=True, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        form_steps = FormStep.objects.bulk_create(
+            [FormStep(form=self.form, **data) for data in serializer.validated_data]
+        )
+
+        for old_uuid, form_step in zip(old_uuids, form_steps):
+            if old_uuid:
+                self.uuid_mapping[old_uuid] = str(form_step.uuid)
+        # bulk_create bypasses FormStep.save, which marks the form as changed
+        if self.form is not None:
+            Form.objects.filter(pk=self.form.pk).update(changed_on=timezone.now())
+        self.report_progress(len(entries))
+
+    def import_form_logic(self, entries: List[dict]) -> None:
+        if self.existing_form_instance:
+            FormLogic.objects.filter(form=self.existing_form_instance).delete()
+
+        for entry in entries:
+            entry.pop("uuid", None)
+        serializer = FormLogicSerializer(
+            data=entries, many=True, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        FormLogic.objects.bulk_create(
+            [FormLogic(**data) for data in serializer.validated_data]
+        )
+        self.report_progress(len(entries))
+
 
-            try:
-                deserialized.is_valid(raise_exception=True)
-                deserialized.save()
-                if resource == "forms":
-                    created_form = deserialized.instance
-
-                # The FormSerializer/FormStepSerializer/FormLogicSerializer have the uuid as a read only field.
-                # So the mapping between the old uuid and the new needs to be done after the instance is saved.
-                if hasattr(deserialized.instance, "uuid") and "uuid" in entry:
-                    uuid_mapping[old_uuid] = str(deserialized.instance.uuid)
-            except ValidationError as e:
-                if (
-                    resource == "formDefinitions"
-                    and "slug" in e.detail
-                    and e.detail["slug"][0].code == "unique"
-                ):
-                    existing_fd = FormDefinition.objects.get(slug=entry["slug"])
-                    existing_fd_hash = existing_fd.get_hash()
-                    imported_fd_hash = FormDefinition(
-                        configuration=entry["configuration"]
-                    ).get_hash()
-
-                    if existing_fd_hash == imported_fd_hash:
-                        # The form definition that is being imported
-                        # is identical to the existing form definition
-                        # with the same slug, use existing instead
-                        # of creating new definition
-                        uuid_mapping[old_uuid] = existing_fd.uuid
-                    else:
-                        # The imported form definition configuration
-                        # is different, create a new form definition
-                        entry.pop("url")
-                        entry.pop("uuid")
-                        new_fd = FormDefinition(**entry)
-                        new_fd.save()
-                        uuid_mapping[old_uuid] = str(new_fd.uuid)
-
-                        created_form_definitions.append(new_fd.slug)
-                else:
-                    raise e
-    return created_form_definitions
+@transaction.atomic
+def import_form_data(
+    import_data: Dict[str, str],
+    existing_form_instance: Form = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> List[str]:
+    """
+    Import the form resources and return the slugs of newly created form definitions.
+
+    :param progress_callback: optional callable, receiving the number of processed
+      entries and the total number of entries.
+    """
+    # every resource is parsed exactly once, UUIDs are remapped on the parsed data
+    resources = {
+        resource: json.loads(import_data[resource]) for resource in IMPORT_ORDER
+    }
+    importer = FormImport(
+        existing_form_instance=existing_form_instance,
+        progress_callback=progress_callback,
+    )
+    return importer.run(resources)
+
+
+def get_import_status(task_id: str) -> dict:
+    """
+    Translate the state of a background import task into the public import status.
+    """
+    result = AsyncResult(task_id)
+    status = {
+        "status": ImportStatuses.pending,
+        "done": 0,
+        "total": 0,
+        "created_form_definitions": [],
+        "error_message": "",
+    }
+    if result.state == IMPORT_PROGRESS_STATE:
+        status.update(status=ImportStatuses.in_progress, **result.info)
+    elif result.state == states.SUCCESS:
+        status.update(
+            status=ImportStatuses.done, created_form_definitions=result.result
+        )
+    elif result.state == states.FAILURE:
+        status.update(status=ImportStatuses.failed, error_message=str(result.result))
+    return status
 
 
 def remove_key_from_dict(dictionary, key):
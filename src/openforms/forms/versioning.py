@@ -0,0 +1,83 @@
+"""
+Content-addressed storage of form version snapshots.
+
+A form version is an export of the form (see :func:`openforms.forms.utils.form_to_json`)
+and most of its size is taken by the Form.io configurations of the form definitions
+and the logic rules. These rarely change between versions and are often shared between
+forms, so they are stored only once - as compressed chunks keyed by the SHA-256 digest
+of their content. The version itself only stores a small manifest, which is the export
+with the chunked values replaced by ``{"$chunk": "<digest>"}`` references.
+
+The functions in this module only deal with plain data, so that they can also be used
+in (data) migrations.
+"""
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, Iterator, Tuple
+
+CHUNK_REFERENCE = "$chunk"
+
+# per export resource, the (large) entry fields that are stored as chunks
+CHUNKED_FIELDS = {
+    "formDefinitions": ("configuration",),
+    "formLogic": ("json_logic_trigger", "actions"),
+}
+
+
+def encode_chunk(value: Any) -> Tuple[str, bytes]:
+    raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest(), zlib.compress(raw)
+
+
+def decode_chunk(content: bytes) -> Any:
+    return json.loads(zlib.decompress(content))
+
+
+def _iter_chunked_values(manifest: dict) -> Iterator[Tuple[dict, str]]:
+    for resource, fields in CHUNKED_FIELDS.items():
+        for entry in manifest.get(resource, []):
+            for field in fields:
+                if field in entry:
+                    yield entry, field
+
+
+def split_export(export_blob: Dict[str, Any]) -> Tuple[dict, Dict[str, bytes]]:
+    """
+    Split a form export into its manifest and the (compressed) chunks.
+
+    :return: a tuple of the manifest and a mapping of digest to compressed content.
+    """
+    manifest = {
+        resource: json.loads(data) if isinstance(data, str) else data
+        for resource, data in export_blob.items()
+    }
+    chunks = {}
+    for entry, field in _iter_chunked_values(manifest):
+        digest, content = encode_chunk(entry[field])
+        chunks[digest] = content
+        entry[field] = {CHUNK_REFERENCE: digest}
+    return manifest, chunks
+
+
+def get_chunk_digests(manifest: dict) -> set:
+    return {
+        reference[CHUNK_REFERENCE]
+        for entry, field in _iter_chunked_values(manifest)
+        if isinstance(reference := entry[field], dict) and CHUNK_REFERENCE in reference
+    }
+
+
+def join_export(manifest: dict, chunks: Dict[str, bytes]) -> Dict[str, str]:
+    """
+    Resolve the chunk references in the manifest and return the original export.
+
+    The export resources are JSON strings, like :func:`form_to_json` produces them.
+    """
+    decoded = {digest: decode_chunk(content) for digest, content in chunks.items()}
+    export = json.loads(json.dumps(manifest))
+    for entry, field in _iter_chunked_values(export):
+        reference = entry[field]
+        if isinstance(reference, dict) and CHUNK_REFERENCE in reference:
+            entry[field] = decoded[reference[CHUNK_REFERENCE]]
+    return {resource: json.dumps(entries) for resource, entries in export.items()}
@@ -1,14 +1,26 @@
+import time
 from datetime import timedelta
+from typing import Optional
 
 from django.conf import settings
+from django.contrib.sessions.backends.base import SessionBase
+from django.contrib.sessions.backends.cache import SessionStore as CacheSessionStore
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.http import http_date
 
 from openforms.config.models import GlobalConfiguration
+from openforms.submissions import ownership
+from openforms.utils import metrics
 
 # for CORS, the session cookie must be set with SameSite "None" to be sent.
 # This is a breaking change by Chrome, which was not going to be backported in Django
 # 2.2.x. It's available from Django 3.1 onwards.
 SAMESITE_VALUE = "None"
 
+# when the expiry of the session was last refreshed by saving the session
+SESSION_REFRESHED_KEY = "_session_refreshed"
+
 
 class SameSiteNoneCookieMiddlware:
     def __init__(self, get_response):
@@ -28,6 +40,12 @@ class SessionTimeoutMiddleware:
     """
     Allows us to set the expiry time of the session based on what
     is configured in our GlobalConfiguration
+
+    The expiry is sliding: it is postponed by activity. To avoid writing the whole
+    session on every request, it is only refreshed once a fraction
+    (``settings.SESSION_REFRESH_FRACTION``) of the timeout has passed. If the session
+    data did not change, the time-to-live of the session in the (Redis) cache is
+    extended instead of saving the session.
     """
 
     def __init__(self, get_response):
@@ -40,6 +58,68 @@ class SessionTimeoutMiddleware:
             if request.user.is_staff
             else config.form_session_timeout
         )
+        timeout = int(timedelta(minutes=timeout).total_seconds())
+        session = request.session
         # https://docs.djangoproject.com/en/2.2/topics/http/sessions/#django.contrib.sessions.backends.base.SessionBase.set_expiry
-        request.session.set_expiry(int(timedelta(minutes=timeout).total_seconds()))
-        return self.get_response(request)
+        if session.get_expiry_age() != timeout:
+            session.set_expiry(timeout)
+
+        response = self.get_response(request)
+
+        metrics.incr("sessions.requests")
+        if session.modified:
+            if not session.is_empty():
+                session[SESSION_REFRESHED_KEY] = int(time.time())
+                ownership.refresh(session, timeout)
+                metrics.incr("sessions.writes")
+        elif session.session_key and response.status_code != 500:
+            self.refresh(session, response, timeout)
+        return response
+
+    def refresh(self, session: SessionBase, response: HttpResponse, timeout: int):
+        threshold = timeout * settings.SESSION_REFRESH_FRACTION
+
+        remaining = _get_cache_ttl(session)
+        if remaining is None:
+            # the time-to-live can't be checked, refresh by saving the session
+            if time.time() - session.get(SESSION_REFRESHED_KEY, 0) < threshold:
+                return
+            session.modified = True
+            session[SESSION_REFRESHED_KEY] = int(time.time())
+            ownership.refresh(session, timeout)
+            metrics.incr("sessions.writes")
+            return
+
+        if timeout - remaining < threshold:
+            return
+        cache = caches[settings.SESSION_CACHE_ALIAS]
+        if not cache.touch(session.cache_key, timeout):
+            return
+        ownership.refresh(session, timeout)
+        metrics.incr("sessions.touches")
+        # same as :class:`django.contrib.sessions.middleware.SessionMiddleware`
+        response.set_cookie(
+            settings.SESSION_COOKIE_NAME,
+            session.session_key,
+            max_age=timeout,
+            expires=http_date(time.time() + timeout),
+            domain=settings.SESSION_COOKIE_DOMAIN,
+            path=settings.SESSION_COOKIE_PATH,
+            secure=settings.SESSION_COOKIE_SECURE or None,
+            httponly=settings.SESSION_COOKIE_HTTPONLY or None,
+            samesite=settings.SESSION_COOKIE_SAMESITE,
+        )
+
+
+def _get_cache_ttl(session: SessionBase) -> Optional[int]:
+    """
+    Return the remaining time-to-live of a cached session, if it can be determined.
+    """
+    if not isinstance(session, CacheSessionStore):
+        return None
+    cache = caches[settings.SESSION_CACHE_ALIAS]
+    if not hasattr(cache, "ttl"):  # only supported by django-redis
+        return None
+    if (ttl := cache.ttl(session.cache_key)) is None:  # no expiry
+        return session.get_expiry_age()
+    return ttl
@@ -0,0 +1,148 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import List, Tuple
+
+from django.core.management import BaseCommand, CommandError
+from django.db import IntegrityError, connection, connections, transaction
+from django.db.models import Max, Q
+
+from openforms.submissions.models import Submission
+
+from ...models import SubmissionPayment
+
+FORM_URL = "http://localhost/benchmark"
+
+# The order IDs are allocated in a year without real payments, so that the benchmark
+# never takes (or skips) order IDs of the payments that are started meanwhile.
+BENCHMARK_YEAR = 1970
+BENCHMARK_ORDER_IDS = (BENCHMARK_YEAR * 100_000, (BENCHMARK_YEAR + 1) * 100_000 - 1)
+
+
+def start_payment_max(submission: Submission) -> int:
+    """
+    The previous implementation: ``MAX(order_id) + 1``, retried on conflicts.
+
+    :return: the number of conflicts.
+    """
+    payment = SubmissionPayment.objects.create(
+        submission=submission, plugin_id="demo", amount=Decimal("1"), form_url=FORM_URL
+    )
+    conflicts = 0
+    while True:
+        try:
+            with transaction.atomic():
+                max_order_id = SubmissionPayment.objects.filter(
+                    order_id__range=BENCHMARK_ORDER_IDS
+                ).aggregate(Max("order_id"))
+                number = int(str(max_order_id["order_id__max"] or 197000000)[4:])
+                payment.order_id = int(f"{BENCHMARK_YEAR}{number + 1:05d}")
+                payment.save(update_fields=("order_id",))
+                return conflicts
+        except IntegrityError:
+            conflicts += 1
+
+
+def start_payment_sequence(submission: Submission) -> int:
+    SubmissionPayment.objects.create(
+        submission=submission,
+        plugin_id="demo",
+        amount=Decimal("1"),
+        form_url=FORM_URL,
+        order_id=SubmissionPayment.objects.get_next_order_id(BENCHMARK_YEAR),
+    )
+    return 0
+
+
+STRATEGIES = {
+    "max": start_payment_max,
+    "sequence": start_payment_sequence,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput of concurrently started payments, with the order IDs "
+        "allocated from a database sequence or with the previous MAX() + retry "
+        f"implementation. The order IDs are allocated in {BENCHMARK_YEAR}, the created "
+        "payments are removed afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--submission",
+            type=int,
+            help="ID of the submission to start the payments for, defaults to the "
+            "most recent submission.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 8, 32],
+            help="The numbers of concurrently started payments to measure.",
+        )
+        parser.add_argument(
+            "--payments",
+            type=int,
+            default=200,
+            help="The number of payments started per run.",
+        )
+
+    def handle(self, **options):
+        if options["submission"]:
+            submission = Submission.objects.filter(pk=options["submission"]).first()
+        else:
+            submission = Submission.objects.order_by("-pk").first()
+        if submission is None:
+            raise CommandError("No submission found to start the payments for.")
+
+        self.stdout.write("strategy  concurrency  payments/s  p95 (ms)  conflicts")
+        for strategy, func in STRATEGIES.items():
+            for concurrency in options["concurrency"]:
+                try:
+                    throughput, p95, conflicts = self._run(
+                        func, submission, concurrency, options["payments"]
+                    )
+                finally:
+                    self._cleanup(submission)
+                self.stdout.write(
+                    f"{strategy:<8}  {concurrency:>11}  {throughput:>10.1f}  "
+                    f"{p95:>8.1f}  {conflicts:>9}"
+                )
+
+    def _cleanup(self, submission: Submission) -> None:
+        # payments of the max strategy that didn't get an order ID yet have none
+        SubmissionPayment.objects.filter(
+            Q(order_id__range=BENCHMARK_ORDER_IDS) | Q(order_id__isnull=True),
+            submission=submission,
+            form_url=FORM_URL,
+        ).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DROP SEQUENCE IF EXISTS payments_order_number_{BENCHMARK_YEAR}_seq"
+            )
+
+    def _run(
+        self, func, submission: Submission, concurrency: int, payments: int
+    ) -> Tuple[float, float, int]:
+        def start_payment(_) -> Tuple[float, int]:
+            start = time.perf_counter()
+            try:
+                conflicts = func(submission)
+            finally:
+                connections.close_all()
+            return time.perf_counter() - start, conflicts
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start = time.perf_counter()
+            results: List[Tuple[float, int]] = list(
+                executor.map(start_payment, range(payments))
+            )
+            duration = time.perf_counter() - start
+
+        durations = sorted(result[0] for result in results)
+        p95 = statistics.quantiles(durations, n=20)[-1] if len(durations) > 1 else 0
+        conflicts = sum(result[1] for result in results)
+        return payments / duration, p95 * 1000, conflicts
@@ -0,0 +1,42 @@
+# Generated by Django 2.2.24 on 2021-10-27 10:05
+
+from django.db import migrations
+
+# Return the next order number of the year from the sequence of that year. The
+# sequence is created on first use, continuing after the order IDs of that year that
+# were handed out before.
+CREATE_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION payments_next_order_number(year integer)
+RETURNS bigint AS $$
+DECLARE
+    sequence_name text := format('payments_order_number_%s_seq', year);
+    start bigint;
+BEGIN
+    RETURN nextval(sequence_name::regclass);
+EXCEPTION WHEN undefined_table THEN
+    SELECT coalesce(max(substr(order_id::text, 5)::bigint), 0) + 1 INTO start
+    FROM payments_submissionpayment
+    WHERE order_id::text LIKE year::text || '%';
+    BEGIN
+        EXECUTE format('CREATE SEQUENCE %I START WITH %s', sequence_name, start);
+    EXCEPTION WHEN duplicate_table OR unique_violation THEN
+        -- created by a concurrent transaction
+        NULL;
+    END;
+    RETURN nextval(sequence_name::regclass);
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DROP_FUNCTION = "DROP FUNCTION IF EXISTS payments_next_order_number(integer);"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_FUNCTION, DROP_FUNCTION),
+    ]
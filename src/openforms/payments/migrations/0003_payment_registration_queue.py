@@ -0,0 +1,53 @@
+# Generated by Django 2.2.24 on 2021-10-28 14:21
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def schedule_unregistered_payments(apps, _):
+    """
+    Register the completed payments of registered submissions that were missed.
+    """
+    SubmissionPayment = apps.get_model("payments", "SubmissionPayment")
+    SubmissionPayment.objects.filter(
+        status="completed", submission__registration_status="success"
+    ).update(next_registration_attempt=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0036_public_reference_sequence"),
+        ("payments", "0002_order_id_sequences"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submissionpayment",
+            name="registration_attempts",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="How often the registration of the payment status in the registration backend was attempted.",
+                verbose_name="registration attempts",
+            ),
+        ),
+        migrations.AddField(
+            model_name="submissionpayment",
+            name="next_registration_attempt",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the payment status will be registered in the registration backend. Empty if no registration is scheduled (anymore).",
+                null=True,
+                verbose_name="next registration attempt",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="submissionpayment",
+            index=models.Index(
+                condition=models.Q(status="completed"),
+                fields=["next_registration_attempt"],
+                name="payment_registration_due",
+            ),
+        ),
+        migrations.RunPython(schedule_unregistered_payments, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,11 @@
-import re
 import uuid
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from django.contrib.postgres.fields import JSONField
-from django.db import IntegrityError, models, transaction
-from django.db.models import Max, Sum
+from django.db import connection, models
+from django.db.models import Sum
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from openforms.plugins.constants import UNIQUE_ID_MAX_LENGTH
@@ -16,8 +16,6 @@ from .constants import PaymentStatus
 if TYPE_CHECKING:
     from openforms.submissions.models import Submission
 
-RE_INVOICE_NUMBER = re.compile(r"(?P<year>20\d{2})(?P<number>\d+)$")
-
 
 class SubmissionPaymentManager(models.Manager):
     def create_for(
@@ -30,36 +28,27 @@ class SubmissionPaymentManager(models.Manager):
     ):
         assert isinstance(amount, Decimal)
 
-        # first create without order_id
-        payment = self.create(
+        return self.create(
             submission=submission,
             plugin_id=plugin_id,
             plugin_options=plugin_options,
             amount=amount,
             form_url=form_url,
+            order_id=self.get_next_order_id(timezone.now().year),
         )
-        # then update with a unique order_id
-        while True:
-            try:
-                with transaction.atomic():
-                    payment.order_id = self.get_next_order_id(payment)
-                    payment.save(update_fields=("order_id",))
-                    break
-            except IntegrityError:
-                # race condition on unique order_id
-                continue
-        return payment
-
-    def get_next_order_id(self, payment):
-        prefix = payment.created.year
-        agg = self.aggregate(Max("order_id"))
-        max_order_id = str(agg["order_id__max"] or "202000000")
-        match = RE_INVOICE_NUMBER.match(max_order_id)
-        if not match:
-            raise ValueError("Invalid invoice number for invoice %d", payment.pk)
-        max_number = int(match.group("number"))
-        next_number = "{:05d}".format(max_number + 1)
-        return int(f"{prefix}{next_number}")
+
+    def get_next_order_id(self, year: int) -> int:
+        """
+        Return the next order ID of the year, in the format ``YYYYNNNNN``.
+
+        The numbers come from a database sequence per year (see the
+        ``payments_next_order_number`` database function), so concurrent payments
+        never get the same order ID.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT payments_next_order_number(%s)", [year])
+            (number,) = cursor.fetchone()
+        return int(f"{year}{number:05d}")
 
 
 class SubmissionPaymentQuerySet(models.QuerySet):
@@ -102,8 +91,35 @@ class SubmissionPayment(models.Model):
         default=PaymentStatus.started,
         help_text=_("Status of the payment process in the configured backend."),
     )
+    registration_attempts = models.PositiveIntegerField(
+        _("registration attempts"),
+        default=0,
+        help_text=_(
+            "How often the registration of the payment status in the registration "
+            "backend was attempted."
+        ),
+    )
+    next_registration_attempt = models.DateTimeField(
+        _("next registration attempt"),
+        blank=True,
+        null=True,
+        help_text=_(
+            "When the payment status will be registered in the registration backend. "
+            "Empty if no registration is scheduled (anymore)."
+        ),
+    )
     objects = SubmissionPaymentManager.from_queryset(SubmissionPaymentQuerySet)()
 
+    class Meta:
+        indexes = [
+            # the payment registration only looks up the completed payments that are due
+            models.Index(
+                fields=("next_registration_attempt",),
+                name="payment_registration_due",
+                condition=models.Q(status=PaymentStatus.completed),
+            )
+        ]
+
     def __str__(self):
         return f"#{self.order_id} '{self.get_status_display()}' {self.amount}"
 
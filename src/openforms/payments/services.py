@@ -1,15 +1,48 @@
+"""
+Register the status of completed payments in the registration backend.
+
+The payment return and webhook handlers don't call the registration backend
+themselves, they only mark the completed payments as due
+(:func:`schedule_payment_registration`) and schedule the ``register_payments`` task
+once the transaction is committed. Payments completed in quick succession are picked
+up by the same run of the task, which registers the due payments in batches, grouped
+per registration backend. When a backend is unavailable, the remaining payments of
+that backend are postponed until the backend is expected back, instead of trying
+them one by one.
+
+Failed registrations are retried with an exponential backoff (with jitter), using the
+same settings as the retries of the submission registration. The periodic task
+picks up the retries that are due, and the payments that were missed.
+"""
+import logging
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
 from django.db import transaction
+from django.utils import timezone
 
 from openforms.registrations.registry import register
 from openforms.submissions.constants import RegistrationStatuses
 from openforms.submissions.models import Submission
+from openforms.utils import metrics
+from openforms.utils.resilience import find_service_unavailable
 
 from .constants import PaymentStatus
+from .models import SubmissionPayment
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_SCHEDULED_KEY = "payments:registration-scheduled"
 
 
 def update_submission_payment_registration(submission: Submission):
-    # TODO wrap in celery task
-    # TODO logging
+    """
+    Register the status of the completed payments of the submission in the backend.
+    """
     if submission.registration_status != RegistrationStatuses.success:
         return
     if not submission.payment_required:
@@ -23,14 +56,174 @@ def update_submission_payment_registration(submission: Submission):
         return
 
     # TODO support partial payments
+    payment_ids = list(
+        submission.payments.filter(status=PaymentStatus.completed).values_list(
+            "id", flat=True
+        )
+    )
+    if not payment_ids:
+        return
+
+    # no locks are held during the call to the backend, the payments are claimed by
+    # the dispatch (see ``register_due_payments``)
+    plugin.update_payment_status(submission)
+    SubmissionPayment.objects.filter(
+        id__in=payment_ids, status=PaymentStatus.completed
+    ).update(status=PaymentStatus.registered, next_registration_attempt=None)
+
+
+def schedule_payment_registration(submission: Submission) -> None:
+    """
+    Mark the completed payments of the submission as due for registration.
+
+    Payments for which the registration already failed keep their retry schedule.
+    """
+    scheduled = SubmissionPayment.objects.filter(
+        submission=submission,
+        status=PaymentStatus.completed,
+        registration_attempts=0,
+        next_registration_attempt__isnull=True,
+    ).update(next_registration_attempt=timezone.now())
+    if scheduled:
+        transaction.on_commit(schedule_dispatch)
+
+
+def schedule_dispatch() -> None:
+    """
+    Schedule the registration of the due payments, unless it is already scheduled.
+    """
+    from .tasks import register_payments
+
+    debounce = settings.PAYMENT_REGISTRATION_DEBOUNCE
+    if not caches["default"].add(DISPATCH_SCHEDULED_KEY, True, timeout=debounce):
+        return
+    register_payments.apply_async(countdown=debounce)
+
+
+def get_next_attempt(
+    payment: SubmissionPayment, not_before: Optional[datetime] = None
+) -> Optional[datetime]:
+    """
+    Determine when a failed payment registration should be retried.
+
+    :return: ``None`` if the registration should not be retried anymore.
+    """
+    attempts = payment.registration_attempts
+    if attempts > settings.SUBMISSION_REGISTRATION_MAX_RETRIES:
+        return None
+
+    delay = min(
+        settings.SUBMISSION_REGISTRATION_RETRY_BACKOFF * 2 ** max(attempts - 1, 0),
+        settings.SUBMISSION_REGISTRATION_RETRY_BACKOFF_MAX,
+    )
+    next_attempt = timezone.now() + timedelta(seconds=random.uniform(delay / 2, delay))
+    if not_before is not None:
+        next_attempt = max(next_attempt, not_before)
+    return next_attempt
+
+
+def _claim_batch() -> List[SubmissionPayment]:
+    now = timezone.now()
+    # the claimed payments are postponed, so concurrent dispatches skip them. If the
+    # dispatch crashes, they're registered after this.
+    postponed_until = now + timedelta(seconds=settings.CELERY_TASK_SOFT_TIME_LIMIT)
+
     with transaction.atomic():
-        payments = submission.payments.filter(
-            status=PaymentStatus.completed
-        ).select_for_update()
-        if not payments:
-            return
-
-        # TODO handle errors etc
-        plugin.update_payment_status(submission)
-        # TODO add locking? we'd flag all completed
-        payments.update(status=PaymentStatus.registered)
+        due = list(
+            SubmissionPayment.objects.select_for_update(skip_locked=True)
+            .filter(
+                status=PaymentStatus.completed,
+                next_registration_attempt__lte=now,
+            )
+            .order_by("next_registration_attempt")
+            .values_list("id", flat=True)[: settings.PAYMENT_REGISTRATION_BATCH_SIZE]
+        )
+        SubmissionPayment.objects.filter(id__in=due).update(
+            next_registration_attempt=postponed_until
+        )
+
+    return list(
+        SubmissionPayment.objects.filter(id__in=due).select_related(
+            "submission", "submission__form"
+        )
+    )
+
+
+def _reschedule(
+    payments: List[SubmissionPayment], not_before: Optional[datetime] = None
+) -> None:
+    for payment in payments:
+        payment.registration_attempts += 1
+        payment.next_registration_attempt = get_next_attempt(payment, not_before)
+        if payment.next_registration_attempt is None:
+            logger.error(
+                "Giving up registering the status of payment %s", payment.order_id
+            )
+        payment.save(
+            update_fields=["registration_attempts", "next_registration_attempt"]
+        )
+
+
+def _register_backend_batch(backend: str, payments: List[SubmissionPayment]) -> None:
+    by_submission: Dict[Submission, List[SubmissionPayment]] = defaultdict(list)
+    for payment in payments:
+        by_submission[payment.submission].append(payment)
+
+    failed: List[SubmissionPayment] = []
+    submissions = list(by_submission)
+    for index, submission in enumerate(submissions):
+        try:
+            update_submission_payment_registration(submission)
+        except Exception as exc:
+            if (unavailable := find_service_unavailable(exc)) is None:
+                logger.exception(
+                    "Registering the payment status of submission %s failed",
+                    submission.pk,
+                )
+                _reschedule(by_submission[submission])
+                failed += by_submission[submission]
+                continue
+
+            # don't try the other submissions of this backend during the outage
+            retry_at = timezone.now() + timedelta(seconds=unavailable.retry_after)
+            _reschedule(by_submission[submission], not_before=retry_at)
+            postponed = [
+                payment
+                for remaining in submissions[index + 1 :]
+                for payment in by_submission[remaining]
+            ]
+            logger.warning(
+                "Registration backend '%s' is unavailable, postponing the registration "
+                "of %d payment(s)",
+                backend,
+                len(by_submission[submission]) + len(postponed),
+            )
+            # these were not attempted
+            SubmissionPayment.objects.filter(
+                id__in=[payment.id for payment in postponed]
+            ).update(next_registration_attempt=retry_at)
+            failed += by_submission[submission] + postponed
+            break
+
+    # the other payments are registered, or don't need to be registered (yet), e.g.
+    # when the submission itself isn't registered yet
+    SubmissionPayment.objects.filter(
+        id__in=[payment.id for payment in payments], status=PaymentStatus.completed
+    ).exclude(id__in=[payment.id for payment in failed]).update(
+        next_registration_attempt=None
+    )
+
+    metrics.incr("payments.registration_failed", len(failed))
+
+
+def register_due_payments() -> None:
+    """
+    Register the status of the due payments, in batches per registration backend.
+    """
+    while batch := _claim_batch():
+        by_backend: Dict[str, List[SubmissionPayment]] = defaultdict(list)
+        for payment in batch:
+            by_backend[payment.submission.form.registration_backend].append(payment)
+
+        for backend, payments in by_backend.items():
+            _register_backend_batch(backend, payments)
@@ -0,0 +1,12 @@
+import logging
+
+from ..celery import app
+from .services import register_due_payments
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(ignore_result=True)
+def register_payments() -> None:
+    logger.debug("Registering the status of the due payments")
+    register_due_payments()
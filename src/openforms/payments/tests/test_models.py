@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+from django.db import connection
 from django.test import TestCase
 
 from freezegun import freeze_time
@@ -36,12 +37,31 @@ class SubmissionPaymentTests(TestCase):
         self.assertEqual(payment.order_id, 202000004)
 
         # check overflow over default 5 digit non-year part
-        SubmissionPaymentFactory.create(order_id=202012345678)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "ALTER SEQUENCE payments_order_number_2020_seq RESTART 123456"
+            )
 
         payment = SubmissionPayment.objects.create_for(
             submission, "plugin1", options, amount, form_url
         )
-        self.assertEqual(payment.order_id, 202012345679)
+        self.assertEqual(payment.order_id, 2020123456)
+
+    def test_order_ids_restart_every_year(self):
+        SubmissionPaymentFactory.create(order_id=202000001)
+        submission = SubmissionFactory.create()
+
+        with freeze_time("2020-12-31T23:59:59Z"):
+            payment1 = SubmissionPayment.objects.create_for(
+                submission, "plugin1", {}, Decimal("1"), "http://test/form"
+            )
+        with freeze_time("2021-01-01T00:00:00Z"):
+            payment2 = SubmissionPayment.objects.create_for(
+                submission, "plugin1", {}, Decimal("1"), "http://test/form"
+            )
+
+        self.assertEqual(payment1.order_id, 202000002)
+        self.assertEqual(payment2.order_id, 202100001)
 
     def test_queryset_sum_amount(self):
         self.assertEqual(0, SubmissionPayment.objects.none().sum_amount())
@@ -1,8 +1,12 @@
+from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
+from django.core.cache import caches
 from django.test import TestCase
+from django.utils import timezone
 
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
 from rest_framework import serializers
 
 from openforms.registrations.base import BasePlugin
@@ -10,9 +14,15 @@ from openforms.registrations.registry import Registry
 from openforms.submissions.constants import RegistrationStatuses
 from openforms.submissions.models import Submission
 from openforms.submissions.tests.factories import SubmissionFactory
+from openforms.utils.resilience import CircuitOpen
 
 from ..constants import PaymentStatus
-from ..services import update_submission_payment_registration
+from ..models import SubmissionPayment
+from ..services import (
+    register_due_payments,
+    schedule_payment_registration,
+    update_submission_payment_registration,
+)
 from .factories import SubmissionPaymentFactory
 
 
@@ -110,3 +120,116 @@ class UpdatePaymentTests(TestCase):
                 with patch.object(self.plugin, "update_payment_status") as update_mock:
                     update_submission_payment_registration(submission)
                     update_mock.assert_not_called()
+
+
+class PaymentRegistrationDispatchTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        register = Registry()
+        register("registration1")(Plugin)
+        self.plugin = register["registration1"]
+
+        registry_patch = patch("openforms.payments.services.register", new=register)
+        registry_patch.start()
+        self.addCleanup(registry_patch.stop)
+
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    def create_payment(self, **kwargs):
+        factory_kwargs = dict(
+            status=PaymentStatus.completed,
+            next_registration_attempt=timezone.now(),
+        )
+        if "submission" not in kwargs:
+            factory_kwargs.update(
+                submission__registration_status=RegistrationStatuses.success,
+                submission__form__registration_backend="registration1",
+                submission__form__product__price=Decimal("11.35"),
+            )
+        factory_kwargs.update(kwargs)
+        return SubmissionPaymentFactory.create(**factory_kwargs)
+
+    @patch("openforms.payments.tasks.register_payments.apply_async")
+    def test_scheduling_does_not_call_the_backend(self, mock_apply_async):
+        payments = SubmissionPaymentFactory.create_batch(
+            2,
+            submission__registration_status=RegistrationStatuses.success,
+            status=PaymentStatus.completed,
+        )
+
+        with patch.object(self.plugin, "update_payment_status") as update_mock:
+            with capture_on_commit_callbacks(execute=True):
+                for payment in payments:
+                    schedule_payment_registration(payment.submission)
+
+        update_mock.assert_not_called()
+        mock_apply_async.assert_called_once()
+        self.assertFalse(
+            SubmissionPayment.objects.filter(
+                next_registration_attempt__isnull=True
+            ).exists()
+        )
+
+    def test_due_payments_are_registered_once_per_submission(self):
+        payment = self.create_payment()
+        self.create_payment(submission=payment.submission)
+        other_payment = self.create_payment()
+
+        with patch.object(self.plugin, "update_payment_status") as update_mock:
+            register_due_payments()
+
+        self.assertEqual(update_mock.call_count, 2)
+        self.assertEqual(
+            set(SubmissionPayment.objects.values_list("status", flat=True)),
+            {PaymentStatus.registered},
+        )
+        other_payment.refresh_from_db()
+        self.assertIsNone(other_payment.next_registration_attempt)
+
+    def test_failed_registration_is_retried_later(self):
+        payment = self.create_payment()
+
+        with patch.object(
+            self.plugin, "update_payment_status", side_effect=Exception("boom")
+        ):
+            register_due_payments()
+
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, PaymentStatus.completed)
+        self.assertEqual(payment.registration_attempts, 1)
+        self.assertGreater(payment.next_registration_attempt, timezone.now())
+
+    def test_unavailable_backend_postpones_its_other_payments(self):
+        payment1 = self.create_payment()
+        payment2 = self.create_payment()
+
+        with patch.object(
+            self.plugin,
+            "update_payment_status",
+            side_effect=CircuitOpen("zaken.example.com", retry_after=120),
+        ) as update_mock:
+            register_due_payments()
+
+        update_mock.assert_called_once()
+        payment1.refresh_from_db()
+        payment2.refresh_from_db()
+        retry_at = timezone.now() + timedelta(seconds=110)
+        self.assertGreater(payment1.next_registration_attempt, retry_at)
+        self.assertGreater(payment2.next_registration_attempt, retry_at)
+        self.assertEqual(
+            payment1.registration_attempts + payment2.registration_attempts, 1
+        )
+
+    def test_payments_of_unregistered_submissions_are_not_rescheduled(self):
+        payment = self.create_payment(
+            submission__registration_status=RegistrationStatuses.pending
+        )
+
+        with patch.object(self.plugin, "update_payment_status") as update_mock:
+            register_due_payments()
+
+        update_mock.assert_not_called()
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, PaymentStatus.completed)
+        self.assertIsNone(payment.next_registration_attempt)
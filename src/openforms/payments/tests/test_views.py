@@ -34,7 +34,7 @@ class ViewsTests(TestCase):
     @override_settings(
         CORS_ALLOW_ALL_ORIGINS=False, CORS_ALLOWED_ORIGINS=["http://allowed.foo"]
     )
-    @patch("openforms.payments.views.update_submission_payment_registration")
+    @patch("openforms.payments.views.schedule_payment_registration")
     def test_views(self, update_payments_mock):
         register = Registry()
         register("plugin1")(Plugin)
@@ -24,7 +24,7 @@ from openforms.utils.redirect import allow_redirect_url
 from .api.serializers import PaymentInfoSerializer
 from .models import SubmissionPayment
 from .registry import register
-from .services import update_submission_payment_registration
+from .services import schedule_payment_registration
 
 logger = logging.getLogger(__name__)
 
@@ -232,7 +232,7 @@ class PaymentReturnView(PaymentFlowBaseView, GenericAPIView):
                 )
                 raise ParseError(detail="redirect not allowed")
 
-        update_submission_payment_registration(payment.submission)
+        schedule_payment_registration(payment.submission)
 
         return response
 
@@ -305,7 +305,7 @@ class PaymentWebhookView(PaymentFlowBaseView):
 
         payment = plugin.handle_webhook(request)
         if payment:
-            update_submission_payment_registration(payment.submission)
+            schedule_payment_registration(payment.submission)
 
         return HttpResponse("")
 
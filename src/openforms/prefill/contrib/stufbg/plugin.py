@@ -5,6 +5,7 @@ from django.utils.translation import gettext_lazy as _
 
 import xmltodict
 from glom import T as Target, glom
+from requests import RequestException
 
 from openforms.authentication.constants import AuthAttribute
 from openforms.submissions.models import Submission
@@ -49,7 +50,11 @@ class StufBgPrefill(BasePlugin):
         config = StufBGConfig.get_solo()
         client = config.get_client()
 
-        response_data = client.get_values_for_attributes(submission.bsn, attributes)
+        try:
+            response_data = client.get_values_for_attributes(submission.bsn, attributes)
+        except RequestException as exc:
+            logger.error("Could not retrieve the StUF-BG values", exc_info=exc)
+            return {}
 
         dict_response = xmltodict.parse(
             response_data,
@@ -2,12 +2,14 @@ from typing import NoReturn
 
 from django.conf import settings
 from django.template import Context, Template
-from django.template.loader import get_template
+from django.template.loader import get_template, render_to_string
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
 
 from openforms.emails.utils import sanitize_content
+from openforms.submissions.attachments import get_attachment_download_url
 from openforms.submissions.models import Submission
+from openforms.utils import metrics
 from openforms.utils.email import send_mail_plus
 
 from ...base import BasePlugin
@@ -41,11 +43,33 @@ class EmailRegistration(BasePlugin):
         )
         sanitized = sanitize_content(rendered_content)
 
+        attachments = submission.attachments
+        total_size = attachments.get_total_size()
+        if total_size > settings.EMAIL_ATTACHMENTS_MAX_SIZE:
+            # too large to send by e-mail - include (expiring) download links instead.
+            # These are added after sanitizing, the domain is not necessarily allowed.
+            sanitized += render_to_string(
+                "email_registration/attachment_links.html",
+                {
+                    "links": [
+                        (
+                            attachment.get_display_name(),
+                            get_attachment_download_url(attachment),
+                        )
+                        for attachment in attachments
+                    ],
+                    "expire_days": settings.SUBMISSION_ATTACHMENT_URL_TOKEN_TIMEOUT_DAYS,
+                },
+            )
+            mail_attachments = []
+        else:
+            # the attachments are encoded in memory, at about 2.5 times this size
+            metrics.observe("emails.attachments_size", total_size)
+            mail_attachments = attachments.as_mail_attachments()
+
         default_template = get_template("confirmation_mail.html")
         content = default_template.render({"body": mark_safe(sanitized)})
 
-        attachments = submission.attachments.as_mail_tuples()
-
         send_mail_plus(
             _("[Open Forms] {} - submission {}").format(
                 submission.form.admin_name, submission.uuid
@@ -55,7 +79,7 @@ class EmailRegistration(BasePlugin):
             options["to_emails"],
             fail_silently=False,
             html_message=content,
-            attachments=attachments,
+            attachments=mail_attachments,
         )
 
     def get_reference_from_result(self, result: None) -> NoReturn:
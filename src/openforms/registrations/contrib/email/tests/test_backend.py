@@ -11,6 +11,7 @@ from openforms.forms.tests.factories import (
     FormFactory,
     FormStepFactory,
 )
+from openforms.submissions.attachments import get_attachment_download_url
 from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionFileAttachmentFactory,
@@ -81,14 +82,43 @@ class EmailBackendTests(TestCase):
         self.assertIn("foo: bar", message.body)
         self.assertIn("some_list: value1, value2", message.body)
 
+        # the attachments are encoded from storage, without reading them in memory
         self.assertEqual(len(message.attachments), 2)
-        self.assertEqual(message.attachments[0][0], "my-foo.bin")
-        self.assertEqual(message.attachments[0][1], b"content")  # still bytes
-        self.assertEqual(message.attachments[0][2], "application/foo")
+        self.assertEqual(message.attachments[0].get_filename(), "my-foo.bin")
+        self.assertEqual(message.attachments[0].get_payload(decode=True), b"content")
+        self.assertEqual(message.attachments[0].get_content_type(), "application/foo")
+
+        self.assertEqual(message.attachments[1].get_filename(), "my-bar.txt")
+        self.assertEqual(message.attachments[1].get_payload(decode=True), b"content")
+        self.assertEqual(message.attachments[1].get_content_type(), "text/bar")
+
+    @override_settings(
+        DEFAULT_FROM_EMAIL="info@open-forms.nl",
+        BASE_URL="https://forms.example.com",
+        EMAIL_ATTACHMENTS_MAX_SIZE=10,
+    )
+    def test_large_attachments_are_sent_as_links(self):
+        submission = SubmissionFactory.create(
+            form=self.form,
+            completed_on=timezone.make_aware(datetime(2021, 1, 1, 12, 0, 0)),
+        )
+        submission_step = SubmissionStepFactory.create(
+            submission=submission, form_step=self.fs, data={"foo": "bar"}
+        )
+        attachment = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            file_name="scan.pdf",
+            content__data=b"a" * 11,
+        )
 
-        self.assertEqual(message.attachments[1][0], "my-bar.txt")
-        self.assertEqual(message.attachments[1][1], "content")  # this is text now
-        self.assertEqual(message.attachments[1][2], "text/bar")
+        email_submission = EmailRegistration("email")
+        email_submission.register_submission(submission, {"to_emails": ["foo@bar.nl"]})
+
+        message = mail.outbox[0]
+        self.assertEqual(message.attachments, [])
+        download_url = get_attachment_download_url(attachment)
+        self.assertTrue(download_url.startswith("https://forms.example.com/"))
+        self.assertIn(f'<a href="{download_url}">scan.pdf</a>', message.body)
 
     @override_settings(DEFAULT_FROM_EMAIL="info@open-forms.nl")
     def test_submission_with_email_backend_strip_out_urls(self):
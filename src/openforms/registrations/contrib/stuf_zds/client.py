@@ -9,7 +9,6 @@ from django.template import loader
 from django.utils import timezone
 from django.utils.safestring import mark_safe
 
-import requests
 from defusedxml.lxml import fromstring as df_fromstring
 from lxml import etree
 from lxml.etree import Element
@@ -18,6 +17,7 @@ from requests import RequestException, Response
 from openforms.config.models import GlobalConfiguration
 from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
+from openforms.utils import resilience
 from stuf.constants import (
     STUF_ZDS_EXPIRY_MINUTES,
     EndpointSecurity,
@@ -156,7 +156,8 @@ class StufZDSClient:
         logger.debug("SOAP-request:\n%s\n%s", url, request_data)
 
         try:
-            response = requests.post(
+            response = resilience.request(
+                "POST",
                 url,
                 data=request_data,
                 headers={
@@ -3,6 +3,7 @@ from django.utils.translation import gettext_lazy as _
 
 from solo.models import SingletonModel
 
+from openforms.config.snapshot import SnapshotSingletonMixin
 from openforms.utils.validators import validate_digits
 
 
@@ -12,7 +13,7 @@ class StufZDSConfigManager(models.Manager):
         return qs.select_related("service")
 
 
-class StufZDSConfig(SingletonModel):
+class StufZDSConfig(SnapshotSingletonMixin, SingletonModel):
     """
     global configuration and defaults
     """
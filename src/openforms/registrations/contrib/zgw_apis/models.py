@@ -5,10 +5,20 @@ from django.utils.translation import gettext_lazy as _
 from solo.models import SingletonModel
 from zgw_consumers.constants import APITypes
 
+from openforms.config.snapshot import SnapshotSingletonMixin
 from openforms.utils.validators import validate_rsin
 
 
-class ZgwConfig(SingletonModel):
+class ZgwConfigManager(models.Manager):
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related("zrc_service", "drc_service", "ztc_service")
+        )
+
+
+class ZgwConfig(SnapshotSingletonMixin, SingletonModel):
     """
     global configuration and defaults
     """
@@ -58,6 +68,8 @@ class ZgwConfig(SingletonModel):
         help_text=_("Default RSIN of organization, which creates the ZAAK"),
     )
 
+    objects = ZgwConfigManager()
+
     class Meta:
         verbose_name = _("ZGW API's configuration")
 
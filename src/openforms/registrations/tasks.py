@@ -1,14 +1,19 @@
 import logging
+import random
 import traceback
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Optional
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
 from django.utils import timezone
 
+from openforms.payments.services import schedule_payment_registration
 from openforms.submissions.constants import RegistrationStatuses
 from openforms.submissions.models import Submission
 from openforms.utils.celery import maybe_retry_in_workflow
+from openforms.utils.resilience import ServiceUnavailable, find_service_unavailable
 
 from ..celery import app
 from .exceptions import RegistrationFailed
@@ -16,15 +21,98 @@ from .exceptions import RegistrationFailed
 logger = logging.getLogger(__name__)
 
 
+def get_next_attempt(
+    submission: Submission, not_before: Optional[datetime] = None
+) -> Optional[datetime]:
+    """
+    Determine when a failed registration should be retried.
+
+    The delay doubles with every attempt (up to a maximum), with a random jitter so that
+    the submissions that failed during the same outage are not all retried at once.
+
+    :param not_before: the earliest moment to retry, e.g. when the circuit breaker of
+      the backend is closed again.
+    :return: ``None`` if the registration should not be retried anymore.
+    """
+    attempts = submission.registration_attempts
+    if attempts > settings.SUBMISSION_REGISTRATION_MAX_RETRIES:
+        return None
+
+    delay = min(
+        settings.SUBMISSION_REGISTRATION_RETRY_BACKOFF * 2 ** max(attempts - 1, 0),
+        settings.SUBMISSION_REGISTRATION_RETRY_BACKOFF_MAX,
+    )
+    next_attempt = timezone.now() + timedelta(seconds=random.uniform(delay / 2, delay))
+    if not_before is not None:
+        next_attempt = max(next_attempt, not_before)
+
+    time_limit = timedelta(hours=settings.CELERY_BEAT_RESEND_SUBMISSIONS_TIME_LIMIT)
+    if next_attempt > submission.completed_on + time_limit:
+        return None
+    return next_attempt
+
+
+def _get_service_retry_time(exc: Exception) -> Optional[datetime]:
+    # the plugins may wrap the exception of the resilience layer
+    if (unavailable := find_service_unavailable(exc)) is None:
+        return None
+    return timezone.now() + timedelta(seconds=unavailable.retry_after)
+
+
+def _start_attempt(submission: Submission) -> bool:
+    """
+    Mark the registration as in progress, unless another attempt is in progress.
+
+    An attempt that started longer ago than the task time limit is considered crashed.
+    """
+    now = timezone.now()
+    crashed_before = now - timedelta(seconds=settings.CELERY_TASK_SOFT_TIME_LIMIT)
+    started = (
+        Submission.objects.filter(id=submission.id)
+        .exclude(registration_status=RegistrationStatuses.success)
+        .filter(
+            ~Q(registration_status=RegistrationStatuses.in_progress)
+            | Q(last_register_date__isnull=True)
+            | Q(last_register_date__lt=crashed_before)
+        )
+        .update(
+            registration_status=RegistrationStatuses.in_progress,
+            last_register_date=now,
+            registration_attempts=F("registration_attempts") + 1,
+        )
+    )
+    if not started:
+        return False
+
+    submission.registration_status = RegistrationStatuses.in_progress
+    submission.last_register_date = now
+    submission.registration_attempts += 1
+    return True
+
+
+def _retry_in_workflow_only(exception: Exception, task) -> bool:
+    # only the on_completion workflow marks its call. Outside of the workflow (and once
+    # the workflow gave up), the retries are scheduled by ``resend_submissions``
+    in_workflow = (task.request.kwargs or {}).get("in_workflow", False)
+    return in_workflow and getattr(task.request, "has_timeout", True)
+
+
 @maybe_retry_in_workflow(
     timeout=10,
     retry_for=(RegistrationFailed,),
+    should_retry=_retry_in_workflow_only,
 )
-@app.task(
-    autoretry_for=(RegistrationFailed,),
-    max_retries=settings.SUBMISSION_REGISTRATION_MAX_RETRIES,
-)
-def register_submission(submission_id: int) -> Optional[dict]:
+@app.task
+def register_submission(
+    submission_id: int, in_workflow: bool = False
+) -> Optional[dict]:
+    """
+    Register the submission in the registration backend of its form.
+
+    :param in_workflow: set by the on_completion workflow, which retries a failed
+      registration a few times before giving up. Otherwise, a failed registration is
+      only retried by ``resend_submissions``.
+    """
     submission = Submission.objects.get(id=submission_id)
 
     if submission.registration_status == RegistrationStatuses.success:
@@ -36,9 +124,13 @@ def register_submission(submission_id: int) -> Optional[dict]:
     if not submission.completed_on:
         raise RegistrationFailed("Submission should be completed first")
 
-    submission.last_register_date = timezone.now()
-    submission.registration_status = RegistrationStatuses.in_progress
-    submission.save(update_fields=["last_register_date", "registration_status"])
+    if not _start_attempt(submission):
+        logger.info(
+            "Registration of submission %s is already in progress, skipping",
+            submission_id,
+        )
+        return
+
     # figure out which registry and backend to use from the model field used
     form = submission.form
     backend = form.registration_backend
@@ -64,37 +156,66 @@ def register_submission(submission_id: int) -> Optional[dict]:
         result = plugin.register_submission(
             submission, options_serializer.validated_data
         )
-    except RegistrationFailed:
+    except (RegistrationFailed, ServiceUnavailable) as exc:
         formatted_tb = traceback.format_exc()
         submission.registration_status = RegistrationStatuses.failed
         submission.registration_result = {"traceback": formatted_tb}
+        submission.next_registration_attempt = get_next_attempt(
+            submission, not_before=_get_service_retry_time(exc)
+        )
         submission.save(
             update_fields=[
                 "registration_status",
                 "registration_result",
+                "next_registration_attempt",
             ]
         )
+        if isinstance(exc, ServiceUnavailable):
+            raise RegistrationFailed("The backend is unavailable") from exc
         raise
     else:
         status = RegistrationStatuses.success
 
     submission.registration_status = status
     submission.registration_result = result
+    submission.next_registration_attempt = None
     submission.save(
         update_fields=[
             "registration_status",
             "registration_result",
+            "next_registration_attempt",
         ]
     )
 
+    # the payments completed before the submission was registered
+    schedule_payment_registration(submission)
+
 
 @app.task(ignore_result=True)
 def resend_submissions():
-    resend_time_limit = timezone.now() - timedelta(
-        hours=settings.CELERY_BEAT_RESEND_SUBMISSIONS_TIME_LIMIT
-    )
-    for submission in Submission.objects.filter(
-        registration_status=RegistrationStatuses.failed,
-        completed_on__gte=resend_time_limit,
-    ):
-        register_submission.delay(submission.id)
+    """
+    Retry the failed registrations that are due, in bounded batches.
+    """
+    now = timezone.now()
+    # the retry is postponed while the task is queued, so the next run doesn't
+    # schedule it again. If the task is lost, the registration is retried after this.
+    postponed_until = now + timedelta(seconds=settings.CELERY_TASK_SOFT_TIME_LIMIT)
+
+    with transaction.atomic():
+        due = list(
+            Submission.objects.select_for_update(skip_locked=True)
+            .filter(
+                registration_status=RegistrationStatuses.failed,
+                next_registration_attempt__lte=now,
+            )
+            .order_by("next_registration_attempt")
+            .values_list("id", flat=True)[
+                : settings.SUBMISSION_REGISTRATION_RETRY_BATCH_SIZE
+            ]
+        )
+        Submission.objects.filter(id__in=due).update(
+            next_registration_attempt=postponed_until
+        )
+
+    for submission_id in due:
+        register_submission.delay(submission_id)
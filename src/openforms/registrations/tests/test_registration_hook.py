@@ -2,10 +2,10 @@
 Test the registration hook on submissions.
 """
 from datetime import timedelta
+from typing import Optional
 from unittest.mock import patch
 
-from django.conf import settings
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils import timezone
 
 from freezegun import freeze_time
@@ -15,12 +15,13 @@ from zgw_consumers.models import Service
 
 from openforms.forms.models import Form
 from openforms.submissions.constants import RegistrationStatuses
+from openforms.submissions.models import Submission
 from openforms.submissions.tests.factories import SubmissionFactory
 
 from ..base import BasePlugin
 from ..exceptions import RegistrationFailed
 from ..registry import Registry
-from ..tasks import register_submission, resend_submissions
+from ..tasks import get_next_attempt, register_submission, resend_submissions
 from .utils import patch_registry
 
 
@@ -121,6 +122,68 @@ class RegistrationHookTests(TestCase):
         tb = self.submission.registration_result["traceback"]
         self.assertIn("Can't divide by zero", tb)
         self.assertEqual(self.submission.last_register_date, timezone.now())
+        self.assertEqual(self.submission.registration_attempts, 1)
+        # first retry after 30-60 seconds (jitter)
+        self.assertGreaterEqual(
+            self.submission.next_registration_attempt,
+            timezone.now() + timedelta(seconds=30),
+        )
+        self.assertLessEqual(
+            self.submission.next_registration_attempt,
+            timezone.now() + timedelta(seconds=60),
+        )
+
+    def test_scheduled_retry_makes_one_attempt(self):
+        register = Registry()
+        calls = []
+
+        @register("callback")
+        class Plugin(BasePlugin):
+            verbose_name = "Assertion callback"
+            configuration_options = OptionsSerializer
+
+            def register_submission(self, submission, options):
+                calls.append(submission)
+                raise RegistrationFailed("down")
+
+            def get_reference_from_result(self, result: dict) -> None:
+                pass
+
+        self.submission.registration_status = RegistrationStatuses.failed
+        self.submission.next_registration_attempt = timezone.now()
+        self.submission.save()
+
+        model_field = Form._meta.get_field("registration_backend")
+        with patch_registry(model_field, register):
+            with patch(
+                "openforms.registrations.tasks.register_submission.delay",
+                new=lambda *args, **kwargs: register_submission.apply(args, kwargs),
+            ):
+                resend_submissions()
+
+        self.assertEqual(len(calls), 1)
+        self.submission.refresh_from_db()
+        self.assertEqual(self.submission.registration_attempts, 1)
+        self.assertGreater(self.submission.next_registration_attempt, timezone.now())
+
+    @freeze_time("2021-08-04T12:00:00+02:00")
+    def test_registration_in_progress_is_not_attempted_concurrently(self):
+        submission = SubmissionFactory.create(
+            completed=True,
+            registration_in_progress=True,
+            form__registration_backend="callback",
+        )
+
+        model_field = Form._meta.get_field("registration_backend")
+        with patch_registry(model_field, Registry()):
+            # the registry is empty, so the plugin lookup would raise a KeyError
+            self.assertIsNone(register_submission(submission.id))
+
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_status, RegistrationStatuses.in_progress
+        )
+        self.assertEqual(submission.registration_attempts, 0)
 
     @freeze_time("2021-08-04T12:00:00+02:00")
     def test_retrying_registration_already_succeeded_just_returns(self):
@@ -185,29 +248,95 @@ class RegistrationHookTests(TestCase):
         self.assertEqual(self.submission.last_register_date, timezone.now())
 
 
+@override_settings(
+    SUBMISSION_REGISTRATION_RETRY_BACKOFF=60,
+    SUBMISSION_REGISTRATION_RETRY_BACKOFF_MAX=60 * 60,
+    SUBMISSION_REGISTRATION_MAX_RETRIES=10,
+    CELERY_BEAT_RESEND_SUBMISSIONS_TIME_LIMIT=48,
+)
+@freeze_time("2021-08-04T12:00:00+02:00")
+class RetrySchedulingTests(SimpleTestCase):
+    def get_delay(self, attempts: int, completed_on=None) -> Optional[float]:
+        submission = Submission(
+            registration_attempts=attempts,
+            completed_on=completed_on or timezone.now(),
+        )
+        if (next_attempt := get_next_attempt(submission)) is None:
+            return None
+        return (next_attempt - timezone.now()).total_seconds()
+
+    def test_exponential_backoff_with_jitter(self):
+        for attempts, expected in [(1, 60), (2, 120), (3, 240), (7, 3600)]:
+            with self.subTest(attempts=attempts):
+                delay = self.get_delay(attempts)
+
+                self.assertGreaterEqual(delay, expected / 2)
+                self.assertLessEqual(delay, expected)
+
+    def test_no_retry_after_max_retries(self):
+        self.assertIsNone(self.get_delay(11))
+
+    def test_no_retry_after_time_limit(self):
+        completed_on = timezone.now() - timedelta(hours=47, minutes=59)
+
+        self.assertIsNone(self.get_delay(7, completed_on=completed_on))
+
+
+@override_settings(SUBMISSION_REGISTRATION_RETRY_BATCH_SIZE=2)
 class ResendSubmissionTest(TestCase):
+    @freeze_time("2021-08-04T12:00:00+02:00")
     @patch("openforms.registrations.tasks.register_submission.delay")
-    def test_resend_submission_task_only_resends_certain_submissions(self, task_mock):
-        failed_within_time_limit = SubmissionFactory.create(
-            registration_status=RegistrationStatuses.failed, completed_on=timezone.now()
+    def test_resend_submission_task_only_resends_due_submissions(self, task_mock):
+        now = timezone.now()
+        due = SubmissionFactory.create(
+            completed=True,
+            registration_failed=True,
+            next_registration_attempt=now - timedelta(minutes=1),
         )
-        # Outside time limit
+        # not due yet
         SubmissionFactory.create(
-            registration_status=RegistrationStatuses.failed,
-            completed_on=(
-                timezone.now()
-                - timedelta(
-                    hours=settings.CELERY_BEAT_RESEND_SUBMISSIONS_TIME_LIMIT + 1
-                )
-            ),
+            completed=True,
+            registration_failed=True,
+            next_registration_attempt=now + timedelta(minutes=1),
+        )
+        # not retried anymore
+        SubmissionFactory.create(
+            completed=True, registration_failed=True, next_registration_attempt=None
         )
         # Not failed
         SubmissionFactory.create(
+            completed=True,
             registration_status=RegistrationStatuses.pending,
-            completed_on=timezone.now(),
+            next_registration_attempt=now - timedelta(minutes=1),
         )
 
         resend_submissions()
 
-        self.assertEqual(task_mock.call_count, 1)
-        task_mock.assert_called_once_with(failed_within_time_limit.id)
+        task_mock.assert_called_once_with(due.id)
+        # a second run does not schedule it again while the task is queued
+        task_mock.reset_mock()
+
+        resend_submissions()
+
+        task_mock.assert_not_called()
+
+    @freeze_time("2021-08-04T12:00:00+02:00")
+    @patch("openforms.registrations.tasks.register_submission.delay")
+    def test_resend_submissions_in_batches(self, task_mock):
+        now = timezone.now()
+        submissions = [
+            SubmissionFactory.create(
+                completed=True,
+                registration_failed=True,
+                next_registration_attempt=now - timedelta(minutes=minutes),
+            )
+            for minutes in (1, 3, 2)
+        ]
+
+        resend_submissions()
+
+        # the submissions that are overdue the longest go first
+        self.assertEqual(
+            [call.args[0] for call in task_mock.call_args_list],
+            [submissions[1].id, submissions[2].id],
+        )
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.http.multipartparser import (
+    MultiPartParser as DjangoMultiPartParser,
+    MultiPartParserError,
+)
+from django.template.defaultfilters import filesizeformat
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import DataAndFiles, MultiPartParser
+
+from openforms.api.exceptions import RequestEntityTooLarge
+
+from ..upload_handlers import TemporaryFileUploadHandler
+
+
+class TemporaryFileUploadParser(MultiPartParser):
+    """
+    Parse the multipart body, streaming the uploaded file into its final location.
+
+    See :class:`openforms.submissions.upload_handlers.TemporaryFileUploadHandler`.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        request = parser_context["request"]
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        meta = request.META.copy()
+        meta["CONTENT_TYPE"] = media_type
+
+        handler = TemporaryFileUploadHandler(request)
+        # the view removes the streamed file if it doesn't end up being saved
+        request.temporary_upload_handler = handler
+        upload_handlers = [handler, *request.upload_handlers]
+        try:
+            parser = DjangoMultiPartParser(meta, stream, upload_handlers, encoding)
+            data, files = parser.parse()
+        except MultiPartParserError as exc:
+            handler.discard()
+            raise ParseError("Multipart form parse error - %s" % str(exc))
+        except Exception:
+            handler.discard()
+            raise
+
+        if handler.multiple_files:
+            raise ParseError(_("Only one file can be uploaded per request."))
+        if handler.too_large:
+            raise RequestEntityTooLarge(
+                _("The file may not be larger than {max_size}.").format(
+                    max_size=filesizeformat(settings.TEMPORARY_UPLOADS_MAX_SIZE)
+                )
+            )
+        return DataAndFiles(data, files)
@@ -4,8 +4,10 @@ from rest_framework.views import APIView
 
 from openforms.api.permissions import TimestampedTokenPermission
 
+from .. import ownership
 from ..constants import SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY
 from ..tokens import (
+    submission_attachment_token_generator,
     submission_report_token_generator,
     submission_status_token_generator,
 )
@@ -20,11 +22,7 @@ class AnyActiveSubmissionPermission(permissions.BasePermission):
         if getattr(view, "action", None) in ("create",):
             return True
 
-        active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY)
-        if not active_submissions:
-            return False
-
-        return True
+        return ownership.has_any(request.session, SUBMISSIONS_SESSION_KEY)
 
 
 class ActiveSubmissionPermission(AnyActiveSubmissionPermission):
@@ -33,18 +31,18 @@ class ActiveSubmissionPermission(AnyActiveSubmissionPermission):
     """
 
     def has_object_permission(self, request: Request, view: APIView, obj) -> bool:
-        active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY)
-
         default_url_kwarg = view.lookup_url_kwarg or view.lookup_field
         submission_url_kwarg = getattr(view, "submission_url_kwarg", default_url_kwarg)
 
         submission_uuid = view.kwargs[submission_url_kwarg]
 
         # Use str so this works with both UUIDs and UUIDs in string format
-        return str(submission_uuid) in active_submissions
+        return ownership.contains(
+            request.session, SUBMISSIONS_SESSION_KEY, str(submission_uuid)
+        )
 
     def filter_queryset(self, request: Request, view: APIView, queryset):
-        active_submissions = request.session.get(SUBMISSIONS_SESSION_KEY)
+        active_submissions = ownership.get_all(request.session, SUBMISSIONS_SESSION_KEY)
         if not active_submissions:
             return queryset.none()
         return queryset.filter(uuid__in=active_submissions)
@@ -56,21 +54,18 @@ class OwnsTemporaryUploadPermission(permissions.BasePermission):
     """
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
-        if not active_uploads:
-            return False
-        return True
+        return ownership.has_any(request.session, UPLOADS_SESSION_KEY)
 
     def has_object_permission(self, request: Request, view: APIView, obj) -> bool:
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
-
         upload_url_kwarg = view.lookup_url_kwarg or view.lookup_field
         upload_uuid = view.kwargs[upload_url_kwarg]
 
-        return str(upload_uuid) in active_uploads
+        return ownership.contains(
+            request.session, UPLOADS_SESSION_KEY, str(upload_uuid)
+        )
 
     def filter_queryset(self, request: Request, view: APIView, queryset):
-        active_uploads = request.session.get(UPLOADS_SESSION_KEY)
+        active_uploads = ownership.get_all(request.session, UPLOADS_SESSION_KEY)
         if not active_uploads:
             return queryset.none()
         return queryset.filter(uuid__in=active_uploads)
@@ -80,5 +75,9 @@ class DownloadSubmissionReportPermission(TimestampedTokenPermission):
     token_generator = submission_report_token_generator
 
 
+class DownloadSubmissionAttachmentPermission(TimestampedTokenPermission):
+    token_generator = submission_attachment_token_generator
+
+
 class SubmissionStatusPermission(TimestampedTokenPermission):
     token_generator = submission_status_token_generator
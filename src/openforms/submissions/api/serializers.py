@@ -1,8 +1,6 @@
 import logging
 from dataclasses import dataclass
 
-from django.conf import settings
-from django.core.mail import send_mail
 from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -18,6 +16,7 @@ from ...forms.validators import validate_not_maintainance_mode
 from ..constants import ProcessingResults, ProcessingStatuses
 from ..form_logic import evaluate_form_logic
 from ..models import Submission, SubmissionStep, TemporaryFileUpload
+from ..tasks import send_suspension_notification
 from .fields import NestedRelatedField
 
 logger = logging.getLogger(__name__)
@@ -269,18 +268,9 @@ class SubmissionSuspensionSerializer(serializers.ModelSerializer):
         email = validated_data.pop("email")
         instance.suspended_on = timezone.now()
         instance = super().update(instance, validated_data)
-        transaction.on_commit(lambda: self.notify_suspension(instance, email))
+        transaction.on_commit(lambda: send_suspension_notification.delay(email))
         return instance
 
-    def notify_suspension(self, instance: Submission, email: str):
-        logger.info("TODO: properly implement sending e-mail with magic link")
-        send_mail(
-            _("Your form submission"),
-            "Submission is suspended. Resume here: <link>",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[email],
-        )
-
 
 class TemporaryFileUploadSerializer(serializers.Serializer):
     """
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from .views import (
+    DownloadSubmissionAttachmentView,
     DownloadSubmissionReportView,
     TemporaryFileUploadView,
     TemporaryFileView,
@@ -14,6 +15,11 @@ urlpatterns = [
         DownloadSubmissionReportView.as_view(),
         name="download-submission",
     ),
+    path(
+        "attachments/<uuid:uuid>/<str:token>/download",
+        DownloadSubmissionAttachmentView.as_view(),
+        name="download-attachment",
+    ),
     path(
         "files/upload",
         TemporaryFileUploadView.as_view(),
@@ -7,14 +7,16 @@ from django.utils.translation import gettext_lazy as _
 from django_sendfile import sendfile
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework.generics import DestroyAPIView, GenericAPIView
-from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
 from ..attachments import clean_mime_type
-from ..models import SubmissionReport, TemporaryFileUpload
+from ..models import SubmissionFileAttachment, SubmissionReport, TemporaryFileUpload
+from ..upload_handlers import StoredUploadedFile
 from ..utils import add_upload_to_session, remove_upload_from_session
+from .parsers import TemporaryFileUploadParser
 from .permissions import (
     AnyActiveSubmissionPermission,
+    DownloadSubmissionAttachmentPermission,
     DownloadSubmissionReportPermission,
     OwnsTemporaryUploadPermission,
 )
@@ -58,6 +60,35 @@ class DownloadSubmissionReportView(GenericAPIView):
         return sendfile(request, filename, **sendfile_options)
 
 
+@extend_schema(
+    summary=_("Download a submission attachment"),
+    description=_(
+        "Download an attachment of a submission. Links to this endpoint are sent in "
+        "the registration e-mail when the attachments are too large to include in the "
+        "e-mail. The endpoint requires a token, which automatically expires after "
+        "{expire_days} day(s)."
+    ).format(expire_days=settings.SUBMISSION_ATTACHMENT_URL_TOKEN_TIMEOUT_DAYS),
+    responses={200: bytes},
+)
+class DownloadSubmissionAttachmentView(GenericAPIView):
+    queryset = SubmissionFileAttachment.objects.all()
+    lookup_field = "uuid"
+    authentication_classes = ()
+    permission_classes = (DownloadSubmissionAttachmentPermission,)
+    renderer_classes = (FileRenderer,)
+    serializer_class = None
+
+    def get(self, request, *args, **kwargs):
+        attachment = self.get_object()
+        return sendfile(
+            request,
+            attachment.content.path,
+            attachment=True,
+            attachment_filename=attachment.get_display_name(),
+            mimetype=attachment.content_type,
+        )
+
+
 @extend_schema(
     summary=_("Create temporary file upload"),
     description=_(
@@ -69,14 +100,29 @@ class DownloadSubmissionReportView(GenericAPIView):
     ).format(expire_days=settings.TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS),
 )
 class TemporaryFileUploadView(GenericAPIView):
-    parser_classes = [MultiPartParser]
+    parser_classes = [TemporaryFileUploadParser]
     serializer_class = TemporaryFileUploadSerializer
     authentication_classes = []
     permission_classes = [AnyActiveSubmissionPermission]
 
     def post(self, request, *args, **kwargs):
+        try:
+            upload = self.create_upload()
+        finally:
+            # remove the streamed file if it was not saved, e.g. because the request
+            # is invalid or saving failed
+            handler = getattr(request, "temporary_upload_handler", None)
+            if handler is not None:
+                handler.discard()
+
+        add_upload_to_session(upload, self.request.session)
+        return Response(
+            self.serializer_class(instance=upload, context={"request": request}).data
+        )
+
+    def create_upload(self) -> TemporaryFileUpload:
         serializer = self.get_serializer(
-            data=request.data,
+            data=self.request.data,
         )
         serializer.is_valid(raise_exception=True)
         file = serializer.validated_data["file"]
@@ -85,16 +131,15 @@ class TemporaryFileUploadView(GenericAPIView):
         name, ext = os.path.splitext(file.name)
         name = name[: 255 - len(ext)] + ext
 
-        upload = TemporaryFileUpload.objects.create(
-            content=file,
-            file_name=name,
-            content_type=clean_mime_type(file.content_type),
-        )
-        add_upload_to_session(upload, self.request.session)
-
-        return Response(
-            self.serializer_class(instance=upload, context={"request": request}).data
-        )
+        if isinstance(file, StoredUploadedFile):
+            # already written to the storage while parsing
+            upload = file.upload
+        else:
+            upload = TemporaryFileUpload(content=file)
+        upload.file_name = name
+        upload.content_type = clean_mime_type(file.content_type)
+        upload.save()
+        return upload
 
 
 @extend_schema(
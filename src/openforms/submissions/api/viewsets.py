@@ -20,7 +20,10 @@ from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSet
 from ..attachments import attach_uploads_to_submission_step
 from ..form_logic import evaluate_form_logic
 from ..models import Submission, SubmissionStep
-from ..parsers import IgnoreDataFieldCamelCaseJSONParser
+from ..parsers import (
+    IgnoreDataFieldCamelCaseJSONParser,
+    IgnoreDataFieldCamelCaseJSONRenderer,
+)
 from ..status import SubmissionProcessingStatus
 from ..tasks import on_completion
 from ..tokens import submission_status_token_generator
@@ -240,6 +243,7 @@ class SubmissionStepViewSet(
     lookup_url_kwarg = "step_uuid"
     submission_url_kwarg = "submission_uuid"
     parser_classes = [IgnoreDataFieldCamelCaseJSONParser]
+    renderer_classes = [IgnoreDataFieldCamelCaseJSONRenderer]
 
     def get_object(self):
         """
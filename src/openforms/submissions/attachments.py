@@ -2,10 +2,11 @@ import os.path
 import re
 from datetime import timedelta
 from typing import Iterable, Optional, Tuple
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
+from django.conf import settings
 from django.core.files.temp import NamedTemporaryFile
-from django.urls import Resolver404, resolve
+from django.urls import Resolver404, resolve, reverse
 
 import PIL
 from glom import glom
@@ -18,6 +19,8 @@ from openforms.submissions.models import (
     TemporaryFileUpload,
 )
 
+from .tokens import submission_attachment_token_generator
+
 DEFAULT_IMAGE_MAX_SIZE = (10000, 10000)
 
 
@@ -52,6 +55,18 @@ def clean_mime_type(mimetype: str) -> str:
         return m.group()
 
 
+def get_attachment_download_url(attachment: SubmissionFileAttachment) -> str:
+    """
+    Return an (expiring) absolute URL to download the attachment.
+    """
+    token = submission_attachment_token_generator.make_token(attachment)
+    path = reverse(
+        "api:submissions:download-attachment",
+        kwargs={"uuid": attachment.uuid, "token": token},
+    )
+    return urljoin(settings.BASE_URL, path)
+
+
 def append_file_num_postfix(
     original_name: str, new_name: str, num: int, max: int
 ) -> str:
@@ -0,0 +1,58 @@
+# Generated by Django 2.2.24 on 2021-10-21 09:12
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def schedule_failed_registrations(apps, _):
+    """
+    Retry the failed registrations that the periodic task would still have resent.
+    """
+    Submission = apps.get_model("submissions", "Submission")
+    now = timezone.now()
+    Submission.objects.filter(
+        registration_status="failed",
+        completed_on__gte=now
+        - timedelta(hours=settings.CELERY_BEAT_RESEND_SUBMISSIONS_TIME_LIMIT),
+    ).update(next_registration_attempt=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0034_remove_submission_on_completion_task_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="registration_attempts",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="How often the registration in the backend was attempted.",
+                verbose_name="registration attempts",
+            ),
+        ),
+        migrations.AddField(
+            model_name="submission",
+            name="next_registration_attempt",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the failed registration will be retried. Empty if no retry is scheduled (anymore).",
+                null=True,
+                verbose_name="next registration attempt",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                condition=models.Q(registration_status="failed"),
+                fields=["next_registration_attempt"],
+                name="submission_registration_due",
+            ),
+        ),
+        migrations.RunPython(schedule_failed_registrations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.24 on 2021-10-26 08:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0035_submission_registration_retries"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE SEQUENCE IF NOT EXISTS submissions_public_reference_seq",
+            "DROP SEQUENCE IF EXISTS submissions_public_reference_seq",
+        ),
+    ]
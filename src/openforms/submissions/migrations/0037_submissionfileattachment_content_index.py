@@ -0,0 +1,29 @@
+# Generated by Django 2.2.24 on 2021-10-29 09:47
+
+from django.db import migrations
+
+import privates.fields
+import privates.storages
+
+import openforms.submissions.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0036_public_reference_sequence"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="submissionfileattachment",
+            name="content",
+            field=privates.fields.PrivateMediaFileField(
+                db_index=True,
+                help_text="Content of the submission file attachment.",
+                storage=privates.storages.PrivateMediaFileSystemStorage(),
+                upload_to=openforms.submissions.models.submission_file_upload_to,
+                verbose_name="content",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.24 on 2021-10-29 15:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0037_submissionfileattachment_content_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="temporaryfileupload",
+            name="checksum",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 checksum of the content, computed while uploading.",
+                max_length=64,
+                verbose_name="checksum",
+            ),
+        ),
+    ]
@@ -4,13 +4,14 @@ import uuid
 from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Any, Dict, List, Mapping, Optional, Tuple
+from email.mime.base import MIMEBase
+from typing import Dict, List, Mapping, Optional, Tuple
 
+from django.conf import settings
 from django.contrib.postgres.fields import JSONField
 from django.core.files.base import ContentFile, File
 from django.db import models, transaction
 from django.shortcuts import render
-from django.template import Context, Template
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -21,9 +22,12 @@ from privates.fields import PrivateMediaFileField
 from weasyprint import HTML
 
 from openforms.config.models import GlobalConfiguration
+from openforms.config.snapshot import snapshot
 from openforms.emails.utils import sanitize_content
 from openforms.forms.models import FormStep
+from openforms.utils.email import encode_attachment
 from openforms.utils.fields import StringUUIDField
+from openforms.utils.templates import render_from_string
 from openforms.utils.validators import validate_bsn
 
 from ..contrib.kvk.validators import validate_kvk
@@ -79,6 +83,13 @@ class SubmissionState:
 
 
 def _get_config_field(field: str) -> str:
+    # the configuration is (nearly) always loaded already by the time submissions
+    # are created
+    if settings.CONFIG_SNAPSHOT_ENABLED and (
+        config := snapshot.peek(GlobalConfiguration)
+    ):
+        return getattr(config, field)
+
     # workaround for when this function is called during migrations and the table
     # hasn't fully migrated yet
     qs = GlobalConfiguration.objects.values_list(field, flat=True)
@@ -147,6 +158,20 @@ class Submission(models.Model):
             "Indication whether the registration in the configured backend was successful."
         ),
     )
+    registration_attempts = models.PositiveIntegerField(
+        _("registration attempts"),
+        default=0,
+        help_text=_("How often the registration in the backend was attempted."),
+    )
+    next_registration_attempt = models.DateTimeField(
+        _("next registration attempt"),
+        blank=True,
+        null=True,
+        help_text=_(
+            "When the failed registration will be retried. Empty if no retry is "
+            "scheduled (anymore)."
+        ),
+    )
     public_registration_reference = models.CharField(
         _("public registration reference"),
         max_length=100,
@@ -197,6 +222,14 @@ class Submission(models.Model):
                 condition=~models.Q(public_registration_reference=""),
             )
         ]
+        indexes = [
+            # the scheduler only looks up the failed registrations that are due
+            models.Index(
+                fields=("next_registration_attempt",),
+                name="submission_registration_due",
+                condition=models.Q(registration_status=RegistrationStatuses.failed),
+            )
+        ]
 
     def __str__(self):
         return _("{pk} - started on {started}").format(
@@ -276,7 +309,7 @@ class Submission(models.Model):
             "public_reference": self.public_registration_reference,
             **self.data,
         }
-        rendered_content = Template(template).render(Context(context_data))
+        rendered_content = render_from_string(template, context_data)
 
         return sanitize_content(rendered_content)
 
@@ -576,6 +609,12 @@ class TemporaryFileUpload(models.Model):
     )
     file_name = models.CharField(_("original name"), max_length=255)
     content_type = models.CharField(_("content type"), max_length=255)
+    checksum = models.CharField(
+        _("checksum"),
+        max_length=64,
+        blank=True,
+        help_text=_("SHA-256 checksum of the content, computed while uploading."),
+    )
     created_on = models.DateTimeField(_("created on"), auto_now_add=True)
 
     objects = TemporaryFileUploadQuerySet.as_manager()
@@ -585,7 +624,9 @@ class TemporaryFileUpload(models.Model):
         verbose_name_plural = _("temporary file upload")
 
     def delete(self, using=None, keep_parents=False):
-        self.content.delete(save=False)
+        # the file is shared with the attachments that claimed this upload
+        if not self.attachments.filter(content=self.content.name).exists():
+            self.content.delete(save=False)
         super().delete(using=using, keep_parents=keep_parents)
 
 
@@ -599,8 +640,30 @@ class SubmissionFileAttachmentQuerySet(models.QuerySet):
             files[file.form_key].append(file)
         return dict(files)
 
-    def as_mail_tuples(self) -> List[Tuple[str, Any, str]]:
-        return [(f.get_display_name(), f.content.read(), f.content_type) for f in self]
+    def get_total_size(self) -> int:
+        return sum(attachment.content.size for attachment in self)
+
+    def as_mail_attachments(self) -> List[MIMEBase]:
+        """
+        Encode the attachments for e-mails.
+
+        The encoded attachments are held in memory, see :func:`encode_attachment`.
+        """
+        return [
+            encode_attachment(
+                attachment.content,
+                attachment.get_display_name(),
+                attachment.content_type,
+            )
+            for attachment in self
+        ]
+
+
+def _is_same_storage(storage, other) -> bool:
+    if storage is other:
+        return True
+    deconstruct = getattr(storage, "deconstruct", None)
+    return deconstruct is not None and deconstruct() == other.deconstruct()
 
 
 class SubmissionFileAttachmentManager(models.Manager):
@@ -626,8 +689,7 @@ class SubmissionFileAttachmentManager(models.Manager):
                     submission_step=submission_step,
                     temporary_file=upload,
                     form_key=form_key,
-                    # wrap in File() so it will be physically copied
-                    content=File(upload.content, name=upload.file_name),
+                    content=self._claim_content(upload),
                     content_type=upload.content_type,
                     original_name=upload.file_name,
                     file_name=file_name,
@@ -635,6 +697,20 @@ class SubmissionFileAttachmentManager(models.Manager):
                 True,
             )
 
+    def _claim_content(self, upload: TemporaryFileUpload):
+        """
+        Share the file of the upload, unless the attachments are stored elsewhere.
+
+        Sharing avoids copying the (possibly large) file, and creating the attachment
+        only writes the database row, so it is rolled back with the transaction. The
+        file is deleted with the last of the upload and the attachments using it.
+        """
+        storage = self.model._meta.get_field("content").storage
+        if not _is_same_storage(storage, upload.content.storage):
+            # wrap in File() so it will be physically copied
+            return File(upload.content, name=upload.file_name)
+        return upload.content.name
+
 
 class SubmissionFileAttachment(models.Model):
     uuid = StringUUIDField(_("UUID"), unique=True, default=uuid.uuid4)
@@ -660,6 +736,8 @@ class SubmissionFileAttachment(models.Model):
         verbose_name=_("content"),
         upload_to=submission_file_upload_to,
         help_text=_("Content of the submission file attachment."),
+        # the file may be shared with other attachments of the same upload
+        db_index=True,
     )
     file_name = models.CharField(
         _("file name"), max_length=255, help_text=_("reformatted file name"), blank=True
@@ -679,9 +757,20 @@ class SubmissionFileAttachment(models.Model):
         verbose_name_plural = _("submission file attachments")
 
     def delete(self, using=None, keep_parents=False):
-        self.content.delete(save=False)
+        if not self.is_content_shared():
+            self.content.delete(save=False)
         super().delete(using=using, keep_parents=keep_parents)
 
+    def is_content_shared(self) -> bool:
+        """
+        Check if the file is still used by the temporary upload or other attachments.
+        """
+        name = self.content.name
+        if self.temporary_file and self.temporary_file.content.name == name:
+            return True
+        others = SubmissionFileAttachment.objects.exclude(pk=self.pk)
+        return others.filter(content=name).exists()
+
     def get_display_name(self):
         return self.file_name or self.original_name
 
@@ -0,0 +1,129 @@
+"""
+Track the submissions and temporary uploads that belong to a user session.
+
+The identifiers are kept in Redis sets, outside of the session data, so that adding
+and removing an identifier are atomic (concurrent requests don't overwrite each
+other's changes) and don't rewrite the whole session. The sets belong to an owner ID
+that is stored in the session once. Unlike the session key, this ID survives
+:meth:`SessionBase.cycle_key`, while :meth:`SessionBase.flush` discards it.
+
+When the ``settings.SESSION_OWNERSHIP_CACHE`` cache is not a Redis cache, the
+identifiers are stored in lists in the session, like before. These lists are also
+checked when Redis is used, so sessions created before the sets were introduced keep
+access to their submissions and uploads.
+"""
+import uuid
+from typing import Any, Iterable, Optional, Set
+
+from django.conf import settings
+from django.contrib.sessions.backends.base import SessionBase
+
+from openforms.utils.redis import get_redis_connection
+
+from .constants import SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY
+
+OWNER_SESSION_KEY = "form-owner"
+KEY_PREFIX = "ownership"
+
+
+def append_to_session_list(session: SessionBase, session_key: str, value: Any) -> None:
+    # note: possible race condition with concurrent requests
+    active = session.get(session_key, [])
+    if value not in active:
+        active.append(value)
+        session[session_key] = active
+
+
+def remove_from_session_list(
+    session: SessionBase, session_key: str, value: Any
+) -> None:
+    # note: possible race condition with concurrent requests
+    active = session.get(session_key, [])
+    if value in active:
+        active.remove(value)
+        session[session_key] = active
+
+
+def _get_owner(session: SessionBase, create: bool = False) -> Optional[str]:
+    owner = session.get(OWNER_SESSION_KEY)
+    if owner is None and create:
+        owner = session[OWNER_SESSION_KEY] = uuid.uuid4().hex
+    return owner
+
+
+def _get_key(owner: str, kind: str) -> str:
+    return f"{KEY_PREFIX}:{owner}:{kind}"
+
+
+def add(session: SessionBase, kind: str, value: str) -> None:
+    """
+    Register ``value`` as owned by the session.
+
+    :param kind: the kind of identifier, e.g.
+      :data:`openforms.submissions.constants.SUBMISSIONS_SESSION_KEY`.
+    """
+    if (connection := get_redis_connection(settings.SESSION_OWNERSHIP_CACHE)) is None:
+        append_to_session_list(session, kind, value)
+        return
+
+    key = _get_key(_get_owner(session, create=True), kind)
+    pipeline = connection.pipeline()
+    pipeline.sadd(key, value)
+    # the set doesn't need to outlive the session
+    pipeline.expire(key, session.get_expiry_age())
+    pipeline.execute()
+
+
+def refresh(session: SessionBase, timeout: int) -> None:
+    """
+    Extend the lifetime of the sets along with the (sliding) session expiry.
+    """
+    connection = get_redis_connection(settings.SESSION_OWNERSHIP_CACHE)
+    if connection is None or (owner := _get_owner(session)) is None:
+        return
+    pipeline = connection.pipeline()
+    for kind in (SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY):
+        pipeline.expire(_get_key(owner, kind), timeout)
+    pipeline.execute()
+
+
+def remove(session: SessionBase, kind: str, *values: str) -> None:
+    for value in values:
+        remove_from_session_list(session, kind, value)
+
+    connection = get_redis_connection(settings.SESSION_OWNERSHIP_CACHE)
+    owner = _get_owner(session)
+    if connection is None or owner is None or not values:
+        return
+    connection.srem(_get_key(owner, kind), *values)
+
+
+def contains(session: SessionBase, kind: str, value: str) -> bool:
+    if value in session.get(kind, []):
+        return True
+
+    connection = get_redis_connection(settings.SESSION_OWNERSHIP_CACHE)
+    if connection is None or (owner := _get_owner(session)) is None:
+        return False
+    return bool(connection.sismember(_get_key(owner, kind), value))
+
+
+def get_all(session: SessionBase, kind: str) -> Set[str]:
+    values = set(session.get(kind, []))
+
+    connection = get_redis_connection(settings.SESSION_OWNERSHIP_CACHE)
+    if connection is None or (owner := _get_owner(session)) is None:
+        return values
+    members: Iterable[bytes] = connection.smembers(_get_key(owner, kind))
+    return values | {member.decode() for member in members}
+
+
+def has_any(session: SessionBase, kind: str) -> bool:
+    if session.get(kind):
+        return True
+
+    connection = get_redis_connection(settings.SESSION_OWNERSHIP_CACHE)
+    if connection is None or (owner := _get_owner(session)) is None:
+        return False
+    # empty sets are removed by Redis
+    return bool(connection.exists(_get_key(owner, kind)))
@@ -1,5 +1,11 @@
-from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from openforms.api.parsers import OpaqueFieldsCamelCaseJSONParser
+from openforms.api.renderers import OpaqueFieldsCamelCaseJSONRenderer
 
 
-class IgnoreDataFieldCamelCaseJSONParser(CamelCaseJSONParser):
-    json_underscoreize = {"ignore_fields": ("data",)}
+class IgnoreDataFieldCamelCaseJSONParser(OpaqueFieldsCamelCaseJSONParser):
+    opaque_fields = ("data",)
+
+
+class IgnoreDataFieldCamelCaseJSONRenderer(OpaqueFieldsCamelCaseJSONRenderer):
+    # the step data is keyed by the Form.io component keys, which must be left as-is
+    opaque_fields = ("configuration", "data")
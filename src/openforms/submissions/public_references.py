@@ -0,0 +1,78 @@
+"""
+Allocate the public references of submissions.
+
+The references are derived from a database sequence, so every reference is unique
+without checking the existing references, and submissions completed at the same time
+never get the same reference. To not reveal the number of submissions (and to keep the
+references hard to guess), the sequence value is passed through a keyed permutation of
+all possible references: a format-preserving cipher (FE1, a Feistel network over the
+integers modulo the number of references) with a key derived from the ``SECRET_KEY``.
+
+The references have 6 characters. Once all 34^6 (about 1.5 billion) references are
+used, they get 7 characters, and so on.
+"""
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+
+ALPHABET = "ABCDEFGHIJKLMNPQRSTUVWXYZ123456789"
+MIN_LENGTH = 6
+ROUNDS = 8
+SEQUENCE = "submissions_public_reference_seq"
+KEY_SALT = "openforms.submissions.public_references"
+
+
+def next_sequence_value() -> int:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT nextval(%s)", [SEQUENCE])
+        (value,) = cursor.fetchone()
+    return value
+
+
+def _round_function(round_: int, value: int, modulus: int) -> int:
+    digest = salted_hmac(KEY_SALT, f"{round_}:{value}").digest()
+    return int.from_bytes(digest, "big") % modulus
+
+
+def permute(value: int, a: int, b: int) -> int:
+    """
+    Map ``value`` to another value in ``[0, a * b)``, one-to-one.
+    """
+    assert 0 <= value < a * b
+    for round_ in range(ROUNDS):
+        left, right = divmod(value, b)
+        value = a * right + (left + _round_function(round_, right, a)) % a
+    return value
+
+
+def encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, index = divmod(value, len(ALPHABET))
+        chars.append(ALPHABET[index])
+    return "".join(reversed(chars))
+
+
+def get_reference(index: int) -> str:
+    """
+    Return the reference for the ``index``-th allocated reference (starting at 0).
+    """
+    length = MIN_LENGTH
+    while index >= len(ALPHABET) ** length:
+        index -= len(ALPHABET) ** length
+        length += 1
+    half = length // 2
+    permuted = permute(index, len(ALPHABET) ** half, len(ALPHABET) ** (length - half))
+    return encode(permuted, length)
+
+
+def allocate_reference() -> str:
+    """
+    Allocate a new reference, formatted with ``settings.SUBMISSION_REFERENCE_FORMAT``.
+    """
+    # sequences start at 1
+    reference = get_reference(next_sequence_value() - 1)
+    return settings.SUBMISSION_REFERENCE_FORMAT.format(
+        reference=reference, year=timezone.localdate().year
+    )
@@ -24,7 +24,7 @@ def on_completion(submission_id: int) -> None:
     register_appointment_task = maybe_register_appointment.si(submission_id)
     update_appointment_task = maybe_update_appointment.si(submission_id)
     generate_report_task = generate_submission_report.si(submission_id)
-    register_submission_task = register_submission.si(submission_id)
+    register_submission_task = register_submission.si(submission_id, in_workflow=True)
     obtain_submission_reference_task = obtain_submission_reference.si(submission_id)
     finalize_completion_task = finalize_completion.si(submission_id)
 
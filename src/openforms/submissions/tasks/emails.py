@@ -1,13 +1,34 @@
+import logging
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils.translation import gettext as _
+
 from openforms.celery import app
 
 from ..models import Submission
 from ..utils import send_confirmation_email
 
-__all__ = ["maybe_send_confirmation_email"]
+__all__ = ["maybe_send_confirmation_email", "send_suspension_notification"]
+
+logger = logging.getLogger(__name__)
 
 
 @app.task(bind=True, ignore_result=True)
 def maybe_send_confirmation_email(task, submission_id: int) -> None:
-    submission = Submission.objects.get(id=submission_id)
+    submission = Submission.objects.select_related(
+        "form__confirmation_email_template"
+    ).get(id=submission_id)
     if hasattr(submission.form, "confirmation_email_template"):
         send_confirmation_email(submission)
+
+
+@app.task(ignore_result=True)
+def send_suspension_notification(email: str) -> None:
+    logger.info("TODO: properly implement sending e-mail with magic link")
+    send_mail(
+        _("Your form submission"),
+        "Submission is suspended. Resume here: <link>",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[email],
+    )
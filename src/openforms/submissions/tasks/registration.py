@@ -1,12 +1,12 @@
 import logging
 
 from django.db import IntegrityError, transaction
-from django.utils.crypto import get_random_string
 
 from openforms.celery import app
 from openforms.registrations.tasks import register_submission
 
 from ..models import Submission
+from ..public_references import allocate_reference
 
 __all__ = ["register_submission", "obtain_submission_reference"]
 
@@ -32,8 +32,10 @@ def obtain_submission_reference(submission_id: int) -> str:
         )
         return
 
-    # race-condition detection. There's no reason/logic after the number 5 other than
-    # gut feeling.
+    # race-condition detection. Generated references are unique, but a reference
+    # taken from the registration result or generated before the references were
+    # allocated from a sequence may already be in use. There's no reason/logic after
+    # the number 5 other than gut feeling.
     MAX_NUM_ATTEMPTS = 5
     race_condition_suspected, save_attempts = False, 0
 
@@ -86,34 +88,8 @@ def get_reference_for_submission(submission: Submission) -> str:
     return reference
 
 
-def get_random_reference() -> str:
-    # 36 characters with length 6 -> 36^6 possible combinations.
-    # that's roughly 1.5 billion combinations before we run out of options.
-    # Also note that submissions are pruned after a (configurable) number of days, so
-    # used references do become available again after that time.
-    # TODO: maybe include date param?
-    random_string = get_random_string(
-        length=6, allowed_chars="ABCDEFGHIJKLMNPQRSTUVWXYZ123456789"
-    )
-    return f"OF-{random_string}"
-
-
 def generate_unique_submission_reference() -> str:
     """
-    Generate a random but unique reference.
+    Generate a random looking but unique reference.
     """
-    MAX_ATTEMPTS = 100  # ensure we have finite loops (while is evil)
-    iterations = 0
-
-    for _ in range(MAX_ATTEMPTS):
-        iterations += 1
-        reference = get_random_reference()
-        exists = Submission.objects.filter(
-            public_registration_reference=reference
-        ).exists()
-        if exists is False:
-            return reference
-
-    # loop ran all the way to the end without finding unused reference
-    # (otherwise it would have returned)
-    raise RuntimeError(f"Could not get a unused reference after {iterations} attempts!")
+    return allocate_reference()
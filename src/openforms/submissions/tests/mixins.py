@@ -1,5 +1,6 @@
 from ..constants import SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY
 from ..models import Submission, TemporaryFileUpload
+from ..ownership import OWNER_SESSION_KEY
 
 
 class SubmissionsMixin:
@@ -21,4 +22,5 @@ class SubmissionsMixin:
         session = self.client.session
         session[SUBMISSIONS_SESSION_KEY] = []
         session[UPLOADS_SESSION_KEY] = []
+        session.pop(OWNER_SESSION_KEY, None)
         session.save()
@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+from django.contrib.sessions.backends.cache import SessionStore
+from django.test import SimpleTestCase
+
+from .. import ownership
+from ..constants import SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY
+
+
+class FakeRedis:
+    """
+    In-memory implementation of the Redis set commands that are used.
+    """
+
+    def __init__(self):
+        self.sets = {}
+        self.ttls = {}
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+    def sadd(self, key, *values):
+        self.sets.setdefault(key, set()).update(value.encode() for value in values)
+
+    def srem(self, key, *values):
+        members = self.sets.get(key, set())
+        members.difference_update(value.encode() for value in values)
+        if not members:
+            self.sets.pop(key, None)
+
+    def sismember(self, key, value):
+        return value.encode() in self.sets.get(key, set())
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def exists(self, key):
+        return int(key in self.sets)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+
+class RedisOwnershipTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.redis = FakeRedis()
+        patcher = patch(
+            "openforms.submissions.ownership.get_redis_connection",
+            return_value=self.redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.session = SessionStore()
+
+    def test_add_only_writes_the_session_once(self):
+        ownership.add(self.session, SUBMISSIONS_SESSION_KEY, "a")
+        self.assertTrue(self.session.modified)
+        self.session.modified = False
+
+        ownership.add(self.session, SUBMISSIONS_SESSION_KEY, "b")
+        ownership.add(self.session, UPLOADS_SESSION_KEY, "c")
+
+        self.assertFalse(self.session.modified)
+        self.assertNotIn(SUBMISSIONS_SESSION_KEY, self.session)
+        self.assertEqual(
+            ownership.get_all(self.session, SUBMISSIONS_SESSION_KEY), {"a", "b"}
+        )
+        self.assertTrue(ownership.contains(self.session, UPLOADS_SESSION_KEY, "c"))
+        self.assertFalse(ownership.contains(self.session, UPLOADS_SESSION_KEY, "a"))
+        # the sets expire with the session
+        self.assertEqual(set(self.redis.ttls.values()), {self.session.get_expiry_age()})
+
+    def test_remove(self):
+        ownership.add(self.session, UPLOADS_SESSION_KEY, "a")
+        ownership.add(self.session, UPLOADS_SESSION_KEY, "b")
+
+        ownership.remove(self.session, UPLOADS_SESSION_KEY, "a", "b")
+
+        self.assertFalse(ownership.contains(self.session, UPLOADS_SESSION_KEY, "a"))
+        self.assertFalse(ownership.has_any(self.session, UPLOADS_SESSION_KEY))
+
+    def test_sessions_without_owner(self):
+        ownership.remove(self.session, UPLOADS_SESSION_KEY, "a")
+
+        self.assertFalse(ownership.has_any(self.session, UPLOADS_SESSION_KEY))
+        self.assertFalse(ownership.contains(self.session, UPLOADS_SESSION_KEY, "a"))
+        self.assertEqual(ownership.get_all(self.session, UPLOADS_SESSION_KEY), set())
+        self.assertFalse(self.session.modified)
+
+    def test_existing_session_lists_are_used(self):
+        self.session[SUBMISSIONS_SESSION_KEY] = ["a"]
+        ownership.add(self.session, SUBMISSIONS_SESSION_KEY, "b")
+
+        self.assertTrue(ownership.contains(self.session, SUBMISSIONS_SESSION_KEY, "a"))
+        self.assertEqual(
+            ownership.get_all(self.session, SUBMISSIONS_SESSION_KEY), {"a", "b"}
+        )
+
+        ownership.remove(self.session, SUBMISSIONS_SESSION_KEY, "a", "b")
+
+        self.assertEqual(self.session[SUBMISSIONS_SESSION_KEY], [])
+        self.assertFalse(ownership.has_any(self.session, SUBMISSIONS_SESSION_KEY))
+
+    def test_ownership_survives_cycling_the_session_key(self):
+        ownership.add(self.session, SUBMISSIONS_SESSION_KEY, "a")
+
+        self.session.cycle_key()
+
+        self.assertTrue(ownership.contains(self.session, SUBMISSIONS_SESSION_KEY, "a"))
+
+    def test_flushing_the_session_revokes_ownership(self):
+        ownership.add(self.session, SUBMISSIONS_SESSION_KEY, "a")
+
+        self.session.flush()
+
+        self.assertFalse(ownership.contains(self.session, SUBMISSIONS_SESSION_KEY, "a"))
+
+
+@patch("openforms.submissions.ownership.get_redis_connection", return_value=None)
+class SessionOwnershipTests(SimpleTestCase):
+    def test_without_redis_the_session_is_used(self, m):
+        session = SessionStore()
+
+        ownership.add(session, SUBMISSIONS_SESSION_KEY, "a")
+        ownership.add(session, SUBMISSIONS_SESSION_KEY, "a")
+
+        self.assertEqual(session[SUBMISSIONS_SESSION_KEY], ["a"])
+        self.assertTrue(ownership.has_any(session, SUBMISSIONS_SESSION_KEY))
+        self.assertTrue(ownership.contains(session, SUBMISSIONS_SESSION_KEY, "a"))
+
+        ownership.remove(session, SUBMISSIONS_SESSION_KEY, "a")
+
+        self.assertEqual(session[SUBMISSIONS_SESSION_KEY], [])
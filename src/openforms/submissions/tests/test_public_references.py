@@ -0,0 +1,50 @@
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+
+from ..public_references import (
+    ALPHABET,
+    allocate_reference,
+    get_reference,
+    next_sequence_value,
+    permute,
+)
+
+
+class PublicReferenceTests(TestCase):
+    def test_permutation_is_one_to_one(self):
+        for a, b in [(5, 5), (7, 11), (34, 34 ** 2)]:
+            with self.subTest(a=a, b=b):
+                permuted = {permute(value, a, b) for value in range(a * b)}
+
+                self.assertEqual(permuted, set(range(a * b)))
+
+    def test_references_are_unique(self):
+        references = [get_reference(index) for index in range(10_000)]
+
+        self.assertEqual(len(set(references)), 10_000)
+        for reference in references:
+            self.assertRegex(reference, rf"^[{ALPHABET}]{{6}}$")
+        # not handed out in order
+        self.assertNotEqual(references, sorted(references))
+
+    def test_references_get_longer_when_exhausted(self):
+        self.assertEqual(len(get_reference(len(ALPHABET) ** 6 - 1)), 6)
+        self.assertEqual(len(get_reference(len(ALPHABET) ** 6)), 7)
+
+    def test_references_depend_on_the_secret_key(self):
+        reference = get_reference(0)
+
+        with override_settings(SECRET_KEY="another secret"):
+            self.assertNotEqual(get_reference(0), reference)
+
+    @freeze_time("2021-10-26T12:00:00Z")
+    @override_settings(SUBMISSION_REFERENCE_FORMAT="OF-{year}-{reference}")
+    def test_allocate_reference(self):
+        value = next_sequence_value()
+
+        reference1 = allocate_reference()
+        reference2 = allocate_reference()
+
+        self.assertEqual(reference1, f"OF-2021-{get_reference(value)}")
+        self.assertEqual(reference2, f"OF-2021-{get_reference(value + 1)}")
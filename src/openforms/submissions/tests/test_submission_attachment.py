@@ -1,10 +1,12 @@
 import os
+from datetime import timedelta
 from unittest.mock import patch
 
 from django.core.files import File
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
+from freezegun import freeze_time
 from PIL import Image, UnidentifiedImageError
 from privates.test import temp_private_root
 
@@ -24,6 +26,7 @@ from openforms.submissions.tests.factories import (
     SubmissionStepFactory,
     TemporaryFileUploadFactory,
 )
+from openforms.submissions.tokens import submission_attachment_token_generator
 from openforms.tests.utils import disable_2fa
 
 
@@ -128,7 +131,7 @@ class SubmissionAttachmentTest(TestCase):
         cleanup_submission_temporary_uploaded_files(submission_step.submission)
         attachment.refresh_from_db()
         self.assertEqual(attachment.temporary_file, None)
-        # verify the new FileField has its own content
+        # verify the file is kept for the attachment
         self.assertEqual(attachment.content.read(), b"content")
 
     @patch("openforms.submissions.tasks.resize_submission_attachment.delay")
@@ -275,6 +278,61 @@ class SubmissionAttachmentTest(TestCase):
         self.assertEqual(attachment.original_name, "my-image.png")
         self.assertImageSize(attachment.content, 100, 100, "png")
 
+    def test_claimed_upload_shares_the_file(self):
+        upload = TemporaryFileUploadFactory.create(file_name="my-image.jpg")
+        submission_step = SubmissionStepFactory.create()
+
+        attachment, created = SubmissionFileAttachment.objects.create_from_upload(
+            submission_step, "my_file", upload
+        )
+
+        self.assertTrue(created)
+        # not copied
+        self.assertEqual(attachment.content.name, upload.content.name)
+        path = attachment.content.path
+
+        upload.delete()
+        attachment.refresh_from_db()
+
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(attachment.content.read(), b"content")
+        attachment.content.close()
+
+        attachment.delete()
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_file_is_kept_while_other_attachments_use_it(self):
+        upload = TemporaryFileUploadFactory.create(file_name="my-image.jpg")
+        attachment1, _ = SubmissionFileAttachment.objects.create_from_upload(
+            SubmissionStepFactory.create(), "my_file", upload
+        )
+        attachment2, _ = SubmissionFileAttachment.objects.create_from_upload(
+            SubmissionStepFactory.create(), "my_file", upload
+        )
+        path = upload.content.path
+
+        attachment1.delete()
+        upload.delete()
+
+        self.assertTrue(os.path.exists(path))
+
+        attachment2.refresh_from_db()
+        attachment2.delete()
+
+        self.assertFalse(os.path.exists(path))
+
+    @patch("openforms.submissions.models._is_same_storage", return_value=False)
+    def test_claiming_from_another_storage_copies_the_file(self, m):
+        upload = TemporaryFileUploadFactory.create(file_name="my-image.jpg")
+
+        attachment, _ = SubmissionFileAttachment.objects.create_from_upload(
+            SubmissionStepFactory.create(), "my_file", upload
+        )
+
+        self.assertNotEqual(attachment.content.name, upload.content.name)
+        self.assertEqual(attachment.content.read(), b"content")
+
     @disable_2fa
     def test_attachment_retrieve_view_requires_permission(self):
         attachment = SubmissionFileAttachmentFactory.create()
@@ -377,3 +435,63 @@ class SubmissionAttachmentTest(TestCase):
 
         actual = clean_mime_type("")
         self.assertEqual("application/octet-stream", actual)
+
+
+@temp_private_root()
+class DownloadSubmissionAttachmentTests(TestCase):
+    def test_valid_token(self):
+        attachment = SubmissionFileAttachmentFactory.create(
+            file_name="scan.pdf", content_type="application/pdf"
+        )
+        token = submission_attachment_token_generator.make_token(attachment)
+        url = reverse(
+            "api:submissions:download-attachment",
+            kwargs={"uuid": attachment.uuid, "token": token},
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertIn("scan.pdf", response["Content-Disposition"])
+
+    def test_expired_token(self):
+        attachment = SubmissionFileAttachmentFactory.create()
+        token = submission_attachment_token_generator.make_token(attachment)
+        url = reverse(
+            "api:submissions:download-attachment",
+            kwargs={"uuid": attachment.uuid, "token": token},
+        )
+
+        with freeze_time(timedelta(days=8)):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_token_of_other_attachment(self):
+        attachment, other = SubmissionFileAttachmentFactory.create_batch(2)
+        token = submission_attachment_token_generator.make_token(other)
+        url = reverse(
+            "api:submissions:download-attachment",
+            kwargs={"uuid": attachment.uuid, "token": token},
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_encode_attachments_for_email(self):
+        attachment = SubmissionFileAttachmentFactory.create(
+            file_name="scan.pdf",
+            content_type="application/pdf",
+            content__data=b"x" * 100_000,
+        )
+
+        (mime_attachment,) = SubmissionFileAttachment.objects.filter(
+            pk=attachment.pk
+        ).as_mail_attachments()
+
+        self.assertEqual(mime_attachment.get_filename(), "scan.pdf")
+        self.assertEqual(mime_attachment.get_payload(decode=True), b"x" * 100_000)
+        lines = mime_attachment.get_payload().splitlines()
+        self.assertTrue(all(len(line) <= 76 for line in lines))
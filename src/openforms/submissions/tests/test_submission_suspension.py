@@ -22,6 +22,7 @@ from rest_framework.test import APITestCase
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 
 from ..constants import SUBMISSIONS_SESSION_KEY
+from ..tasks import send_suspension_notification
 from .factories import SubmissionFactory, SubmissionStepFactory
 from .mixins import SubmissionsMixin
 
@@ -96,7 +97,8 @@ class SubmissionSuspensionTests(SubmissionsMixin, APITestCase):
         submission.refresh_from_db()
         self.assertIsNone(submission.suspended_on)
 
-    def test_email_sent(self):
+    @patch("openforms.submissions.api.serializers.send_suspension_notification.delay")
+    def test_email_sent(self, mock_delay):
         submission = SubmissionFactory.create()
         self._add_submission_to_session(submission)
         endpoint = reverse("api:submission-suspend", kwargs={"uuid": submission.uuid})
@@ -106,8 +108,14 @@ class SubmissionSuspensionTests(SubmissionsMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(len(callbacks), 1)
-        self.assertEqual(len(mail.outbox), 1)
+        mock_delay.assert_called_once_with("hello@open-forms.nl")
+        # the e-mail is not sent during the request
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_suspension_notification_task(self):
+        send_suspension_notification("hello@open-forms.nl")
 
+        self.assertEqual(len(mail.outbox), 1)
         email = mail.outbox[0]
         self.assertEqual(email.to, ["hello@open-forms.nl"])
         self.assertEqual(email.subject, _("Your form submission"))
@@ -5,6 +5,7 @@ from unittest.mock import patch
 from django.db import close_old_connections
 from django.test import TestCase, TransactionTestCase
 
+from ..public_references import get_reference
 from ..tasks.registration import (
     generate_unique_submission_reference,
     obtain_submission_reference,
@@ -52,21 +53,22 @@ class ObtainSubmissionReferenceTests(TestCase):
         )
 
         with patch(
-            "openforms.submissions.tasks.registration.get_random_string",
-            return_value="UNIQUE",
+            "openforms.submissions.public_references.next_sequence_value",
+            return_value=1,
         ):
             obtain_submission_reference(submission.id)
 
         submission.refresh_from_db()
-        self.assertEqual(submission.public_registration_reference, "OF-UNIQUE")
+        self.assertEqual(
+            submission.public_registration_reference, f"OF-{get_reference(0)}"
+        )
         mock_generate.assert_called_once_with()
 
-    def test_reference_generator_checks_for_used_references(self):
-        RANDOM_STRINGS = ["UNIQUE", "OTHER"]
+    def test_used_references_are_skipped(self):
         SubmissionFactory.create(
             completed=True,
             registration_success=True,
-            public_registration_reference=f"OF-{RANDOM_STRINGS[0]}",
+            public_registration_reference=f"OF-{get_reference(0)}",
         )
         submission = SubmissionFactory.create(
             form__registration_backend="zgw-create-zaak",
@@ -75,17 +77,16 @@ class ObtainSubmissionReferenceTests(TestCase):
             registration_result={"bad": {"result": "shape"}},
         )
 
-        def get_random_string(*args, **kwargs):
-            return RANDOM_STRINGS.pop(0)
-
         with patch(
-            "openforms.submissions.tasks.registration.get_random_string",
-            new=get_random_string,
+            "openforms.submissions.public_references.next_sequence_value",
+            side_effect=[1, 2],
         ):
             obtain_submission_reference(submission.id)
 
         submission.refresh_from_db()
-        self.assertEqual(submission.public_registration_reference, "OF-OTHER")
+        self.assertEqual(
+            submission.public_registration_reference, f"OF-{get_reference(1)}"
+        )
 
 
 class RaceConditionTests(TransactionTestCase):
@@ -1,9 +1,13 @@
+import hashlib
 import os
 import uuid
 from datetime import timedelta
+from unittest.mock import patch
 
+from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import RequestFactory
+from django.db import DatabaseError
+from django.test import RequestFactory, override_settings
 
 from freezegun import freeze_time
 from privates.test import temp_private_root
@@ -19,6 +23,10 @@ from openforms.submissions.attachments import (
 )
 from openforms.submissions.constants import UPLOADS_SESSION_KEY
 from openforms.submissions.models import TemporaryFileUpload
+from openforms.submissions.ownership import (
+    append_to_session_list,
+    remove_from_session_list,
+)
 from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionFileAttachmentFactory,
@@ -27,8 +35,6 @@ from openforms.submissions.tests.factories import (
 from openforms.submissions.tests.mixins import SubmissionsMixin
 from openforms.submissions.utils import (
     add_upload_to_session,
-    append_to_session_list,
-    remove_from_session_list,
     remove_upload_from_session,
 )
 from openforms.tests.utils import disable_2fa
@@ -121,6 +127,78 @@ class TemporaryFileUploadTest(SubmissionsMixin, APITestCase):
         # added to session
         self.assertEqual([upload.uuid], self.client.session[UPLOADS_SESSION_KEY])
 
+    def test_upload_view_streams_the_file_into_the_storage(self):
+        self._add_submission_to_session(self.submission)
+        url = reverse("api:submissions:temporary-file-upload")
+        content = b"\x89PNG\r\n\x1a\nimage data"
+        file = SimpleUploadedFile(
+            "my-image.png", content, content_type="application/octet-stream"
+        )
+        storage = TemporaryFileUpload._meta.get_field("content").storage
+
+        with patch.object(storage, "save", wraps=storage.save) as mock_save:
+            response = self.client.post(url, {"file": file}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # not copied into the storage after parsing
+        mock_save.assert_not_called()
+
+        upload = temporary_upload_from_url(response.json()["url"])
+        self.assertEqual(upload.content.read(), content)
+        # determined from the content
+        self.assertEqual(upload.content_type, "image/png")
+        self.assertEqual(upload.checksum, hashlib.sha256(content).hexdigest())
+
+    @override_settings(TEMPORARY_UPLOADS_MAX_SIZE=5)
+    def test_upload_view_aborts_too_large_uploads(self):
+        self._add_submission_to_session(self.submission)
+        url = reverse("api:submissions:temporary-file-upload")
+
+        for size in (10, 100 * 1024):
+            with self.subTest(size=size):
+                file = SimpleUploadedFile("my-file.txt", b"x" * size)
+
+                response = self.client.post(url, {"file": file}, format="multipart")
+
+                self.assertEqual(
+                    response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                )
+                self.assertFalse(TemporaryFileUpload.objects.exists())
+                # the partially written file is removed
+                stored_files = [
+                    files for _, _, files in os.walk(settings.PRIVATE_MEDIA_ROOT)
+                ]
+                self.assertEqual(sum(stored_files, []), [])
+
+    def test_upload_view_rejects_multiple_files(self):
+        self._add_submission_to_session(self.submission)
+        url = reverse("api:submissions:temporary-file-upload")
+        files = [
+            SimpleUploadedFile("my-file.txt", b"first"),
+            SimpleUploadedFile("my-other-file.txt", b"second"),
+        ]
+
+        response = self.client.post(url, {"file": files}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(TemporaryFileUpload.objects.exists())
+        stored_files = [files for _, _, files in os.walk(settings.PRIVATE_MEDIA_ROOT)]
+        self.assertEqual(sum(stored_files, []), [])
+
+    def test_upload_view_removes_the_streamed_file_if_saving_fails(self):
+        self._add_submission_to_session(self.submission)
+        url = reverse("api:submissions:temporary-file-upload")
+        file = SimpleUploadedFile("my-file.txt", b"content")
+
+        with patch.object(
+            TemporaryFileUpload, "save", side_effect=DatabaseError("down")
+        ):
+            with self.assertRaises(DatabaseError):
+                self.client.post(url, {"file": file}, format="multipart")
+
+        stored_files = [files for _, _, files in os.walk(settings.PRIVATE_MEDIA_ROOT)]
+        self.assertEqual(sum(stored_files, []), [])
+
     def test_delete_view_requires_registered_uploads(self):
         upload = TemporaryFileUploadFactory.create()
         url = reverse("api:submissions:temporary-file", kwargs={"uuid": upload.uuid})
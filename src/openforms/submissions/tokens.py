@@ -2,10 +2,18 @@ from typing import List
 
 from django.conf import settings
 
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 from openforms.tokens import BaseTokenGenerator
 
-__all__ = ["submission_status_token_generator", "submission_report_token_generator"]
+__all__ = [
+    "submission_status_token_generator",
+    "submission_report_token_generator",
+    "submission_attachment_token_generator",
+]
 
 
 class SubmissionReportTokenGenerator(BaseTokenGenerator):
@@ -29,6 +37,21 @@ class SubmissionReportTokenGenerator(BaseTokenGenerator):
         return submission_report_bits
 
 
+class SubmissionAttachmentTokenGenerator(BaseTokenGenerator):
+    """
+    Generate and check tokens for the download links of (large) attachments.
+
+    The links are sent instead of the attachments themselves when they're too large
+    to send by e-mail.
+    """
+
+    key_salt = "openforms.submissions.tokens.SubmissionAttachmentTokenGenerator"
+    token_timeout_days = settings.SUBMISSION_ATTACHMENT_URL_TOKEN_TIMEOUT_DAYS
+
+    def get_hash_value_parts(self, attachment: SubmissionFileAttachment) -> List[str]:
+        return [str(attachment.id), str(attachment.uuid), attachment.content.name]
+
+
 class SubmissionStatusTokenGenerator(BaseTokenGenerator):
     key_salt = "openforms.submissions.tokens.SubmissionStatusTokenGenerator"
     # pin to the minimum of 1 day - the SDK should not be polling for longer than
@@ -56,3 +79,4 @@ class SubmissionStatusTokenGenerator(BaseTokenGenerator):
 
 submission_report_token_generator = SubmissionReportTokenGenerator()
 submission_status_token_generator = SubmissionStatusTokenGenerator()
+submission_attachment_token_generator = SubmissionAttachmentTokenGenerator()
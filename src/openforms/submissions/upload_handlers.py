@@ -0,0 +1,189 @@
+"""
+Stream temporary file uploads straight into the private media storage.
+
+With the default upload handlers, the uploaded file is first spooled to memory or a
+temporary file while the request body is parsed, and then copied into the storage
+when the :class:`TemporaryFileUpload` is saved. :class:`TemporaryFileUploadHandler`
+writes the chunks directly to the final location of the file instead, so every chunk
+is written once and only one chunk is held in memory. While streaming, it computes the
+checksum of the file and determines the content type from the first chunk, and it
+aborts as soon as the file exceeds ``settings.TEMPORARY_UPLOADS_MAX_SIZE``.
+
+Storages without local paths are left to the default upload handlers.
+"""
+import hashlib
+import logging
+import os
+from typing import Optional
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+
+from .models import TemporaryFileUpload
+
+logger = logging.getLogger(__name__)
+
+# the request body is a bit larger than the file, because of the multipart encoding
+MULTIPART_OVERHEAD = 64 * 1024
+
+# file signatures of the (unambiguous) content types that are recognized
+SIGNATURES = (
+    (b"%PDF-", "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"II*\x00", "image/tiff"),
+    (b"MM\x00*", "image/tiff"),
+)
+
+
+def sniff_content_type(chunk: bytes) -> Optional[str]:
+    for signature, content_type in SIGNATURES:
+        if chunk.startswith(signature):
+            return content_type
+    return None
+
+
+class StoredUploadedFile(UploadedFile):
+    """
+    An uploaded file that is already stored as the content of ``upload``.
+    """
+
+    def __init__(self, upload: TemporaryFileUpload, name: str, **kwargs):
+        super().__init__(file=upload.content, name=name, **kwargs)
+        self.upload = upload
+
+
+class TemporaryFileUploadHandler(FileUploadHandler):
+    """
+    Write the ``file`` field of the request to the storage of temporary uploads.
+    """
+
+    field_name = "file"
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.too_large = False
+        self.multiple_files = False
+        self.active = False
+        self.file = None
+        self.upload: Optional[TemporaryFileUpload] = None
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        # don't read a body that is too large to contain an acceptable file
+        if content_length > settings.TEMPORARY_UPLOADS_MAX_SIZE + MULTIPART_OVERHEAD:
+            self.too_large = True
+            return QueryDict(encoding=encoding), MultiValueDict()
+        return None
+
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        if field_name != self.field_name:
+            return
+        if self.upload is not None:
+            # only one file can be uploaded per request, skip the rest of the body
+            self.multiple_files = True
+            self.discard()
+            raise StopUpload()
+        if self.content_length and self.content_length > self.max_size:
+            self.abort()
+
+        field = TemporaryFileUpload._meta.get_field("content")
+        storage = field.storage
+        upload = TemporaryFileUpload()
+        name = storage.get_available_name(
+            field.generate_filename(upload, self.file_name),
+            max_length=field.max_length,
+        )
+        try:
+            path = storage.path(name)
+        except NotImplementedError:
+            return
+
+        directory = os.path.dirname(path)
+        if storage.directory_permissions_mode is not None:
+            # like FileSystemStorage, apply the permissions to the created directories
+            old_umask = os.umask(0)
+            try:
+                os.makedirs(
+                    directory, storage.directory_permissions_mode, exist_ok=True
+                )
+            finally:
+                os.umask(old_umask)
+        else:
+            os.makedirs(directory, exist_ok=True)
+
+        self.file = open(path, "xb")
+        if storage.file_permissions_mode is not None:
+            os.chmod(path, storage.file_permissions_mode)
+
+        upload.content.name = name
+        self.upload = upload
+        self.active = True
+        self.checksum = hashlib.sha256()
+        self.sniffed_content_type = None
+
+    @property
+    def max_size(self) -> int:
+        return settings.TEMPORARY_UPLOADS_MAX_SIZE
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> Optional[bytes]:
+        if not self.active:
+            return raw_data
+        if start + len(raw_data) > self.max_size:
+            self.abort()
+
+        if start == 0:
+            self.sniffed_content_type = sniff_content_type(raw_data)
+        self.checksum.update(raw_data)
+        self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size: int) -> Optional[StoredUploadedFile]:
+        if not self.active:
+            return None
+        self.active = False
+        self.file.close()
+
+        if not file_size:
+            # let the default handlers provide the (empty) file, which is rejected
+            self.discard()
+            return None
+
+        self.upload.checksum = self.checksum.hexdigest()
+        return StoredUploadedFile(
+            self.upload,
+            name=self.file_name,
+            content_type=self.sniffed_content_type or self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+        )
+
+    def upload_complete(self):
+        # the upload was stopped before the file was complete
+        if self.active:
+            self.discard()
+
+    def abort(self):
+        self.too_large = True
+        self.discard()
+        raise StopUpload(connection_reset=True)
+
+    def discard(self):
+        """
+        Remove the (partially) written file, if the upload was not saved.
+        """
+        if self.upload is None or self.upload.pk:
+            return
+        self.active = False
+        if self.file is not None:
+            self.file.close()
+        self.upload.content.delete(save=False)
+        self.upload = None
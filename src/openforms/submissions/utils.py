@@ -1,5 +1,4 @@
 import logging
-from typing import Any
 
 from django.conf import settings
 from django.contrib.sessions.backends.base import SessionBase
@@ -8,35 +7,18 @@ from django.core.mail import send_mail
 from openforms.appointments.models import AppointmentInfo
 from openforms.appointments.utils import get_client
 
+from . import ownership
 from .constants import SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY
 from .models import Submission, TemporaryFileUpload
 
 logger = logging.getLogger(__name__)
 
 
-def append_to_session_list(session: SessionBase, session_key: str, value: Any) -> None:
-    # note: possible race condition with concurrent requests
-    active = session.get(session_key, [])
-    if value not in active:
-        active.append(value)
-        session[session_key] = active
-
-
-def remove_from_session_list(
-    session: SessionBase, session_key: str, value: Any
-) -> None:
-    # note: possible race condition with concurrent requests
-    active = session.get(session_key, [])
-    if value in active:
-        active.remove(value)
-        session[session_key] = active
-
-
 def add_submmission_to_session(submission: Submission, session: SessionBase) -> None:
     """
     Store the submission UUID in the request session for authorization checks.
     """
-    append_to_session_list(session, SUBMISSIONS_SESSION_KEY, str(submission.uuid))
+    ownership.add(session, SUBMISSIONS_SESSION_KEY, str(submission.uuid))
 
 
 def remove_submission_from_session(
@@ -45,14 +27,14 @@ def remove_submission_from_session(
     """
     Remove the submission UUID from the session if it's present.
     """
-    remove_from_session_list(session, SUBMISSIONS_SESSION_KEY, str(submission.uuid))
+    ownership.remove(session, SUBMISSIONS_SESSION_KEY, str(submission.uuid))
 
 
 def add_upload_to_session(upload: TemporaryFileUpload, session: SessionBase) -> None:
     """
     Store the upload UUID in the request session for authorization checks.
     """
-    append_to_session_list(session, UPLOADS_SESSION_KEY, str(upload.uuid))
+    ownership.add(session, UPLOADS_SESSION_KEY, str(upload.uuid))
 
 
 def remove_upload_from_session(
@@ -61,14 +43,15 @@ def remove_upload_from_session(
     """
     Remove the submission UUID from the session if it's present.
     """
-    remove_from_session_list(session, UPLOADS_SESSION_KEY, str(upload.uuid))
+    ownership.remove(session, UPLOADS_SESSION_KEY, str(upload.uuid))
 
 
 def remove_submission_uploads_from_session(
     submission: Submission, session: SessionBase
 ) -> None:
-    for attachment in submission.get_attachments().filter(temporary_file__isnull=False):
-        remove_upload_from_session(attachment.temporary_file, session)
+    uploads = submission.get_attachments().filter(temporary_file__isnull=False)
+    upload_ids = uploads.values_list("temporary_file__uuid", flat=True)
+    ownership.remove(session, UPLOADS_SESSION_KEY, *map(str, upload_ids))
 
 
 def send_confirmation_email(submission: Submission):
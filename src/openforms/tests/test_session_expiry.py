@@ -9,6 +9,7 @@ from datetime import datetime
 from unittest.mock import patch
 
 from django.conf import settings
+from django.core.cache import caches
 from django.test import override_settings
 from django.utils import timezone
 from django.utils.translation import gettext as _
@@ -20,6 +21,7 @@ from rest_framework.test import APITestCase
 
 from openforms.config.models import GlobalConfiguration
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
+from openforms.utils.metrics import get_summary
 
 from ..accounts.tests.factories import SuperUserFactory
 from .utils import NOOP_CACHES, disable_2fa
@@ -213,3 +215,73 @@ class AdminSessionExpiryTests(APITestCase):
 
                 self.assertEqual(response.status_code, status.HTTP_302_FOUND)
                 self.assertEqual(response.url, f"{settings.LOGIN_URL}?next={self.url}")
+
+
+@override_settings(
+    CACHES=SESSION_CACHES,
+    SESSION_CACHE_ALIAS="session",
+    METRICS_CACHE="session",
+    SESSION_REFRESH_FRACTION=0.1,
+)
+class SessionRefreshTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        config = GlobalConfiguration.get_solo()
+        config.form_session_timeout = 5
+        config.save()
+
+        cls.form = FormFactory.create()
+        cls.form_url = reverse(
+            "api:form-detail", kwargs={"uuid_or_slug": cls.form.uuid}
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        caches["session"].clear()
+        self.addCleanup(caches["session"].clear)
+
+    def test_session_is_only_saved_after_a_fraction_of_the_timeout(self):
+        with freeze_time("2021-07-29T14:00:00Z"):
+            response = self.client.get(self.form_url)
+            self.assertTrue(response.wsgi_request.session.modified)
+
+        # within 10% of the 5 minutes timeout
+        with freeze_time("2021-07-29T14:00:20Z"):
+            response = self.client.get(self.form_url)
+            self.assertFalse(response.wsgi_request.session.modified)
+            self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+
+        with freeze_time("2021-07-29T14:00:40Z"):
+            response = self.client.get(self.form_url)
+            self.assertTrue(response.wsgi_request.session.modified)
+            self.assertIn(settings.SESSION_COOKIE_NAME, response.cookies)
+
+            summary = get_summary(["sessions.requests", "sessions.writes"])
+
+        self.assertEqual(summary["sessions.requests"]["count"], 3)
+        self.assertEqual(summary["sessions.writes"]["count"], 2)
+
+    def test_unchanged_cached_session_is_touched(self):
+        with freeze_time("2021-07-29T14:00:00Z"):
+            self.client.get(self.form_url)
+
+        with freeze_time("2021-07-29T14:01:00Z"):
+            # the remaining time-to-live is only reported by django-redis
+            with patch("openforms.middleware._get_cache_ttl", return_value=240):
+                response = self.client.get(self.form_url)
+
+            session = response.wsgi_request.session
+            self.assertFalse(session.modified)
+            cookie = response.cookies[settings.SESSION_COOKIE_NAME]
+            self.assertEqual(cookie.value, session.session_key)
+            self.assertEqual(cookie["max-age"], 300)
+
+            summary = get_summary(["sessions.touches"])
+
+        self.assertEqual(summary["sessions.touches"]["count"], 1)
+        # the session is kept for 5 minutes after the last activity
+        with freeze_time("2021-07-29T14:05:30Z"):
+            self.assertTrue(caches["session"].has_key(session.cache_key))
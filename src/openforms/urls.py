@@ -11,6 +11,7 @@ from django.utils.translation import ugettext_lazy as _
 from decorator_include import decorator_include
 
 from openforms.emails.admin import EmailTestAdminView
+from openforms.utils.admin import IntegrationStatusAdminView
 from openforms.utils.views import ErrorDetailView
 
 handler500 = "openforms.utils.views.server_error"
@@ -34,6 +35,11 @@ urlpatterns = [
         admin.site.admin_view(EmailTestAdminView.as_view()),
         name="admin_email_test",
     ),
+    path(
+        "admin/integrations/status/",
+        admin.site.admin_view(IntegrationStatusAdminView.as_view()),
+        name="admin_integration_status",
+    ),
     path("admin/hijack/", include("hijack.urls")),
     path("admin/", admin.site.urls),
     path(
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from django.contrib import admin, messages
+from django.http import HttpResponseRedirect
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from django.views.generic import TemplateView
+
+from .resilience import CircuitBreaker, get_rate_limit, get_states, get_timeout
+
+
+class IntegrationStatusAdminView(TemplateView):
+    """
+    Show the circuit breaker state of the external services.
+    """
+
+    template_name = "utils/admin_integration_status.html"
+    title = _("Integration status")
+
+    def get_context_data(self, **kwargs):
+        kwargs.setdefault("title", self.title)
+        context = super().get_context_data(**kwargs)
+        context.update(admin.site.each_context(self.request))
+        context["services"] = [
+            {
+                "name": state.name,
+                "state": state.state,
+                "failures": state.failures,
+                "opened_at": (
+                    datetime.fromtimestamp(state.opened_at, tz=timezone.utc)
+                    if state.opened_at is not None
+                    else None
+                ),
+                "timeout": get_timeout(state.name),
+                "rate_limit": get_rate_limit(state.name),
+            }
+            for state in get_states()
+        ]
+        return context
+
+    def post(self, request, *args, **kwargs):
+        if not request.user.is_superuser:
+            messages.error(request, _("Only superusers can reset a circuit breaker."))
+        elif name := request.POST.get("reset"):
+            CircuitBreaker(name).reset()
+            messages.success(
+                request,
+                _("The circuit breaker for '{name}' was reset.").format(name=name),
+            )
+        return HttpResponseRedirect(reverse("admin_integration_status"))
@@ -1,3 +1,10 @@
+import hashlib
+from typing import Optional
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
 from rest_framework.response import Response
 
 
@@ -13,3 +20,59 @@ class ListMixin:
         objects = self.get_objects()
         serializer = self.get_serializer(instance=objects)
         return Response(serializer.data)
+
+
+def make_etag(*parts, weak: bool = False) -> str:
+    """
+    Derive a (quoted) ETag from the string representation of the given parts.
+
+    :param weak: mark the ETag as weak, for resources that are served in equivalent
+      (but not byte-identical) representations, e.g. with different content encodings.
+    """
+    raw = "|".join(str(part) for part in parts)
+    etag = quote_etag(hashlib.md5(raw.encode("utf-8")).hexdigest())
+    return f"W/{etag}" if weak else etag
+
+
+class ConditionalGetMixin:
+    """
+    Answer conditional GET requests without serializing the resource.
+
+    Views implement :meth:`get_etag`, which must be cheap to compute (typically from
+    version stamps maintained on save) and call :meth:`get_not_modified_response` at
+    the start of the handlers that support conditional requests.
+    """
+
+    def get_etag(self, request) -> Optional[str]:
+        """
+        Return the ETag of the resource, or ``None`` if it cannot be determined.
+        """
+        raise NotImplementedError
+
+    def get_not_modified_response(self, request):
+        etag = self.get_etag(request)
+        if etag is None:
+            return None
+        self._etag = etag
+        return get_conditional_response(request, etag=etag)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        etag = getattr(self, "_etag", None)
+        if etag is None or response.status_code not in (200, 304):
+            return response
+
+        response["ETag"] = etag
+        if request.user.is_staff:
+            # staff users may see resources that are not public (yet)
+            patch_cache_control(response, private=True, no_cache=True)
+        else:
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=0,
+                s_maxage=settings.API_SHARED_CACHE_MAX_AGE,
+                must_revalidate=True,
+            )
+        return response
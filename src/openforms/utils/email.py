@@ -1,6 +1,41 @@
+import base64
+from email.mime.base import MIMEBase
+
+from django.core.files import File
 from django.core.mail import EmailMultiAlternatives, get_connection
 
 
+def encode_attachment(file: File, filename: str, mime_type: str) -> MIMEBase:
+    """
+    Create a (base64 encoded) MIME attachment.
+
+    The file and its encoded payload are held in memory, which peaks at about 2.5
+    times the file size. Callers must bound the size of the attachments - registration
+    e-mails contain download links instead above ``settings.EMAIL_ATTACHMENTS_MAX_SIZE``.
+    """
+    maintype, _, subtype = mime_type.partition("/")
+    # message/* parts may not be base64 encoded
+    if maintype == "message" or not subtype:
+        maintype, subtype = "application", "octet-stream"
+
+    file.open("rb")
+    try:
+        payload = base64.encodebytes(file.read()).decode("ascii")
+    finally:
+        file.close()
+
+    attachment = MIMEBase(maintype, subtype)
+    attachment.set_payload(payload)
+
+    attachment["Content-Transfer-Encoding"] = "base64"
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        filename = ("utf-8", "", filename)
+    attachment.add_header("Content-Disposition", "attachment", filename=filename)
+    return attachment
+
+
 def send_mail_plus(
     subject,
     message,
@@ -16,7 +51,8 @@ def send_mail_plus(
 
     """
     modified copy of django.core.mail.send_mail() with:
-    - attachment support
+    - attachment support, either ``(filename, content, mimetype)`` tuples or
+      :class:`MIMEBase` instances (see :func:`encode_attachment`)
     """
 
     connection = connection or get_connection(
@@ -30,6 +66,10 @@ def send_mail_plus(
     if html_message:
         mail.attach_alternative(html_message, "text/html")
     if attachments:
-        for filename, content, mime_type in attachments:
-            mail.attach(filename, content, mime_type)
+        for attachment in attachments:
+            if isinstance(attachment, MIMEBase):
+                mail.attach(attachment)
+            else:
+                filename, content, mime_type = attachment
+                mail.attach(filename, content, mime_type)
     return mail.send()
@@ -0,0 +1,85 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.core.management import BaseCommand
+
+POOLS = {
+    "prefork": ProcessPoolExecutor,
+    "threads": ThreadPoolExecutor,
+}
+
+
+def cpu_task(iterations: int) -> int:
+    """
+    Stand-in for PDF rendering/image resizing: pure Python work holding the GIL.
+    """
+    total = 0
+    for i in range(iterations):
+        total += i * i % 7
+    return total
+
+
+def io_task(latency: float) -> float:
+    """
+    Stand-in for a call to an external service (registration backend, SMTP server).
+    """
+    time.sleep(latency)
+    return latency
+
+
+def run(pool: str, concurrency: int, func, arg, tasks: int) -> float:
+    """
+    Process ``tasks`` tasks with the given pool and return the throughput (per second).
+    """
+    with POOLS[pool](max_workers=concurrency) as executor:
+        # start the workers before measuring
+        list(executor.map(io_task, [0] * concurrency))
+        start = time.perf_counter()
+        list(executor.map(func, [arg] * tasks))
+        duration = time.perf_counter() - start
+    return tasks / duration
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput of CPU-bound and I/O-bound tasks with the prefork "
+        "and threads execution pools, to size the Celery workers per queue"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 2, 4, 20],
+            help="The concurrency levels to measure.",
+        )
+        parser.add_argument(
+            "--tasks", type=int, default=40, help="The number of tasks per run."
+        )
+        parser.add_argument(
+            "--cpu-iterations",
+            type=int,
+            default=2_000_000,
+            help="The size of a CPU-bound task.",
+        )
+        parser.add_argument(
+            "--io-latency",
+            type=float,
+            default=0.2,
+            help="The duration of an I/O-bound task, in seconds.",
+        )
+
+    def handle(self, **options):
+        workloads = {
+            "cpu": (cpu_task, options["cpu_iterations"]),
+            "io": (io_task, options["io_latency"]),
+        }
+        self.stdout.write("workload  pool     concurrency  tasks/s")
+        for workload, (func, arg) in workloads.items():
+            for pool in POOLS:
+                for concurrency in options["concurrency"]:
+                    throughput = run(pool, concurrency, func, arg, options["tasks"])
+                    self.stdout.write(
+                        f"{workload:<8}  {pool:<7}  {concurrency:>11}  {throughput:7.1f}"
+                    )
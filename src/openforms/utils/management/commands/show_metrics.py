@@ -0,0 +1,31 @@
+from django.core.management import BaseCommand
+
+from ...metrics import RETENTION, get_summary
+
+
+class Command(BaseCommand):
+    help = "Show the operational metrics (throughput and durations) of the last hour"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--minutes",
+            type=int,
+            default=RETENTION,
+            help=f"Aggregate the metrics of the last N minutes (max {RETENTION}).",
+        )
+        parser.add_argument(
+            "names", nargs="*", help="Only show these metrics (default: all)."
+        )
+
+    def handle(self, **options):
+        summary = get_summary(options["names"] or None, minutes=options["minutes"])
+        if not summary:
+            self.stdout.write("No metrics recorded.")
+            return
+
+        width = max(len(name) for name in summary)
+        for name, values in summary.items():
+            line = f"{name:<{width}}  count={values['count']}"
+            if "avg" in values:
+                line += f" avg={values['avg']} max={values['max']}"
+            self.stdout.write(line)
@@ -0,0 +1,205 @@
+"""
+Lightweight operational metrics, aggregated per minute in the (shared) cache.
+
+Counters are incremented with :func:`incr`. Values (e.g. sizes) are recorded with
+:func:`observe` and durations with :func:`timing` (in milliseconds), which keep the
+count, total and maximum of the observed values. The aggregates of the last hour can be
+inspected with :func:`get_summary` or the ``show_metrics`` management command.
+
+Metrics are recorded in a per-process buffer and written to the cache at most every
+``settings.METRICS_FLUSH_INTERVAL`` seconds, so recording a metric (e.g. on every
+request) doesn't cost a round-trip to the cache. With Redis, the buffered counters are
+written in a single pipeline. The metrics of the last interval are lost when a
+process is killed.
+"""
+import atexit
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .redis import get_redis_connection
+
+KEY_PREFIX = "metrics"
+NAMES_KEY = f"{KEY_PREFIX}:names"
+# how long the per-minute buckets are kept, in minutes
+RETENTION = 60
+
+
+def _get_cache():
+    return caches[settings.METRICS_CACHE]
+
+
+def _bucket(now: Optional[float] = None) -> int:
+    return int((now or time.time()) // 60)
+
+
+# names known to be registered, to avoid a cache lookup per observation
+_registered = set()
+
+
+def _register(cache, name: str) -> None:
+    if name in _registered:
+        return
+    names = cache.get(NAMES_KEY) or set()
+    if name not in names:
+        cache.set(NAMES_KEY, names | {name}, timeout=None)
+    _registered.add(name)
+
+
+def _incr(cache, key: str, value: int) -> None:
+    cache.add(key, 0, timeout=RETENTION * 60)
+    try:
+        cache.incr(key, value)
+    except ValueError:  # the key expired in the meantime
+        cache.set(key, value, timeout=RETENTION * 60)
+
+
+def _incr_many(cache, increments: Dict[str, int]) -> None:
+    if (connection := get_redis_connection(settings.METRICS_CACHE)) is None:
+        for key, value in increments.items():
+            _incr(cache, key, value)
+        return
+
+    pipeline = connection.pipeline(transaction=False)
+    for key, value in increments.items():
+        key = cache.make_key(key)
+        pipeline.incrby(key, value)
+        pipeline.expire(key, RETENTION * 60)
+    pipeline.execute()
+
+
+class _Buffer:
+    """
+    The metrics recorded by this process that are not written to the cache yet.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.pid = os.getpid()
+        self.flushed_at = time.monotonic()
+        self.increments: Dict[str, int] = defaultdict(int)
+        self.maximums: Dict[str, int] = {}
+
+    def record(self, increments: Dict[str, int], maximums: Dict[str, int]) -> bool:
+        """
+        :return: whether the buffer is due to be flushed.
+        """
+        with self.lock:
+            # don't flush the metrics of the parent process again in forked processes
+            if self.pid != os.getpid():
+                self.reset()
+            for key, value in increments.items():
+                self.increments[key] += value
+            for key, value in maximums.items():
+                self.maximums[key] = max(value, self.maximums.get(key, 0))
+            return time.monotonic() - self.flushed_at >= settings.METRICS_FLUSH_INTERVAL
+
+    def take(self):
+        with self.lock:
+            if self.pid != os.getpid():
+                self.reset()
+            increments, maximums = self.increments, self.maximums
+            self.reset()
+        return increments, maximums
+
+
+_buffer = _Buffer()
+
+
+def flush() -> None:
+    """
+    Write the metrics recorded by this process to the cache.
+    """
+    increments, maximums = _buffer.take()
+    if not increments and not maximums:
+        return
+    cache = _get_cache()
+    _incr_many(cache, increments)
+    for key, value in maximums.items():
+        # not atomic, but good enough for an indication of the worst case
+        if value > (cache.get(key) or 0):
+            cache.set(key, value, timeout=RETENTION * 60)
+
+
+atexit.register(flush)
+
+
+def _record(
+    increments: Dict[str, int], maximums: Optional[Dict[str, int]] = None
+) -> None:
+    if _buffer.record(increments, maximums or {}):
+        flush()
+
+
+def incr(name: str, value: int = 1) -> None:
+    _register(_get_cache(), name)
+    _record({f"{KEY_PREFIX}:{name}:{_bucket()}": value})
+
+
+def observe(name: str, *values: int) -> None:
+    """
+    Record one or more (integer) values.
+    """
+    if not values:
+        return
+    _register(_get_cache(), name)
+    key = f"{KEY_PREFIX}:{name}:{_bucket()}"
+    _record(
+        {f"{key}:count": len(values), f"{key}:total": sum(values)},
+        {f"{key}:max": max(values)},
+    )
+
+
+def timing(name: str, *seconds: float) -> None:
+    """
+    Record one or more durations (in seconds) as milliseconds.
+    """
+    observe(name, *(int(value * 1000) for value in seconds))
+
+
+def get_summary(
+    names: Optional[Iterable[str]] = None, minutes: int = RETENTION
+) -> Dict[str, dict]:
+    """
+    Aggregate the metrics of the last ``minutes`` minutes.
+
+    Counters are reported as ``{"count": ...}``, observed values (and timings)
+    additionally report the average and maximum value.
+    """
+    # include the metrics of this process that are not written to the cache yet
+    flush()
+    cache = _get_cache()
+    if names is None:
+        names = sorted(cache.get(NAMES_KEY) or set())
+
+    current = _bucket()
+    buckets = range(current - min(minutes, RETENTION) + 1, current + 1)
+    summary = {}
+    for name in names:
+        keys = [f"{KEY_PREFIX}:{name}:{bucket}" for bucket in buckets]
+        suffixed = {
+            suffix: [f"{key}:{suffix}" for key in keys]
+            for suffix in ("count", "total", "max")
+        }
+        values = cache.get_many(
+            keys + [key for group in suffixed.values() for key in group]
+        )
+
+        if observed := sum(values.get(key, 0) for key in suffixed["count"]):
+            total = sum(values.get(key, 0) for key in suffixed["total"])
+            summary[name] = {
+                "count": observed,
+                "avg": round(total / observed),
+                "max": max(values.get(key, 0) for key in suffixed["max"]),
+            }
+        else:
+            summary[name] = {"count": sum(values.get(key, 0) for key in keys)}
+    return summary
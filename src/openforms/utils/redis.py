@@ -0,0 +1,59 @@
+"""
+Helpers for the features that use Redis directly when a cache is backed by Redis.
+
+These features (atomic sets and hashes, pipelines, pub/sub...) fall back to the
+regular Django cache API - or to in-process state - when the cache is not a Redis
+cache, e.g. the local memory cache in development and tests.
+"""
+import logging
+import time
+from typing import Optional
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+def get_redis_connection(alias: str):
+    """
+    Return the Redis client of the cache ``alias``, or ``None`` if it's not a Redis
+    cache.
+    """
+    try:
+        from django_redis import get_redis_connection
+    except ImportError:  # pragma: no cover
+        return None
+
+    try:
+        return get_redis_connection(alias)
+    except NotImplementedError:  # not a redis cache backend
+        return None
+
+
+def bump_version(alias: str, key: str, channel: Optional[str] = None) -> int:
+    """
+    Increment the version counter ``key`` in the cache ``alias``.
+
+    The processes that keep state derived from the versioned data compare the counter
+    with the version of their state. With a Redis cache, the new version is also
+    published on ``channel`` (if given), so listeners don't need to poll the counter.
+
+    :return: the new version.
+    """
+    cache = caches[alias]
+    cache.add(key, 0, timeout=None)
+    try:
+        version = cache.incr(key)
+    except ValueError:  # the key was evicted in the meantime
+        version = int(time.time())
+        cache.set(key, version, timeout=None)
+
+    if channel is None or (connection := get_redis_connection(alias)) is None:
+        return version
+    try:
+        connection.publish(channel, version)
+    except Exception:
+        logger.warning(
+            "Could not publish version %s on %s", version, channel, exc_info=True
+        )
+    return version
@@ -0,0 +1,532 @@
+"""
+Resilience layer for the calls to external services.
+
+Every outbound call to a backend (ZGW APIs, StUF, KvK, BAG, JCC, Qmatic...) goes
+through :func:`protect`, which:
+
+* applies a timeout to the request, so that a slow backend can't hold a web or worker
+  thread indefinitely;
+* enforces a circuit breaker per backend: after a number of consecutive failures, the
+  calls fail fast with :class:`CircuitOpen` until the reset timeout has passed, after
+  which a single probe call is let through to check if the backend has recovered;
+* caps the number of requests per second to a backend with a token bucket, shared by
+  all processes when Redis is available.
+
+Backends are identified by the host (and port) of the URL that is called. The circuit
+breaker state lives in the ``settings.INTEGRATIONS_CACHE`` cache, so it is shared by
+all processes and can be inspected in the admin.
+
+The requests share a connection pool per process (see :func:`get_session`), so the
+web and worker threads waiting on the same backend don't each set up a new TCP/TLS
+connection.
+
+:class:`ServiceUnavailable` is a :class:`requests.RequestException`, so callers that
+already handle network errors handle a fast failure in the same way.
+"""
+import copy
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from django.conf import settings
+from django.core.cache import caches
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from zds_client import ClientError
+from zds_client.schema import get_headers
+from zgw_consumers.client import ZGWClient
+
+from . import metrics
+from .redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "integrations"
+NAMES_KEY = f"{KEY_PREFIX}:names"
+# consecutive failures older than this (in seconds) are forgotten
+FAILURES_TIMEOUT = 10 * 60
+# responses that indicate that the service is down (or overloaded). Other server errors
+# are not counted - SOAP services report ordinary (business) faults with HTTP 500, e.g.
+# an unknown BSN or a StUF validation fault.
+FAILURE_STATUS_CODES = (502, 503, 504)
+
+
+class ServiceUnavailable(requests.RequestException):
+    """
+    The call to the external service was not made.
+    """
+
+    reason = "Service unavailable"
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{self.reason} for '{name}', retry after {retry_after:.0f}s")
+
+
+class CircuitOpen(ServiceUnavailable):
+    reason = "Circuit breaker open"
+
+
+class RateLimited(ServiceUnavailable):
+    reason = "Rate limit exceeded"
+
+
+def find_service_unavailable(
+    exc: Optional[BaseException],
+) -> Optional[ServiceUnavailable]:
+    """
+    Return the :class:`ServiceUnavailable` exception that caused ``exc``, if any.
+
+    Callers may wrap the exceptions of the resilience layer in their own exceptions.
+    """
+    while exc is not None:
+        if isinstance(exc, ServiceUnavailable):
+            return exc
+        exc = exc.__cause__
+    return None
+
+
+def _get_cache():
+    return caches[settings.INTEGRATIONS_CACHE]
+
+
+def service_name(url: str) -> str:
+    """
+    Identify the backend of a URL: its host and port.
+    """
+    parsed = urlparse(url)
+    if not parsed.port:
+        return parsed.hostname or ""
+    return f"{parsed.hostname}:{parsed.port}"
+
+
+def get_timeout(name: str) -> float:
+    return settings.INTEGRATION_TIMEOUTS.get(name, settings.INTEGRATION_TIMEOUT)
+
+
+def _is_failure(exc: Exception) -> bool:
+    """
+    Determine if the exception indicates that the service is down (or overloaded).
+    """
+    if isinstance(exc, ServiceUnavailable):
+        return False
+    if isinstance(exc, requests.HTTPError):
+        response = exc.response
+        return response is None or response.status_code in FAILURE_STATUS_CODES
+    return isinstance(
+        exc, (requests.ConnectionError, requests.Timeout, ConnectionError)
+    )
+
+
+#
+# Circuit breaker
+#
+
+
+@dataclass
+class BreakerState:
+    name: str
+    failures: int
+    opened_at: Optional[float]
+
+    @property
+    def retry_at(self) -> Optional[float]:
+        if self.opened_at is None:
+            return None
+        return self.opened_at + settings.INTEGRATION_BREAKER_RESET_TIMEOUT
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "open" if time.time() < self.retry_at else "half-open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str):
+        self.name = name
+        prefix = f"{KEY_PREFIX}:breaker:{name}"
+        self.failures_key = f"{prefix}:failures"
+        self.opened_key = f"{prefix}:opened"
+        self.probe_key = f"{prefix}:probe"
+
+    def get_state(self) -> BreakerState:
+        values = _get_cache().get_many([self.failures_key, self.opened_key])
+        return BreakerState(
+            name=self.name,
+            failures=values.get(self.failures_key, 0),
+            opened_at=values.get(self.opened_key),
+        )
+
+    def before_call(self) -> BreakerState:
+        """
+        Check if the call may be made.
+
+        :raises CircuitOpen: if the circuit is open, or if it is half-open and another
+          call is already probing the service.
+        """
+        state = self.get_state()
+        if state.opened_at is None:
+            return state
+
+        now = time.time()
+        if now < state.retry_at:
+            metrics.incr(f"integrations.{self.name}.rejected")
+            raise CircuitOpen(self.name, retry_after=state.retry_at - now)
+
+        # half-open: let a single call through to check if the service has recovered
+        probe_timeout = int(get_timeout(self.name)) + 1
+        if not _get_cache().add(self.probe_key, now, timeout=probe_timeout):
+            metrics.incr(f"integrations.{self.name}.rejected")
+            raise CircuitOpen(self.name, retry_after=probe_timeout)
+        return state
+
+    def record_success(self, state: BreakerState) -> None:
+        if not state.failures and state.opened_at is None:
+            return
+        _get_cache().delete_many([self.failures_key, self.opened_key, self.probe_key])
+        if state.opened_at is not None:
+            logger.info("Circuit breaker for '%s' closed", self.name)
+
+    def record_failure(self, state: BreakerState) -> None:
+        cache = _get_cache()
+        cache.add(self.failures_key, 0, timeout=FAILURES_TIMEOUT)
+        try:
+            failures = cache.incr(self.failures_key)
+        except ValueError:  # the key expired in the meantime
+            failures = 1
+            cache.set(self.failures_key, failures, timeout=FAILURES_TIMEOUT)
+
+        # make sure the service shows up in the admin, even if the names were evicted
+        _register(self.name, force=True)
+
+        probing = state.opened_at is not None
+        if not probing and failures < settings.INTEGRATION_BREAKER_THRESHOLD:
+            return
+
+        cache.set(self.opened_key, time.time(), timeout=None)
+        cache.delete(self.probe_key)
+        metrics.incr(f"integrations.{self.name}.opened")
+        logger.warning(
+            "Circuit breaker for '%s' opened after %d consecutive failures",
+            self.name,
+            failures,
+        )
+
+    def reset(self) -> None:
+        _get_cache().delete_many([self.failures_key, self.opened_key, self.probe_key])
+
+
+#
+# Rate limiter
+#
+
+# Token bucket, refilled with ``rate`` tokens per second up to ``capacity``. A token is
+# only taken if it is (or becomes) available within ``max_wait`` seconds.
+# Returns the wait time (as string, Lua numbers are truncated to integers) and whether
+# the token was taken.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local max_wait = tonumber(ARGV[4])
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+
+local wait = 0
+if tokens < 1 then
+    wait = (1 - tokens) / rate
+end
+if wait > max_wait then
+    return {tostring(wait), 0}
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens - 1), "updated", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / rate) + 1)
+return {tostring(wait), 1}
+"""
+
+
+def _take_token(
+    tokens: float,
+    updated: float,
+    now: float,
+    rate: float,
+    capacity: float,
+    max_wait: float,
+) -> Tuple[float, bool, float]:
+    """
+    Process-local equivalent of :data:`TOKEN_BUCKET_SCRIPT`.
+
+    :return: the wait time, whether the token was taken and the remaining tokens.
+    """
+    tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+    wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+    if wait > max_wait:
+        return wait, False, tokens
+    return wait, True, tokens - 1
+
+
+class RateLimiter:
+    # process-local buckets, used when Redis is not available
+    _local_buckets: Dict[str, Tuple[float, float]] = {}
+    _local_lock = threading.Lock()
+    _script = None
+
+    def __init__(self, name: str, rate: float):
+        self.name = name
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self.key = f"{KEY_PREFIX}:rate:{name}"
+
+    def _reserve(self, now: float, max_wait: float) -> Tuple[float, bool]:
+        if (
+            connection := get_redis_connection(settings.INTEGRATIONS_CACHE)
+        ) is not None:
+            try:
+                if RateLimiter._script is None:
+                    RateLimiter._script = connection.register_script(
+                        TOKEN_BUCKET_SCRIPT
+                    )
+                wait, taken = RateLimiter._script(
+                    keys=[self.key],
+                    args=[self.rate, self.capacity, now, max_wait],
+                    client=connection,
+                )
+                return float(wait), bool(taken)
+            except Exception:
+                logger.warning(
+                    "Could not reach Redis, rate limiting '%s' per process",
+                    self.name,
+                    exc_info=True,
+                )
+
+        with self._local_lock:
+            tokens, updated = self._local_buckets.get(self.key, (self.capacity, now))
+            wait, taken, tokens = _take_token(
+                tokens, updated, now, self.rate, self.capacity, max_wait
+            )
+            if taken:
+                self._local_buckets[self.key] = (tokens, now)
+        return wait, taken
+
+    def acquire(self) -> None:
+        """
+        Take a token, waiting shortly for one if needed.
+
+        :raises RateLimited: if no token becomes available within
+          ``settings.INTEGRATION_RATE_LIMIT_MAX_WAIT`` seconds.
+        """
+        wait, taken = self._reserve(
+            time.time(), settings.INTEGRATION_RATE_LIMIT_MAX_WAIT
+        )
+        if not taken:
+            metrics.incr(f"integrations.{self.name}.rate_limited")
+            raise RateLimited(self.name, retry_after=wait)
+        if wait > 0:
+            time.sleep(wait)
+
+
+def get_rate_limit(name: str) -> float:
+    return settings.INTEGRATION_RATE_LIMITS.get(name, settings.INTEGRATION_RATE_LIMIT)
+
+
+#
+# Guarding the calls
+#
+
+
+class Call:
+    """
+    Handle to mark a call that returned a response as failed (e.g. HTTP 503).
+    """
+
+    failed = False
+
+
+# names known to be registered, to avoid a cache lookup per call
+_registered = set()
+
+
+def _register(name: str, force: bool = False) -> None:
+    if name in _registered and not force:
+        return
+    cache = _get_cache()
+    names = cache.get(NAMES_KEY) or set()
+    if name not in names:
+        cache.set(NAMES_KEY, names | {name}, timeout=None)
+    _registered.add(name)
+
+
+@contextmanager
+def protect(name: str) -> Iterator[Call]:
+    """
+    Guard a call to the external service ``name``.
+
+    :raises CircuitOpen: if the service is considered down.
+    :raises RateLimited: if too many requests are made to the service.
+    """
+    _register(name)
+    breaker = CircuitBreaker(name)
+    state = breaker.before_call()
+    if rate := get_rate_limit(name):
+        RateLimiter(name, rate).acquire()
+
+    call = Call()
+    start = time.monotonic()
+    try:
+        yield call
+    except Exception as exc:
+        if _is_failure(exc):
+            breaker.record_failure(state)
+        else:
+            # the service responded
+            breaker.record_success(state)
+        raise
+    else:
+        if call.failed:
+            breaker.record_failure(state)
+        else:
+            breaker.record_success(state)
+    finally:
+        metrics.timing(f"integrations.{name}.time", time.monotonic() - start)
+
+
+def get_states() -> List[BreakerState]:
+    """
+    Return the circuit breaker state of all backends that have been called.
+    """
+    names = sorted(_get_cache().get(NAMES_KEY) or set())
+    return [CircuitBreaker(name).get_state() for name in names]
+
+
+#
+# Clients
+#
+
+
+class ResilientSession(requests.Session):
+    """
+    :class:`requests.Session` guarding every request with :func:`protect`.
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        name = service_name(url)
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = get_timeout(name)
+        with protect(name) as call:
+            response = super().request(method, url, *args, **kwargs)
+            call.failed = response.status_code in FAILURE_STATUS_CODES
+        return response
+
+
+# the shared session of this process, re-created in forked processes
+_session: Optional[Tuple[int, ResilientSession]] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> ResilientSession:
+    """
+    Return the session shared by all threads of the current process.
+
+    The connections to a backend are kept alive and reused, up to
+    ``settings.INTEGRATION_POOL_MAXSIZE`` per backend. Cookies are never stored, since
+    the session makes requests on behalf of different users.
+    """
+    global _session
+
+    pid = os.getpid()
+    with _session_lock:
+        if _session is None or _session[0] != pid:
+            session = ResilientSession()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_maxsize=settings.INTEGRATION_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = (pid, session)
+        return _session[1]
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Drop-in replacement of :func:`requests.request`.
+    """
+    return get_session().request(method, url, **kwargs)
+
+
+class ResilientZGWClient(ZGWClient):
+    """
+    ZGW API client sending every request through the shared :func:`get_session`.
+    """
+
+    def request(
+        self,
+        path: str,
+        operation: str,
+        method="GET",
+        expected_status=200,
+        request_kwargs: Optional[dict] = None,
+        **kwargs,
+    ):
+        # same as :meth:`zds_client.Client.request`, which calls :func:`requests.request`
+        # and thus sets up a new connection for every request
+        url = urljoin(self.base_url, path)
+
+        if request_kwargs:
+            kwargs.update(request_kwargs)
+
+        headers = CaseInsensitiveDict(kwargs.pop("headers", {}))
+        headers.setdefault("Accept", "application/json")
+        headers.setdefault("Content-Type", "application/json")
+        schema_headers = get_headers(self.schema, operation)
+        for header, value in schema_headers.items():
+            headers.setdefault(header, value)
+        if self.auth:
+            headers.update(self.auth.credentials())
+
+        kwargs["headers"] = headers
+
+        pre_id = self.pre_request(method, url, **kwargs)
+
+        response = get_session().request(method, url, **kwargs)
+
+        try:
+            response_json = response.json()
+        except Exception:
+            response_json = None
+
+        self.post_response(pre_id, response_json)
+
+        self._log.add(
+            self.service,
+            url,
+            method,
+            dict(headers),
+            copy.deepcopy(kwargs.get("data", kwargs.get("json", None))),
+            response.status_code,
+            dict(response.headers),
+            response_json,
+            params=kwargs.get("params"),
+        )
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            if response.status_code >= 500:
+                raise
+            raise ClientError(response_json) from exc
+
+        assert response.status_code == expected_status, response_json
+        return response_json
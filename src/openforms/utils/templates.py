@@ -0,0 +1,89 @@
+"""
+Cache of compiled templates for admin-managed template sources.
+
+Confirmation pages and e-mails are rendered from template sources stored in the
+database. Parsing these sources is the bulk of the rendering work, so the compiled
+:class:`django.template.Template` objects are kept in a bounded, per-process LRU cache,
+keyed by the hash of their source. Changing a template source changes the key, so
+entries never need to be invalidated - unused entries are simply evicted.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import Context, Template
+
+
+class LRUCache:
+    """
+    A thread-safe mapping that holds at most ``max_size`` items.
+
+    The least recently used item is evicted when the cache is full.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str, default=None) -> Any:
+        with self._lock:
+            try:
+                self._items.move_to_end(key)
+            except KeyError:
+                return default
+            return self._items[key]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_templates: Optional[LRUCache] = None
+
+
+def _get_cache() -> LRUCache:
+    global _templates
+    if _templates is None:
+        _templates = LRUCache(settings.COMPILED_TEMPLATE_CACHE_SIZE)
+    return _templates
+
+
+def get_template_from_string(source: str) -> Template:
+    """
+    Return the compiled template for ``source``, compiling it on a cache miss.
+
+    Compilation errors (:class:`django.template.TemplateSyntaxError`) are not cached.
+    """
+    cache = _get_cache()
+    key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    if (template := cache.get(key)) is None:
+        template = Template(source)
+        cache.set(key, template)
+    return template
+
+
+def render_from_string(source: str, context: Dict[str, Any]) -> str:
+    return get_template_from_string(source).render(Context(context))
+
+
+@receiver(setting_changed)
+def reset_template_cache(sender, setting, **kwargs):
+    # templates are compiled with the default engine
+    global _templates
+    if setting in ("TEMPLATES", "COMPILED_TEMPLATE_CACHE_SIZE"):
+        _templates = None
@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from freezegun import freeze_time
+
+from ..metrics import KEY_PREFIX, _bucket, flush, get_summary, incr, timing
+
+
+@override_settings(METRICS_CACHE="default")
+class MetricsTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        flush()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    def test_counters_are_aggregated(self):
+        with freeze_time("2021-10-20T10:00:00Z"):
+            incr("test.counter")
+        with freeze_time("2021-10-20T10:05:00Z"):
+            incr("test.counter", 2)
+            summary = get_summary(["test.counter"])
+
+        self.assertEqual(summary, {"test.counter": {"count": 3}})
+
+    def test_timings_are_aggregated(self):
+        with freeze_time("2021-10-20T10:00:00Z"):
+            timing("test.timing", 0.1, 0.3)
+            timing("test.timing", 0.2)
+            summary = get_summary(["test.timing"])
+
+        self.assertEqual(summary, {"test.timing": {"count": 3, "avg": 200, "max": 300}})
+
+    def test_old_buckets_are_excluded(self):
+        with freeze_time("2021-10-20T10:00:00Z"):
+            incr("test.counter")
+        with freeze_time("2021-10-20T10:30:00Z"):
+            summary = get_summary(["test.counter"], minutes=10)
+
+        self.assertEqual(summary, {"test.counter": {"count": 0}})
+
+    @override_settings(METRICS_FLUSH_INTERVAL=10)
+    def test_metrics_are_written_per_interval(self):
+        key = f"{KEY_PREFIX}:test.counter:{_bucket()}"
+
+        with patch("openforms.utils.metrics.time.monotonic", return_value=0):
+            flush()
+        with patch("openforms.utils.metrics.time.monotonic", return_value=5):
+            incr("test.counter")
+            incr("test.counter")
+            self.assertIsNone(caches["default"].get(key))
+        with patch("openforms.utils.metrics.time.monotonic", return_value=10):
+            incr("test.counter")
+
+        self.assertEqual(caches["default"].get(key), 3)
@@ -0,0 +1,216 @@
+from http.client import HTTPMessage
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+import requests
+import requests_mock
+from django_webtest import WebTest
+from freezegun import freeze_time
+from requests.cookies import MockRequest, MockResponse
+
+from openforms.accounts.tests.factories import SuperUserFactory
+from openforms.tests.utils import disable_2fa
+
+from ..resilience import (
+    CircuitBreaker,
+    CircuitOpen,
+    RateLimited,
+    RateLimiter,
+    _take_token,
+    get_session,
+    get_states,
+    request,
+    service_name,
+)
+
+URL = "https://zaken.example.com/api/v1/zaken"
+
+
+@override_settings(
+    INTEGRATIONS_CACHE="default",
+    METRICS_CACHE="default",
+    INTEGRATION_TIMEOUT=5,
+    INTEGRATION_TIMEOUTS={"slow.example.com": 30},
+    INTEGRATION_BREAKER_THRESHOLD=3,
+    INTEGRATION_BREAKER_RESET_TIMEOUT=30,
+    INTEGRATION_RATE_LIMIT=0,
+    INTEGRATION_RATE_LIMITS={},
+)
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    @requests_mock.Mocker()
+    def test_timeout_is_applied(self, m):
+        m.get(URL)
+        m.get("https://slow.example.com/api")
+
+        request("GET", URL)
+        request("GET", "https://slow.example.com/api")
+        request("GET", URL, timeout=1)
+
+        self.assertEqual([req.timeout for req in m.request_history], [5, 30, 1])
+
+    @requests_mock.Mocker()
+    def test_breaker_opens_after_consecutive_failures(self, m):
+        m.get(URL, status_code=503)
+
+        with freeze_time("2021-10-25T10:00:00Z"):
+            for _ in range(3):
+                request("GET", URL)
+
+            with self.assertRaises(CircuitOpen) as cm:
+                request("GET", URL)
+
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(cm.exception.retry_after, 30)
+        # handled by the existing error handling of the callers
+        self.assertIsInstance(cm.exception, requests.RequestException)
+
+    @requests_mock.Mocker()
+    def test_client_errors_and_successes_reset_the_failures(self, m):
+        m.get(
+            URL,
+            [
+                {"status_code": 502},
+                {"status_code": 503},
+                {"status_code": 404},
+                {"status_code": 504},
+                {"status_code": 502},
+                {"status_code": 200},
+            ],
+        )
+
+        for _ in range(6):
+            request("GET", URL)
+
+        state = CircuitBreaker(service_name(URL)).get_state()
+        self.assertEqual(state.state, "closed")
+        self.assertEqual(state.failures, 0)
+
+    @requests_mock.Mocker()
+    def test_internal_server_errors_are_not_failures(self, m):
+        # e.g. a SOAP fault for an unknown BSN
+        m.post(URL, status_code=500, text="<soap:Fault/>")
+
+        for _ in range(5):
+            request("POST", URL)
+
+        state = CircuitBreaker(service_name(URL)).get_state()
+        self.assertEqual(state.state, "closed")
+        self.assertEqual(state.failures, 0)
+
+    @requests_mock.Mocker()
+    def test_half_open_lets_one_probe_through(self, m):
+        m.get(URL, exc=requests.ConnectTimeout)
+
+        with freeze_time("2021-10-25T10:00:00Z"):
+            for _ in range(3):
+                with self.assertRaises(requests.ConnectTimeout):
+                    request("GET", URL)
+
+        with freeze_time("2021-10-25T10:00:31Z"):
+            # the probe fails, which opens the breaker again
+            with self.assertRaises(requests.ConnectTimeout):
+                request("GET", URL)
+            with self.assertRaises(CircuitOpen):
+                request("GET", URL)
+
+        m.get(URL, status_code=200)
+        with freeze_time("2021-10-25T10:01:02Z"):
+            request("GET", URL)
+            request("GET", URL)
+
+        self.assertEqual(m.call_count, 6)
+        [state] = get_states()
+        self.assertEqual(state.name, "zaken.example.com")
+        self.assertEqual(state.state, "closed")
+
+    def test_session_is_shared_per_process(self):
+        session = get_session()
+
+        self.assertIs(get_session(), session)
+        # forked worker process
+        with patch("os.getpid", return_value=-1):
+            self.assertIsNot(get_session(), session)
+
+    def test_shared_session_does_not_store_cookies(self):
+        # requests_mock doesn't extract cookies, do what requests does with a response
+        headers = HTTPMessage()
+        headers["Set-Cookie"] = "sessionid=user-a; Path=/"
+        prepared = requests.Request("GET", URL).prepare()
+        session = get_session()
+
+        session.cookies.extract_cookies(MockResponse(headers), MockRequest(prepared))
+
+        self.assertEqual(len(session.cookies), 0)
+
+
+@override_settings(
+    INTEGRATIONS_CACHE="default",
+    METRICS_CACHE="default",
+    INTEGRATION_RATE_LIMIT_MAX_WAIT=0,
+)
+class RateLimiterTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+        patcher = patch.dict(RateLimiter._local_buckets, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_token_bucket(self):
+        # full bucket
+        self.assertEqual(_take_token(2, 0, 0, 2, 2, 0), (0, True, 1))
+        # empty bucket, refilled after half a second
+        self.assertEqual(_take_token(0, 0, 0.5, 2, 2, 0), (0, True, 0))
+        # empty bucket, a token is available after 0.25 seconds
+        self.assertEqual(_take_token(0.5, 0, 0, 2, 2, 1), (0.25, True, -0.5))
+        self.assertEqual(_take_token(0.5, 0, 0, 2, 2, 0.1), (0.25, False, 0.5))
+
+    @freeze_time("2021-10-25T10:00:00Z")
+    def test_requests_over_the_limit_are_rejected(self):
+        limiter = RateLimiter("zaken.example.com", rate=2)
+
+        limiter.acquire()
+        limiter.acquire()
+        with self.assertRaises(RateLimited) as cm:
+            limiter.acquire()
+
+        self.assertEqual(cm.exception.retry_after, 0.5)
+
+
+@disable_2fa
+@override_settings(INTEGRATIONS_CACHE="default", METRICS_CACHE="default")
+class IntegrationStatusAdminViewTests(WebTest):
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    @override_settings(INTEGRATION_BREAKER_THRESHOLD=1)
+    @requests_mock.Mocker()
+    def test_reset_open_breaker(self, m):
+        m.get(URL, status_code=502)
+        request("GET", URL)
+        user = SuperUserFactory.create()
+
+        response = self.app.get(reverse("admin_integration_status"), user=user)
+
+        self.assertContains(response, "zaken.example.com")
+        self.assertContains(response, "open")
+
+        form = next(form for form in response.forms.values() if "reset" in form.fields)
+        form.submit("reset").follow()
+
+        state = CircuitBreaker("zaken.example.com").get_state()
+        self.assertEqual(state.state, "closed")
@@ -0,0 +1,47 @@
+from django.template import TemplateSyntaxError
+from django.test import SimpleTestCase, override_settings
+
+from ..templates import LRUCache, get_template_from_string, render_from_string
+
+
+class LRUCacheTests(SimpleTestCase):
+    def test_least_recently_used_item_is_evicted(self):
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # mark "a" as recently used
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+
+@override_settings(COMPILED_TEMPLATE_CACHE_SIZE=2)
+class CompiledTemplateCacheTests(SimpleTestCase):
+    def test_same_source_is_compiled_once(self):
+        first = get_template_from_string("Hello {{ name }}")
+        second = get_template_from_string("Hello {{ name }}")
+
+        self.assertIs(first, second)
+
+    def test_render_from_string(self):
+        rendered = render_from_string("Hello {{ name }}", {"name": "<b>Jane</b>"})
+
+        self.assertEqual(rendered, "Hello &lt;b&gt;Jane&lt;/b&gt;")
+
+    def test_syntax_errors_are_raised_every_time(self):
+        for _ in range(2):
+            with self.subTest():
+                with self.assertRaises(TemplateSyntaxError):
+                    get_template_from_string("{% if %}")
+
+    def test_cache_is_bounded(self):
+        template = get_template_from_string("one")
+        get_template_from_string("two")
+        get_template_from_string("three")
+
+        self.assertIsNot(get_template_from_string("one"), template)
@@ -2,6 +2,9 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
 
+# maximum number of values that can be validated with a single request
+MAX_BATCH_SIZE = 50
+
 
 class ValidationInputSerializer(serializers.Serializer):
     value = serializers.CharField(
@@ -9,6 +12,32 @@ class ValidationInputSerializer(serializers.Serializer):
     )
 
 
+class BatchValidationItemSerializer(ValidationInputSerializer):
+    validator = serializers.CharField(
+        label=_("validator"),
+        help_text=_("ID of the validation plugin"),
+    )
+
+
+class BatchValidationInputSerializer(serializers.Serializer):
+    values = BatchValidationItemSerializer(
+        many=True,
+        allow_empty=False,
+        label=_("values"),
+        help_text=_("The values to validate, with the validation plugin to use."),
+    )
+
+    def validate_values(self, values):
+        if len(values) > MAX_BATCH_SIZE:
+            raise serializers.ValidationError(
+                _("Ensure this field has no more than {max} elements.").format(
+                    max=MAX_BATCH_SIZE
+                ),
+                code="max_length",
+            )
+        return values
+
+
 class ValidationResultSerializer(serializers.Serializer):
     is_valid = serializers.BooleanField(
         label=_("Is valid"), help_text=_("Boolean indicating value passed validation.")
@@ -33,3 +62,13 @@ class ValidationPluginSerializer(serializers.Serializer):
         label=_("Label"),
         help_text=_("The human-readable name for a plugin."),
     )
+
+
+class BatchValidationResultSerializer(ValidationResultSerializer):
+    validator = serializers.CharField(
+        label=_("validator"),
+        help_text=_("ID of the validation plugin"),
+    )
+    value = serializers.CharField(
+        label=_("value"), help_text=_("Value that was validated")
+    )
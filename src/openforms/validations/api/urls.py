@@ -1,8 +1,9 @@
 from django.urls import path
 
-from .views import ValidationView, ValidatorsListView
+from .views import BatchValidationView, ValidationView, ValidatorsListView
 
 urlpatterns = [
+    path("batch", BatchValidationView.as_view(), name="validate-batch"),
     path("plugins", ValidatorsListView.as_view(), name="validators-list"),
     path(
         "plugins/<slug:validator>",
@@ -1,3 +1,5 @@
+import dataclasses
+
 from django.utils.translation import ugettext_lazy as _
 
 from drf_spectacular.types import OpenApiTypes
@@ -8,6 +10,8 @@ from rest_framework.views import APIView
 
 from openforms.utils.api.views import ListMixin
 from openforms.validations.api.serializers import (
+    BatchValidationInputSerializer,
+    BatchValidationResultSerializer,
     ValidationInputSerializer,
     ValidationPluginSerializer,
     ValidationResultSerializer,
@@ -62,3 +66,35 @@ class ValidationView(APIView):
 
         result = register.validate(self.kwargs["validator"], serializer.data["value"])
         return Response(ValidationResultSerializer(result).data)
+
+
+class BatchValidationView(APIView):
+    """
+    Validate a number of values at once, each using the given validator.
+
+    The results are returned in the order of the values. Validators calling external
+    services are executed concurrently.
+    """
+
+    authentication_classes = ()
+
+    @extend_schema(
+        operation_id="validation_run_batch",
+        summary=_("Validate values using validation plugins"),
+        request=BatchValidationInputSerializer,
+        responses=BatchValidationResultSerializer(many=True),
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = BatchValidationInputSerializer(data=self.request.data)
+        serializer.is_valid(raise_exception=True)
+
+        pairs = [
+            (item["validator"], item["value"])
+            for item in serializer.validated_data["values"]
+        ]
+        results = register.validate_many(pairs)
+        data = [
+            {"validator": validator, "value": value, **dataclasses.asdict(result)}
+            for (validator, value), result in zip(pairs, results)
+        ]
+        return Response(BatchValidationResultSerializer(data, many=True).data)
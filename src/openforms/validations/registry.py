@@ -1,8 +1,10 @@
 import dataclasses
 import logging
-from typing import Callable, Iterable, Iterator, List, Tuple, Type, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Tuple, Type, Union
 
 from django.core.exceptions import ValidationError as DJ_ValidationError
+from django.db import connections
 
 from rest_framework.exceptions import ValidationError as DRF_ValidationError
 from rest_framework.serializers import as_serializer_error
@@ -13,6 +15,9 @@ logger = logging.getLogger(__name__)
 
 ValidatorType = Callable[[str], None]
 
+# maximum number of concurrent calls to remote validators for a single batch
+MAX_WORKERS = 4
+
 
 @dataclasses.dataclass()
 class ValidationResult:
@@ -26,6 +31,8 @@ class RegisteredValidator:
     verbose_name: str
     callable: ValidatorType
     is_demo_plugin: bool = False
+    # the validator calls an external service (e.g. the KvK API)
+    is_remote: bool = False
 
     def __call__(self, value):
         return self.callable(value)
@@ -58,6 +65,7 @@ class Registry(BaseRegistry):
         identifier: str,
         verbose_name: str,
         is_demo_plugin: bool = False,
+        is_remote: bool = False,
         *args,
         **kwargs,
     ) -> Callable:
@@ -79,6 +87,7 @@ class Registry(BaseRegistry):
                 verbose_name=verbose_name,
                 callable=call,
                 is_demo_plugin=is_demo_plugin,
+                is_remote=is_remote,
             )
             return validator
 
@@ -102,6 +111,46 @@ class Registry(BaseRegistry):
         else:
             return ValidationResult(True)
 
+    def _validate_in_thread(self, plugin_id: str, value: str) -> ValidationResult:
+        try:
+            return self.validate(plugin_id, value)
+        finally:
+            # the connections of a worker thread are not closed by the request cycle
+            connections.close_all()
+
+    def validate_many(
+        self, values: Iterable[Tuple[str, str]]
+    ) -> List[ValidationResult]:
+        """
+        Validate a number of (plugin_id, value) pairs at once.
+
+        Identical pairs are validated only once. The remote validators are called
+        concurrently, the other validators are called in the current thread.
+
+        :return: the results, in the order of the given pairs.
+        """
+        values = list(values)
+        unique = list(dict.fromkeys(values))
+        remote = [
+            (plugin_id, value)
+            for plugin_id, value in unique
+            if plugin_id in self._registry and self._registry[plugin_id].is_remote
+        ]
+
+        results: Dict[Tuple[str, str], ValidationResult] = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                pair: executor.submit(self._validate_in_thread, *pair)
+                for pair in remote
+            }
+            for pair in unique:
+                if pair not in futures:
+                    results[pair] = self.validate(*pair)
+            for pair, future in futures.items():
+                results[pair] = future.result()
+
+        return [results[pair] for pair in values]
+
 
 # Sentinel to provide the default registry. You an easily instantiate another
 # :class:`Registry` object to use as dependency injection in tests.
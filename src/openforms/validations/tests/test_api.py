@@ -81,3 +81,52 @@ class ValidationsAPITests(APITestCase):
         }
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, expected)
+
+    def test_batch_validation(self):
+        url = reverse("api:validate-batch")
+
+        response = self.client.post(
+            url,
+            {
+                "values": [
+                    {"validator": "django", "value": "VALID"},
+                    {"validator": "drf", "value": "NOT-VALID"},
+                    {"validator": "django", "value": "VALID"},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "validator": "django",
+                    "value": "VALID",
+                    "isValid": True,
+                    "messages": [],
+                },
+                {
+                    "validator": "drf",
+                    "value": "NOT-VALID",
+                    "isValid": False,
+                    "messages": ["not VALID value"],
+                },
+                {
+                    "validator": "django",
+                    "value": "VALID",
+                    "isValid": True,
+                    "messages": [],
+                },
+            ],
+        )
+
+    @patch("openforms.validations.api.serializers.MAX_BATCH_SIZE", new=2)
+    def test_batch_validation_size_is_limited(self):
+        url = reverse("api:validate-batch")
+        values = [{"validator": "django", "value": "VALID"}] * 3
+
+        response = self.client.post(url, {"values": values}, format="json")
+
+        self.assertEqual(response.status_code, 400)
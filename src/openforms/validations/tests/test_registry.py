@@ -1,3 +1,6 @@
+import threading
+from unittest.mock import MagicMock
+
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.test import TestCase
 
@@ -85,3 +88,39 @@ class RegistryTest(TestCase):
         self.assertEqual(
             res.messages, ["unknown validation plugin_id 'NOT_REGISTERED'"]
         )
+
+    def test_validate_many(self):
+        registry = Registry()
+        registry("django", "Django")(DjangoValidator)
+        remote = MagicMock()
+        registry("remote", "Remote", is_remote=True)(remote)
+
+        results = registry.validate_many(
+            [
+                ("django", "VALID"),
+                ("remote", "123"),
+                ("django", "INVALID"),
+                ("remote", "123"),
+                ("unknown", "VALID"),
+            ]
+        )
+
+        self.assertEqual(
+            [result.is_valid for result in results], [True, True, False, True, False]
+        )
+        self.assertEqual(results[2].messages, ["not VALID value"])
+        # identical values are validated once
+        remote.assert_called_once_with("123")
+
+    def test_validate_many_calls_remote_validators_concurrently(self):
+        registry = Registry()
+        barrier = threading.Barrier(2, timeout=5)
+
+        @registry("remote", "Remote", is_remote=True)
+        def remote_validator(value):
+            # blocks until the other value is validated at the same time
+            barrier.wait()
+
+        results = registry.validate_many([("remote", "1"), ("remote", "2")])
+
+        self.assertTrue(all(result.is_valid for result in results))
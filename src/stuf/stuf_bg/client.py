@@ -5,8 +5,7 @@ from datetime import timedelta
 from django.template import loader
 from django.utils import dateformat, timezone
 
-import requests
-
+from openforms.utils import resilience
 from stuf.constants import EndpointType
 from stuf.models import SoapService
 
@@ -43,7 +42,8 @@ class StufBGClient:
 
     def _make_request(self, data):
 
-        response = requests.post(
+        response = resilience.request(
+            "POST",
             self.service.get_endpoint(type=EndpointType.vrije_berichten),
             data=data,
             headers={"Content-Type": "application/soap+xml"},